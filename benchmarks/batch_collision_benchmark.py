@@ -0,0 +1,31 @@
+# Copyright (c) 2019, Md Imam Hossain (emamhd at gmail dot com)
+# see LICENSE.txt for details
+
+# Compares the batch collision routines against calling the single pair routines once per target,
+# for a bullet circle and a line tested against many wall segments.
+
+import random
+import timeit
+import obosthan
+
+NUM_OF_TARGETS = 5000
+
+random.seed(1)
+walls = [(random.uniform(0, 1024), random.uniform(0, 768), random.uniform(0, 1024), random.uniform(0, 768)) for i in range(NUM_OF_TARGETS)]
+bullets = obosthan.OPointArray2D([(random.uniform(0, 1024), random.uniform(0, 768)) for i in range(NUM_OF_TARGETS)])
+bullet_points = bullets.get_points()
+bullet = obosthan.OPoint2D(512, 384)
+ray = (0, 0, 1024, 768)
+poly = obosthan.OPolygon([(400, 300), (600, 280), (650, 450), (420, 500)])
+
+
+def report(name, single, batch):
+    single_time = min(timeit.repeat(single, number=1, repeat=5))
+    batch_time = min(timeit.repeat(batch, number=1, repeat=5))
+    print(name + ': ' + str(round(single_time * 1000, 2)) + ' ms -> ' + str(round(batch_time * 1000, 2)) + ' ms (' + str(round(single_time / batch_time, 1)) + 'x faster)')
+
+
+report('oline_circle', lambda: [obosthan.oline_circle(wall, bullet, 8) for wall in walls], lambda: obosthan.oline_circle_many(walls, bullet, 8))
+report('ocircle2', lambda: [obosthan.ocircle2(bullet, 8, point, 8) for point in bullet_points], lambda: obosthan.ocircle2_many(bullet, 8, bullets, 8))
+report('oline2', lambda: [obosthan.oline2(ray, wall) for wall in walls], lambda: obosthan.oline2_many(ray, walls))
+report('opoly_line', lambda: [obosthan.opoly_line(poly, wall) for wall in walls], lambda: obosthan.opoly_line_many(poly, walls))
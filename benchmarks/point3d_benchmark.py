@@ -0,0 +1,66 @@
+# Copyright (c) 2023, Md Imam Hossain (emamhd at gmail dot com)
+# see LICENSE.txt for details
+
+# Compares construction time of OPoint3D and OVector3D and the cost of vector arithmetic
+# temporaries against the previous layout which computed every property on construction.
+
+import timeit
+from math import degrees, atan
+import obosthan
+
+NUM_OF_OBJECTS = 100000
+
+
+def plane_angle(a, b):
+    # previous per plane angle of OPoint3D and OVector3D, positive coordinates only
+    return degrees(atan(b / a))
+
+
+class EagerPoint3D:
+    # previous OPoint3D layout: distance, xy axes and the three plane headings on construction
+
+    def __init__(self, _x, _y, _z):
+        self.__coord = [_x, _y, _z]
+        self.__distance = ((self.__coord[0]**2)+(self.__coord[1]**2)+(self.__coord[2]**2))**0.5
+        self.__xy_axes = [(self.__distance, 0), (self.__distance, 0)]
+        self.__heading = [plane_angle(_x, _y), plane_angle(_y, _z), plane_angle(_x, _z)]
+
+
+class EagerVector3D:
+    # previous OVector3D layout: length, x axis, unit and the three plane angles on construction
+
+    def __init__(self, _x, _y, _z):
+        self.__coord = [_x, _y, _z]
+        self.__length = ((self.__coord[0]**2)+(self.__coord[1]**2)+(self.__coord[2]**2))**2
+        self.__x_axis = [self.__length, 0]
+        self.__unit = [self.__coord[0] / self.__length, self.__coord[1] / self.__length, self.__coord[2] / self.__length]
+        self.__angle = [plane_angle(_x, _y), plane_angle(_y, _z), plane_angle(_x, _z)]
+
+    def __getitem__(self, i):
+        return self.__coord[i]
+
+    def __add__(self, other):
+        return EagerVector3D(self.__coord[0]+other[0], self.__coord[1]+other[1], self.__coord[2]+other[2])
+
+
+def construction_time(cls):
+    return min(timeit.repeat(lambda: cls(3.5, 4.5, 5.5), number=NUM_OF_OBJECTS, repeat=5)) / NUM_OF_OBJECTS * 1e9
+
+
+def summing_time(cls):
+    vectors = [cls(i + 1.5, i + 2.5, i + 3.5) for i in range(1000)]
+
+    def run():
+        total = cls(1.0, 1.0, 1.0)
+        for vector in vectors:
+            total = total + vector
+
+    return min(timeit.repeat(run, number=100, repeat=5)) / (100 * len(vectors)) * 1e9
+
+
+for old_cls, new_cls in ((EagerPoint3D, obosthan.OPoint3D), (EagerVector3D, obosthan.OVector3D)):
+    print(new_cls.__name__)
+    print('  construction time: ' + str(round(construction_time(old_cls))) + ' ns -> ' + str(round(construction_time(new_cls))) + ' ns')
+
+print('OVector3D')
+print('  addition with temporaries: ' + str(round(summing_time(EagerVector3D))) + ' ns -> ' + str(round(summing_time(obosthan.OVector3D))) + ' ns per add')
@@ -0,0 +1,57 @@
+# Copyright (c) 2019, Md Imam Hossain (emamhd at gmail dot com)
+# see LICENSE.txt for details
+
+# Compares memory per instance and construction time of OPoint2D and OVector2D
+# against the previous dictionary and list based layout of the same classes.
+
+import sys
+import timeit
+import tracemalloc
+from math import degrees, atan
+import obosthan
+
+NUM_OF_OBJECTS = 100000
+
+
+class ListPoint2D:
+    # previous OPoint2D layout: instance dictionary, coordinate list, x axis list and eager properties
+
+    def __init__(self, _x, _y):
+        self.__coord = [_x, _y]
+        self.__distance = ((self.__coord[0]**2)+(self.__coord[1]**2))**0.5
+        self.__x_axis = [self.__distance, 0]
+        self.__heading = degrees(atan(self.__coord[1] / self.__coord[0]))
+
+
+class ListVector2D:
+    # previous OVector2D layout: instance dictionary, coordinate list, x axis list, unit list and eager properties
+
+    def __init__(self, _x, _y):
+        self.__coord = [_x, _y]
+        self.__length = ((self.__coord[0]**2)+(self.__coord[1]**2))**0.5
+        self.__x_axis = [self.__length, 0]
+        self.__unit = [self.__coord[0] / self.__length, self.__coord[1] / self.__length]
+        self.__angle = degrees(atan(self.__coord[1] / self.__coord[0]))
+
+
+def bytes_per_object(cls):
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    objects = [cls(i + 1.5, i + 2.5) for i in range(NUM_OF_OBJECTS)]
+    end = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # the container list and the two coordinate floats are common to both layouts
+    common = sys.getsizeof(objects) + (2 * sys.getsizeof(1.5) * NUM_OF_OBJECTS)
+    return (end - start - common) / NUM_OF_OBJECTS
+
+
+def construction_time(cls):
+    return min(timeit.repeat(lambda: cls(3.5, 4.5), number=NUM_OF_OBJECTS, repeat=5)) / NUM_OF_OBJECTS * 1e9
+
+
+for old_cls, new_cls in ((ListPoint2D, obosthan.OPoint2D), (ListVector2D, obosthan.OVector2D)):
+    old_bytes = bytes_per_object(old_cls)
+    new_bytes = bytes_per_object(new_cls)
+    print(new_cls.__name__)
+    print('  memory per instance: ' + str(round(old_bytes)) + ' bytes -> ' + str(round(new_bytes)) + ' bytes (' + str(round(old_bytes / new_bytes, 1)) + 'x smaller)')
+    print('  construction time: ' + str(round(construction_time(old_cls))) + ' ns -> ' + str(round(construction_time(new_cls))) + ' ns')
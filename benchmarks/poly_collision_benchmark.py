@@ -0,0 +1,53 @@
+# Copyright (c) 2019, Md Imam Hossain (emamhd at gmail dot com)
+# see LICENSE.txt for details
+
+# Compares opoly2 against the previous SAT implementation which built an OPoint2D normal
+# per side and an OVector2D per vertex and axis, for overlapping and separated regular polygons.
+
+import timeit
+from math import sin, cos, radians
+import obosthan
+
+NUM_OF_TESTS = 2000
+
+
+def previous_opoly2(poly1, poly2):
+    col = 1
+    p1s = len(poly1)
+    p2s = len(poly2)
+
+    for polya, polyas in ((poly1, p1s), (poly2, p2s)):
+        for i in range(polyas):
+            norm = obosthan.OPoint2D(0, 0)
+            sm1 = []
+            sm2 = []
+            if i == (polyas - 1):
+                norm[0] = -1 * (polya.coord_tuples[0][1] - polya.coord_tuples[i][1])
+                norm[1] = polya.coord_tuples[0][0] - polya.coord_tuples[i][0]
+            else:
+                norm[0] = -1 * (polya.coord_tuples[i + 1][1] - polya.coord_tuples[i][1])
+                norm[1] = polya.coord_tuples[i + 1][0] - polya.coord_tuples[i][0]
+            for ii in range(p1s):
+                sm1.append(obosthan.OVector2D(poly1.coord_tuples[ii][0], poly1.coord_tuples[ii][1]).dot(norm) / norm.distance)
+            for ii in range(p2s):
+                sm2.append(obosthan.OVector2D(poly2.coord_tuples[ii][0], poly2.coord_tuples[ii][1]).dot(norm) / norm.distance)
+            if (max(sm1) < min(sm2)) or (min(sm1) > max(sm2)):
+                return 0
+
+    return col
+
+
+def regular_polygon(sides, x, y, radius):
+    return obosthan.OPolygon([(x + (radius * cos(radians(i * 360 / sides))), y + (radius * sin(radians(i * 360 / sides)))) for i in range(sides)])
+
+
+for sides in (4, 16, 64):
+    poly1 = regular_polygon(sides, 0, 0, 10)
+    overlapping = regular_polygon(sides, 15, 5, 10)
+    # bounding boxes overlap but the polygons do not, so the separating axis has to be found
+    separated = regular_polygon(sides, 15.5, 15.5, 10)
+    for name, poly2 in (('overlapping', overlapping), ('separated', separated)):
+        assert obosthan.opoly2(poly1, poly2) == previous_opoly2(poly1, poly2)
+        previous_time = min(timeit.repeat(lambda: previous_opoly2(poly1, poly2), number=NUM_OF_TESTS // sides, repeat=3)) / (NUM_OF_TESTS // sides)
+        new_time = min(timeit.repeat(lambda: obosthan.opoly2(poly1, poly2), number=NUM_OF_TESTS, repeat=3)) / NUM_OF_TESTS
+        print(str(sides) + '-gon pair, ' + name + ': ' + str(round(previous_time * 1e6, 1)) + ' us -> ' + str(round(new_time * 1e6, 2)) + ' us (' + str(round(previous_time / new_time)) + 'x)')
@@ -0,0 +1,30 @@
+# Copyright (c) 2019, Md Imam Hossain (emamhd at gmail dot com)
+# see LICENSE.txt for details
+
+# Compares proximity checks which take a square root against the squared distance checks
+# of OPoint2D, OPoint3D, OLine2D and the circle collision routines.
+
+import timeit
+import obosthan
+
+NUM_OF_CHECKS = 10000000
+
+point2d = obosthan.OPoint2D(3.5, 4.5)
+other2d = obosthan.OPoint2D(12.5, 7.5)
+point3d = obosthan.OPoint3D(3.5, 4.5, 1.5)
+other3d = obosthan.OPoint3D(12.5, 7.5, 2.5)
+line = obosthan.OLine2D(0, 0, 20, 10)
+circle_line = (0, 0, 20, 10)
+
+
+def report(name, current, squared):
+    current_time = timeit.timeit(current, number=NUM_OF_CHECKS)
+    squared_time = timeit.timeit(squared, number=NUM_OF_CHECKS)
+    print(name + ': ' + str(round(current_time / NUM_OF_CHECKS * 1e9)) + ' ns -> ' + str(round(squared_time / NUM_OF_CHECKS * 1e9)) + ' ns per check')
+
+
+report('OPoint2D', lambda: (point2d.distance_to(other2d)**0.5) <= 10, lambda: point2d.within_radius(other2d, 10))
+report('OPoint3D', lambda: point3d.distance_to(other3d) <= 10, lambda: point3d.within_radius(other3d, 10))
+report('OLine2D', lambda: line.distance_to_point(other2d) <= 10, lambda: line.within_radius(other2d, 10))
+report('ocircle2', lambda: (point2d.distance_to(other2d)**0.5) <= 10, lambda: obosthan.ocircle2(point2d, 5, other2d, 5))
+report('oline_circle', lambda: line.distance_to_point(other2d) < 10, lambda: obosthan.oline_circle(circle_line, other2d, 10))
@@ -0,0 +1,41 @@
+# Copyright (c) 2023, Md Imam Hossain (emamhd at gmail dot com)
+# see LICENSE.txt for details
+
+# Casts a grid of camera rays at a height field surface, once per ray against every face with oray_surface
+# and in one batch through an OBVH3D, and reports the time to build the hierarchy and rays cast per second.
+
+import timeit
+from math import sin, cos
+import obosthan
+
+NUM_OF_CELLS = 224
+NUM_OF_RAYS = 1000
+NUM_OF_SINGLE_RAYS = 200
+
+points = []
+for i in range(NUM_OF_CELLS + 1):
+    for j in range(NUM_OF_CELLS + 1):
+        x = (2 * i / NUM_OF_CELLS) - 1
+        y = (2 * j / NUM_OF_CELLS) - 1
+        points.append((x, y, 0.2 * sin(4 * x) * cos(3 * y)))
+
+faces = []
+for i in range(NUM_OF_CELLS):
+    for j in range(NUM_OF_CELLS):
+        a = (i * (NUM_OF_CELLS + 1)) + j
+        faces.append((a, a + NUM_OF_CELLS + 1, a + NUM_OF_CELLS + 2, a + 1))
+
+surface = obosthan.OSurface(points, faces)
+camera = (0, 0, 3)
+directions = [((1.1 * ((2 * i / (NUM_OF_RAYS - 1)) - 1)) * 0.5, (1.1 * ((2 * j / (NUM_OF_RAYS - 1)) - 1)) * 0.5, -1)
+              for i in range(NUM_OF_RAYS) for j in range(NUM_OF_RAYS)]
+single_directions = directions[::len(directions) // NUM_OF_SINGLE_RAYS][0:NUM_OF_SINGLE_RAYS]
+
+build_time = min(timeit.repeat(lambda: obosthan.OBVH3D(surface), number=1, repeat=3))
+bvh = obosthan.OBVH3D(surface)
+single_time = min(timeit.repeat(lambda: [obosthan.oray_surface(surface, camera, direction) for direction in single_directions], number=1, repeat=3))
+batch_time = min(timeit.repeat(lambda: bvh.ray_cast_many(camera, directions), number=1, repeat=3))
+
+print(str(surface.num_of_faces) + ' triangles, ' + str(bvh.num_of_nodes) + ' nodes built in ' + str(round(build_time * 1000)) + ' ms')
+print('oray_surface per ray: ' + str(round(NUM_OF_SINGLE_RAYS / single_time)) + ' rays/s')
+print('OBVH3D.ray_cast_many: ' + str(round(len(directions) / batch_time)) + ' rays/s')
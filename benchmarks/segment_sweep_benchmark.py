@@ -0,0 +1,47 @@
+# Copyright (c) 2019, Md Imam Hossain (emamhd at gmail dot com)
+# see LICENSE.txt for details
+
+# Compares finding every intersection among many short lines with oline2_sweep against testing
+# every pair with oline2, the pairwise test is timed on a smaller set and scaled as it grows with N squared.
+
+import random
+import time
+import obosthan
+
+NUM_OF_LINES = 100000
+NUM_OF_PAIRWISE_LINES = 2000
+
+random.seed(1)
+
+
+def short_lines(count):
+    # lines of a map overlay, scattered over an area which grows with the number of lines
+    size = (count**0.5) * 10
+    lines = []
+    for i in range(count):
+        x = random.uniform(0, size)
+        y = random.uniform(0, size)
+        lines.append((x, y, x + random.uniform(-15, 15), y + random.uniform(-15, 15)))
+    return lines
+
+
+lines = short_lines(NUM_OF_PAIRWISE_LINES)
+start = time.perf_counter()
+count = 0
+for i in range(len(lines)):
+    for j in range(i + 1, len(lines)):
+        r = obosthan.oline2(lines[i], lines[j])
+        if r is not None and r is not False:
+            count = count + 1
+pairwise_time = time.perf_counter() - start
+print('oline2 on every pair: ' + str(NUM_OF_PAIRWISE_LINES) + ' lines ' + str(count) + ' intersections ' + str(round(pairwise_time, 2)) + ' s, ' +
+      str(round(pairwise_time * ((NUM_OF_LINES / NUM_OF_PAIRWISE_LINES)**2) / 60)) + ' minutes estimated for ' + str(NUM_OF_LINES) + ' lines')
+
+start = time.perf_counter()
+count = len(list(obosthan.oline2_sweep(lines)))
+print('oline2_sweep: ' + str(NUM_OF_PAIRWISE_LINES) + ' lines ' + str(count) + ' intersections ' + str(round(time.perf_counter() - start, 2)) + ' s')
+
+lines = short_lines(NUM_OF_LINES)
+start = time.perf_counter()
+count = len(list(obosthan.oline2_sweep(lines)))
+print('oline2_sweep: ' + str(NUM_OF_LINES) + ' lines ' + str(count) + ' intersections ' + str(round(time.perf_counter() - start, 2)) + ' s')
@@ -0,0 +1,67 @@
+# Copyright (c) 2023, Md Imam Hossain (emamhd at gmail dot com)
+# see LICENSE.txt for details
+
+# Compares OSurface.rotate_centroid on a 100k vertex surface against the previous layout which kept
+# one OPoint3D per vertex and rotated about each axis in a separate pass.
+
+import random
+import timeit
+from math import cos, sin, radians
+import obosthan
+import obosthan.surface
+
+NUM_OF_POINTS = 100000
+NUM_OF_ROTATIONS = 5
+
+
+class ListSurface:
+    # previous OSurface layout: a list of OPoint3D objects, one pass per axis and trigonometry per vertex
+
+    def __init__(self, points):
+        self.coord_list = [obosthan.OPoint3D(point[0], point[1], point[2]) for point in points]
+
+    def rotate_centroid(self, angle_x, angle_y, angle_z):
+        num_of_points = len(self.coord_list)
+        centroid = [sum(point[axis] for point in self.coord_list) / num_of_points for axis in range(3)]
+        for point in self.coord_list:
+            point[0] = point[0] - centroid[0]
+            point[1] = point[1] - centroid[1]
+            point[2] = point[2] - centroid[2]
+        for point in self.coord_list:
+            old_y = point[1]
+            old_z = point[2]
+            point[1] = (cos(radians(angle_x)) * old_y) - (sin(radians(angle_x)) * old_z)
+            point[2] = (sin(radians(angle_x)) * old_y) + (cos(radians(angle_x)) * old_z)
+        for point in self.coord_list:
+            old_x = point[0]
+            old_z = point[2]
+            point[0] = (cos(radians(angle_y)) * old_x) + (sin(radians(angle_y)) * old_z)
+            point[2] = -(sin(radians(angle_y)) * old_x) + (cos(radians(angle_y)) * old_z)
+        for point in self.coord_list:
+            old_x = point[0]
+            old_y = point[1]
+            point[0] = (cos(radians(angle_z)) * old_x) - (sin(radians(angle_z)) * old_y)
+            point[1] = (sin(radians(angle_z)) * old_x) + (cos(radians(angle_z)) * old_y)
+        for point in self.coord_list:
+            point[0] = point[0] + centroid[0]
+            point[1] = point[1] + centroid[1]
+            point[2] = point[2] + centroid[2]
+
+
+def rotation_time(surface):
+    return min(timeit.repeat(lambda: surface.rotate_centroid(10, 20, 30), number=1, repeat=NUM_OF_ROTATIONS)) * 1e3
+
+
+random.seed(1)
+points = [(random.uniform(-100, 100), random.uniform(-100, 100), random.uniform(-100, 100)) for i in range(NUM_OF_POINTS)]
+
+print('rotate_centroid on ' + str(NUM_OF_POINTS) + ' vertices')
+print('  previous OPoint3D list: ' + str(round(rotation_time(ListSurface(points)), 2)) + ' ms')
+
+numpy = obosthan.surface.numpy
+obosthan.surface.numpy = None
+print('  OSurface with array buffer: ' + str(round(rotation_time(obosthan.OSurface(points)), 2)) + ' ms')
+obosthan.surface.numpy = numpy
+
+if numpy is not None:
+    print('  OSurface with NumPy buffer: ' + str(round(rotation_time(obosthan.OSurface(points)), 2)) + ' ms')
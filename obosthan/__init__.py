@@ -1,10 +1,18 @@
 from .point2d import OPoint2D
+from .pointarray2d import OPointArray2D
 from .vector2d import OVector2D
+from .affine2d import OAffine2D
 from .line2d import OLine2D
 from .polygon import OPolygon
+from .preparedpolygon import OPreparedPolygon
+from .hull2d import oconvex_hull
+from .hull2d import OConvexHull2D
 from .point3d import OPoint3D
 from .vector3d import OVector3D
 from .surface import OSurface
+from .quaternion import OQuaternion
+from .matrix3d import OMatrix3D
+from .matrix3d import OMatrix4D
 from .collision2d import ocircle2
 from .collision2d import oline2
 from .collision2d import oline_circle
@@ -12,3 +20,25 @@ from .collision2d import obox2
 from .collision2d import obox_circle
 from .collision2d import opoly2
 from .collision2d import opoly_line
+from .collision2d import ocircle2_many
+from .collision2d import oline2_many
+from .collision2d import oline_circle_many
+from .collision2d import opoly_line_many
+from .collision2d import oline2_sweep
+from .collision2d import ogjk2
+from .collision2d import oepa2
+from .collision2d import oray_poly
+from .collision2d import oray_cast
+from .collision2d import otoi_circle2
+from .collision2d import otoi_line_circle
+from .collision2d import otoi_poly2
+from .broadphase2d import obody_bounds
+from .broadphase2d import osegment_box
+from .broadphase2d import OSpatialHash2D
+from .broadphase2d import OAABBTree2D
+from .broadphase2d import OSweepPrune2D
+from .collision3d import osphere3
+from .collision3d import obox3
+from .collision3d import obox_sphere3
+from .collision3d import oray_surface
+from .collision3d import OBVH3D
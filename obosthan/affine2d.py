@@ -0,0 +1,200 @@
+# Copyright (c) 2018-2019, Md Imam Hossain (emamhd at gmail dot com)
+# see LICENSE.txt for details
+
+
+"""
+2D affine transformation object
+"""
+
+from math import sin, cos, radians
+from .point2d import OPoint2D
+
+class OAffine2D:
+    """
+    An affine transformation object which stores a homogeneous 3x3 matrix whose last row is always (0, 0, 1), so only
+    the top two rows (a, b, c, d, e, f) are kept where x' = ax + by + c and y' = dx + ey + f.
+    Transformations such as translate, rotate, scale and shear are composed onto the matrix so that they are applied after
+    the ones already composed. Instance variables such as determinant and inverse are calculated on first access and cached
+    until the matrix changes.
+    """
+
+    def __init__(self, matrix=(1, 0, 0, 0, 1, 0)):
+        self.__matrix = (1, 0, 0, 0, 1, 0)
+        self.__inverse = None
+        self.define_matrix(matrix)
+
+    @property
+    def matrix(self):
+        return self.__matrix
+
+    @property
+    def determinant(self):
+        return (self.__matrix[0] * self.__matrix[4]) - (self.__matrix[1] * self.__matrix[3])
+
+    @property
+    def inverse(self):
+        """
+        Returns the inverse transformation as a new object or None when the matrix is singular, only the inverse matrix is cached
+        so changing the returned object does not change the cache
+        """
+
+        if self.__inverse is None:
+            det = self.determinant
+            if det == 0:
+                return None
+            a, b, c, d, e, f = self.__matrix
+            inv_a = e / det
+            inv_b = -b / det
+            inv_d = -d / det
+            inv_e = a / det
+            self.__inverse = (inv_a, inv_b, -((inv_a * c) + (inv_b * f)), inv_d, inv_e, -((inv_d * c) + (inv_e * f)))
+
+        return OAffine2D(self.__inverse)
+
+    def is_identity(self):
+        return self.__matrix == (1, 0, 0, 0, 1, 0)
+
+    def define_matrix(self, matrix):
+        """
+        Alters the transformation to a 2x2 matrix (a, b, d, e), the top two rows of a 3x3 matrix (a, b, c, d, e, f) or a full 3x3 matrix
+        """
+
+        if type(matrix) is tuple or type(matrix) is list or type(matrix) is OAffine2D:
+
+            if len(matrix) == 4:
+                self.__matrix = (matrix[0], matrix[1], 0, matrix[2], matrix[3], 0)
+            elif len(matrix) == 6 or len(matrix) == 9:
+                self.__matrix = (matrix[0], matrix[1], matrix[2], matrix[3], matrix[4], matrix[5])
+            else:
+                return
+
+            self.__inverse = None
+
+    def reset(self):
+        """
+        Alters the transformation to identity
+        """
+
+        self.__matrix = (1, 0, 0, 0, 1, 0)
+        self.__inverse = None
+
+    def copy(self):
+        """
+        Returns a copy of the transformation object
+        """
+
+        return OAffine2D(self.__matrix)
+
+    def transform(self, matrix):
+        """
+        Composes a matrix transformation given in any form accepted by define_matrix after the current transformation
+        """
+
+        if type(matrix) is OAffine2D:
+            other = matrix.matrix
+        elif (type(matrix) is tuple or type(matrix) is list) and len(matrix) == 4:
+            other = (matrix[0], matrix[1], 0, matrix[2], matrix[3], 0)
+        elif (type(matrix) is tuple or type(matrix) is list) and (len(matrix) == 6 or len(matrix) == 9):
+            other = matrix
+        else:
+            return
+
+        a, b, c, d, e, f = self.__matrix
+        self.__matrix = ((other[0] * a) + (other[1] * d), (other[0] * b) + (other[1] * e), (other[0] * c) + (other[1] * f) + other[2],
+                         (other[3] * a) + (other[4] * d), (other[3] * b) + (other[4] * e), (other[3] * c) + (other[4] * f) + other[5])
+        self.__inverse = None
+
+    def transform_point(self, matrix, point):
+        """
+        Composes a 2x2 matrix transformation (a, b, d, e) about a defined point after the current transformation
+        """
+
+        if (type(matrix) is tuple or type(matrix) is list) and (type(point) is tuple or type(point) is list or type(point) is OPoint2D):
+
+            if len(matrix) == 4 and len(point) == 2:
+
+                a, b, d, e = matrix
+                self.transform((a, b, point[0] - (a * point[0]) - (b * point[1]), d, e, point[1] - (d * point[0]) - (e * point[1])))
+
+    def translate(self, x, y):
+        """
+        Composes a translation along X and Y axes after the current transformation
+        """
+
+        self.transform((1, 0, x, 0, 1, y))
+
+    def rotate(self, angle):
+        """
+        Composes a rotation by degrees (anticlockwise) about origin after the current transformation
+        """
+
+        cos_angle = cos(radians(angle))
+        sin_angle = sin(radians(angle))
+        self.transform((cos_angle, -sin_angle, 0, sin_angle, cos_angle, 0))
+
+    def rotate_point(self, angle, point):
+        """
+        Composes a rotation by degrees (anticlockwise) about a defined point after the current transformation
+        """
+
+        cos_angle = cos(radians(angle))
+        sin_angle = sin(radians(angle))
+        self.transform_point((cos_angle, -sin_angle, sin_angle, cos_angle), point)
+
+    def scale(self, x, y):
+        """
+        Composes a scale about origin after the current transformation
+        """
+
+        self.transform((x, 0, 0, 0, y, 0))
+
+    def scale_point(self, x, y, point):
+        """
+        Composes a scale about a defined point after the current transformation
+        """
+
+        self.transform_point((x, 0, 0, y), point)
+
+    def shear(self, x, y):
+        """
+        Composes a shear about origin after the current transformation
+        """
+
+        self.transform((1, x, 0, y, 1, 0))
+
+    def shear_point(self, x, y, point):
+        """
+        Composes a shear about a defined point after the current transformation
+        """
+
+        self.transform_point((1, x, y, 1), point)
+
+    def apply(self, point):
+        """
+        Returns a new point which is the transformed copy of a point
+        """
+
+        a, b, c, d, e, f = self.__matrix
+        return OPoint2D((a * point[0]) + (b * point[1]) + c, (d * point[0]) + (e * point[1]) + f)
+
+    def __iter__(self):
+        return iter(self.__matrix)
+
+    def __getitem__(self, i):
+        return self.__matrix[i]
+
+    def __len__(self):
+        return 6
+
+    def __repr__(self):
+        return str([list(self.__matrix[0:3]), list(self.__matrix[3:6]), [0, 0, 1]])
+
+    def __mul__(self, other):
+        if type(other) is OAffine2D:
+            new_affine = other.copy()
+            new_affine.transform(self)
+            return new_affine
+        elif type(other) is OPoint2D or ((type(other) is list or type(other) is tuple) and len(other) == 2):
+            return self.apply(other)
+        else:
+            return self
@@ -0,0 +1,808 @@
+# Copyright (c) 2018-2019, Md Imam Hossain (emamhd at gmail dot com)
+# see LICENSE.txt for details
+
+
+"""
+2D broad phase collision routines
+"""
+
+from math import floor
+from .line2d import OLine2D
+from .polygon import OPolygon
+
+
+def obody_bounds(body, radius=None):
+    """
+    Returns axis aligned bounding box of a polygon, a line or a circle defined by its centre and radius as a tuple (x min, y min, x max, y max)
+    """
+
+    if type(body) is OPolygon:
+        return body.aabb
+    elif type(body) is OLine2D:
+        return (min(body[0], body[2]), min(body[1], body[3]), max(body[0], body[2]), max(body[1], body[3]))
+    elif radius is not None:
+        return (body[0] - radius, body[1] - radius, body[0] + radius, body[1] + radius)
+    else:
+        return (body[0], body[1], body[0], body[1])
+
+
+class OSpatialHash2D:
+    """
+    A uniform grid which hashes bodies such as polygons, lines and circles into square cells by their bounding boxes so that
+    only bodies sharing a cell are reported as candidate pairs for the narrow phase collision routines.
+    A circle is inserted as its centre point together with its radius. The cell size should be about the size of a typical body.
+    """
+
+    def __init__(self, cell_size):
+        self.__cell_size = cell_size
+        self.__cells = {}
+        self.__bodies = {}
+
+    @property
+    def cell_size(self):
+        return self.__cell_size
+
+    def __cell_range(self, bounds):
+        return (floor(bounds[0] / self.__cell_size), floor(bounds[1] / self.__cell_size), floor(bounds[2] / self.__cell_size), floor(bounds[3] / self.__cell_size))
+
+    def __add_to_cells(self, key, cell_range):
+        for i in range(cell_range[0], cell_range[2] + 1):
+            for j in range(cell_range[1], cell_range[3] + 1):
+                cell = self.__cells.get((i, j))
+                if cell is None:
+                    self.__cells[(i, j)] = [key]
+                else:
+                    cell.append(key)
+
+    def __remove_from_cells(self, key, cell_range):
+        for i in range(cell_range[0], cell_range[2] + 1):
+            for j in range(cell_range[1], cell_range[3] + 1):
+                cell = self.__cells[(i, j)]
+                cell.remove(key)
+                if len(cell) == 0:
+                    del self.__cells[(i, j)]
+
+    def insert(self, body, radius=None):
+        """
+        Inserts a polygon, a line or a circle centre with its radius into the grid
+        """
+
+        key = id(body)
+
+        if key not in self.__bodies:
+            bounds = obody_bounds(body, radius)
+            if bounds is not None:
+                cell_range = self.__cell_range(bounds)
+                self.__bodies[key] = [body, radius, bounds, cell_range]
+                self.__add_to_cells(key, cell_range)
+
+    def move(self, body, radius=None):
+        """
+        Updates the grid after a body has moved or changed its shape, a circle may also be given a new radius
+        """
+
+        record = self.__bodies.get(id(body))
+
+        if record is not None:
+            if radius is not None:
+                record[1] = radius
+            bounds = obody_bounds(body, record[1])
+            if bounds is None:
+                self.remove(body)
+                return
+            cell_range = self.__cell_range(bounds)
+            record[2] = bounds
+            if cell_range != record[3]:
+                self.__remove_from_cells(id(body), record[3])
+                self.__add_to_cells(id(body), cell_range)
+                record[3] = cell_range
+
+    def remove(self, body):
+        """
+        Removes a body from the grid
+        """
+
+        record = self.__bodies.pop(id(body), None)
+
+        if record is not None:
+            self.__remove_from_cells(id(body), record[3])
+
+    def get_radius(self, body):
+        """
+        Returns the radius a circle was inserted with or None for other bodies
+        """
+
+        record = self.__bodies.get(id(body))
+
+        if record is not None:
+            return record[1]
+        else:
+            return None
+
+    def query(self, bounds):
+        """
+        Returns a list of bodies whose bounding boxes overlap a region defined as (x min, y min, x max, y max)
+        """
+
+        found = {}
+        cell_range = self.__cell_range(bounds)
+
+        for i in range(cell_range[0], cell_range[2] + 1):
+            for j in range(cell_range[1], cell_range[3] + 1):
+                cell = self.__cells.get((i, j))
+                if cell is not None:
+                    for key in cell:
+                        if key not in found:
+                            body_bounds = self.__bodies[key][2]
+                            if body_bounds[2] >= bounds[0] and body_bounds[0] <= bounds[2] and body_bounds[3] >= bounds[1] and body_bounds[1] <= bounds[3]:
+                                found[key] = self.__bodies[key][0]
+
+        return list(found.values())
+
+    def candidate_pairs(self):
+        """
+        Generates pairs of bodies whose bounding boxes overlap, every pair is generated once
+        """
+
+        bodies = self.__bodies
+
+        for cell_key, cell in self.__cells.items():
+
+            cell_size = len(cell)
+
+            for n in range(cell_size - 1):
+
+                record1 = bodies[cell[n]]
+                bounds1 = record1[2]
+                range1 = record1[3]
+
+                for m in range(n + 1, cell_size):
+
+                    record2 = bodies[cell[m]]
+                    bounds2 = record2[2]
+                    range2 = record2[3]
+
+                    # a pair sharing several cells is only reported from the first cell of their common cell range
+                    if cell_key[0] != max(range1[0], range2[0]) or cell_key[1] != max(range1[1], range2[1]):
+                        continue
+
+                    if bounds1[2] >= bounds2[0] and bounds1[0] <= bounds2[2] and bounds1[3] >= bounds2[1] and bounds1[1] <= bounds2[3]:
+                        yield (record1[0], record2[0])
+
+    def clear(self):
+        """
+        Removes all the bodies from the grid
+        """
+
+        self.__cells.clear()
+        self.__bodies.clear()
+
+    def __contains__(self, body):
+        return id(body) in self.__bodies
+
+    def __iter__(self):
+        return iter([record[0] for record in self.__bodies.values()])
+
+    def __len__(self):
+        return len(self.__bodies)
+
+
+class _OTreeNode2D:
+    # node of OAABBTree2D, leaves hold a body and both its tight and fattened bounding boxes
+
+    __slots__ = ('bounds', 'tight_bounds', 'parent', 'child1', 'child2', 'height', 'body', 'radius', 'serial')
+
+    def __init__(self, bounds, parent=None, body=None, radius=None, serial=0):
+        self.bounds = bounds
+        self.tight_bounds = bounds
+        self.parent = parent
+        self.child1 = None
+        self.child2 = None
+        self.height = 0
+        self.body = body
+        self.radius = radius
+        self.serial = serial
+
+    def is_leaf(self):
+        return self.child1 is None
+
+
+def _union(bounds1, bounds2):
+    return (min(bounds1[0], bounds2[0]), min(bounds1[1], bounds2[1]), max(bounds1[2], bounds2[2]), max(bounds1[3], bounds2[3]))
+
+
+def _perimeter(bounds):
+    return 2 * ((bounds[2] - bounds[0]) + (bounds[3] - bounds[1]))
+
+
+def _overlap(bounds1, bounds2):
+    return bounds1[2] >= bounds2[0] and bounds1[0] <= bounds2[2] and bounds1[3] >= bounds2[1] and bounds1[1] <= bounds2[3]
+
+
+def _segment_box(x, y, dx, dy, bounds, max_fraction):
+    # returns the fraction of a segment where it enters a box or None when it misses the box
+    t_min = 0.0
+    t_max = max_fraction
+
+    if dx == 0:
+        if x < bounds[0] or x > bounds[2]:
+            return None
+    else:
+        t1 = (bounds[0] - x) / dx
+        t2 = (bounds[2] - x) / dx
+        if t1 > t2:
+            t1, t2 = t2, t1
+        if t1 > t_min:
+            t_min = t1
+        if t2 < t_max:
+            t_max = t2
+        if t_min > t_max:
+            return None
+
+    if dy == 0:
+        if y < bounds[1] or y > bounds[3]:
+            return None
+    else:
+        t1 = (bounds[1] - y) / dy
+        t2 = (bounds[3] - y) / dy
+        if t1 > t2:
+            t1, t2 = t2, t1
+        if t1 > t_min:
+            t_min = t1
+        if t2 < t_max:
+            t_max = t2
+        if t_min > t_max:
+            return None
+
+    return t_min
+
+
+def osegment_box(point1, point2, bounds):
+    """
+    Finds where a segment from point1 to point2 enters an axis aligned box given as (x min, y min, x max, y max), returns the fraction
+    of the segment between 0 and 1, 0 when point1 lies in the box or None when the segment misses the box
+    """
+
+    return _segment_box(point1[0], point1[1], point2[0] - point1[0], point2[1] - point1[1], bounds, 1.0)
+
+
+class OAABBTree2D:
+    """
+    A dynamic bounding volume hierarchy of axis aligned bounding boxes over bodies such as polygons, lines and circles, it suits
+    scenes with very different body sizes where a uniform grid degenerates. Leaves store bounding boxes fattened by a margin so that
+    bodies moving a little do not need to be reinserted, and the tree is kept balanced by rotations, so that insert, move and remove
+    take O(log N). A circle is inserted as its centre point together with its radius.
+    """
+
+    def __init__(self, margin=1.0):
+        self.__margin = margin
+        self.__root = None
+        self.__leaves = {}
+        self.__serial = 0
+
+    @property
+    def margin(self):
+        return self.__margin
+
+    @property
+    def height(self):
+        if self.__root is None:
+            return 0
+        else:
+            return self.__root.height
+
+    def __fatten(self, bounds):
+        return (bounds[0] - self.__margin, bounds[1] - self.__margin, bounds[2] + self.__margin, bounds[3] + self.__margin)
+
+    def __replace_child(self, parent, old_child, new_child):
+        if parent is None:
+            self.__root = new_child
+        elif parent.child1 is old_child:
+            parent.child1 = new_child
+        else:
+            parent.child2 = new_child
+
+    def __balance(self, a):
+        if a.is_leaf() or a.height < 2:
+            return a
+
+        b = a.child1
+        c = a.child2
+        balance = c.height - b.height
+
+        if balance > 1:
+            f = c.child1
+            g = c.child2
+            c.child1 = a
+            c.parent = a.parent
+            a.parent = c
+            self.__replace_child(c.parent, a, c)
+            if f.height > g.height:
+                c.child2 = f
+                a.child2 = g
+                g.parent = a
+                a.bounds = _union(b.bounds, g.bounds)
+                c.bounds = _union(a.bounds, f.bounds)
+                a.height = 1 + max(b.height, g.height)
+                c.height = 1 + max(a.height, f.height)
+            else:
+                c.child2 = g
+                a.child2 = f
+                f.parent = a
+                a.bounds = _union(b.bounds, f.bounds)
+                c.bounds = _union(a.bounds, g.bounds)
+                a.height = 1 + max(b.height, f.height)
+                c.height = 1 + max(a.height, g.height)
+            return c
+
+        if balance < -1:
+            d = b.child1
+            e = b.child2
+            b.child1 = a
+            b.parent = a.parent
+            a.parent = b
+            self.__replace_child(b.parent, a, b)
+            if d.height > e.height:
+                b.child2 = d
+                a.child1 = e
+                e.parent = a
+                a.bounds = _union(c.bounds, e.bounds)
+                b.bounds = _union(a.bounds, d.bounds)
+                a.height = 1 + max(c.height, e.height)
+                b.height = 1 + max(a.height, d.height)
+            else:
+                b.child2 = e
+                a.child1 = d
+                d.parent = a
+                a.bounds = _union(c.bounds, d.bounds)
+                b.bounds = _union(a.bounds, e.bounds)
+                a.height = 1 + max(c.height, d.height)
+                b.height = 1 + max(a.height, e.height)
+            return b
+
+        return a
+
+    def __refit(self, node):
+        while node is not None:
+            node = self.__balance(node)
+            node.height = 1 + max(node.child1.height, node.child2.height)
+            node.bounds = _union(node.child1.bounds, node.child2.bounds)
+            node = node.parent
+
+    def __insert_leaf(self, leaf):
+        if self.__root is None:
+            self.__root = leaf
+            leaf.parent = None
+            return
+
+        leaf_bounds = leaf.bounds
+        node = self.__root
+
+        # descends towards the sibling which increases the total perimeter of the tree the least
+        while not node.is_leaf():
+            perimeter = _perimeter(node.bounds)
+            combined_perimeter = _perimeter(_union(node.bounds, leaf_bounds))
+            cost = 2 * combined_perimeter
+            inheritance_cost = 2 * (combined_perimeter - perimeter)
+
+            child_costs = []
+            for child in (node.child1, node.child2):
+                child_perimeter = _perimeter(_union(leaf_bounds, child.bounds))
+                if child.is_leaf():
+                    child_costs.append(child_perimeter + inheritance_cost)
+                else:
+                    child_costs.append(child_perimeter - _perimeter(child.bounds) + inheritance_cost)
+
+            if cost < child_costs[0] and cost < child_costs[1]:
+                break
+
+            if child_costs[0] < child_costs[1]:
+                node = node.child1
+            else:
+                node = node.child2
+
+        sibling = node
+        old_parent = sibling.parent
+        new_parent = _OTreeNode2D(_union(leaf_bounds, sibling.bounds), old_parent)
+        new_parent.height = sibling.height + 1
+        self.__replace_child(old_parent, sibling, new_parent)
+        new_parent.child1 = sibling
+        new_parent.child2 = leaf
+        sibling.parent = new_parent
+        leaf.parent = new_parent
+
+        self.__refit(leaf.parent)
+
+    def __remove_leaf(self, leaf):
+        if leaf is self.__root:
+            self.__root = None
+            return
+
+        parent = leaf.parent
+        grand_parent = parent.parent
+        if parent.child1 is leaf:
+            sibling = parent.child2
+        else:
+            sibling = parent.child1
+
+        self.__replace_child(grand_parent, parent, sibling)
+        sibling.parent = grand_parent
+        leaf.parent = None
+
+        self.__refit(grand_parent)
+
+    def insert(self, body, radius=None):
+        """
+        Inserts a polygon, a line or a circle centre with its radius into the tree
+        """
+
+        if id(body) not in self.__leaves:
+            bounds = obody_bounds(body, radius)
+            if bounds is not None:
+                self.__serial += 1
+                leaf = _OTreeNode2D(self.__fatten(bounds), body=body, radius=radius, serial=self.__serial)
+                leaf.tight_bounds = bounds
+                self.__leaves[id(body)] = leaf
+                self.__insert_leaf(leaf)
+
+    def move(self, body, radius=None):
+        """
+        Updates the tree after a body has moved or changed its shape, a circle may also be given a new radius.
+        Returns True when the body left its fattened bounding box and was reinserted
+        """
+
+        leaf = self.__leaves.get(id(body))
+
+        if leaf is not None:
+            if radius is not None:
+                leaf.radius = radius
+            bounds = obody_bounds(body, leaf.radius)
+            if bounds is None:
+                self.remove(body)
+                return True
+            leaf.tight_bounds = bounds
+            fat_bounds = leaf.bounds
+            if bounds[0] >= fat_bounds[0] and bounds[1] >= fat_bounds[1] and bounds[2] <= fat_bounds[2] and bounds[3] <= fat_bounds[3]:
+                return False
+            self.__remove_leaf(leaf)
+            leaf.bounds = self.__fatten(bounds)
+            self.__insert_leaf(leaf)
+            return True
+
+        return False
+
+    def remove(self, body):
+        """
+        Removes a body from the tree
+        """
+
+        leaf = self.__leaves.pop(id(body), None)
+
+        if leaf is not None:
+            self.__remove_leaf(leaf)
+
+    def get_radius(self, body):
+        """
+        Returns the radius a circle was inserted with or None for other bodies
+        """
+
+        leaf = self.__leaves.get(id(body))
+
+        if leaf is not None:
+            return leaf.radius
+        else:
+            return None
+
+    def __query_leaves(self, bounds):
+        leaves = []
+
+        if self.__root is not None:
+            stack = [self.__root]
+            while stack:
+                node = stack.pop()
+                if _overlap(node.bounds, bounds):
+                    if node.child1 is None:
+                        if _overlap(node.tight_bounds, bounds):
+                            leaves.append(node)
+                    else:
+                        stack.append(node.child1)
+                        stack.append(node.child2)
+
+        return leaves
+
+    def query(self, bounds):
+        """
+        Returns a list of bodies whose bounding boxes overlap a region defined as (x min, y min, x max, y max)
+        """
+
+        return [leaf.body for leaf in self.__query_leaves(bounds)]
+
+    def candidate_pairs(self):
+        """
+        Generates pairs of bodies whose bounding boxes overlap, every pair is generated once
+        """
+
+        for leaf in list(self.__leaves.values()):
+            for other in self.__query_leaves(leaf.tight_bounds):
+                if other.serial > leaf.serial:
+                    yield (leaf.body, other.body)
+
+    def ray_cast(self, point1, point2, callback=None):
+        """
+        Casts a segment from point1 to point2 through the tree. Without a callback a list of bodies whose bounding boxes are crossed
+        by the segment is returned in the order they are entered. With a callback, callback(body) is called for every such body and
+        may return a fraction between 0 and 1 of the segment where the body was hit, which shortens the segment for the rest of the
+        search, a fraction of 0 stops the search and None leaves the segment unchanged
+        """
+
+        if self.__root is None:
+            return []
+
+        x = point1[0]
+        y = point1[1]
+        dx = point2[0] - x
+        dy = point2[1] - y
+        max_fraction = 1.0
+        hits = []
+        stack = [self.__root]
+
+        while stack:
+            node = stack.pop()
+            entry = _segment_box(x, y, dx, dy, node.bounds, max_fraction)
+            if entry is None:
+                continue
+            if node.child1 is not None:
+                stack.append(node.child1)
+                stack.append(node.child2)
+                continue
+            entry = _segment_box(x, y, dx, dy, node.tight_bounds, max_fraction)
+            if entry is None:
+                continue
+            if callback is None:
+                hits.append((entry, node.serial, node.body))
+            else:
+                fraction = callback(node.body)
+                if fraction is not None:
+                    if fraction <= 0:
+                        break
+                    if fraction < max_fraction:
+                        max_fraction = fraction
+
+        hits.sort()
+        return [hit[2] for hit in hits]
+
+    def clear(self):
+        """
+        Removes all the bodies from the tree
+        """
+
+        self.__root = None
+        self.__leaves.clear()
+
+    def __contains__(self, body):
+        return id(body) in self.__leaves
+
+    def __iter__(self):
+        return iter([leaf.body for leaf in self.__leaves.values()])
+
+    def __len__(self):
+        return len(self.__leaves)
+
+
+class OSweepPrune2D:
+    """
+    A sort and sweep broad phase which keeps the end points of bodies' bounding boxes sorted along the X axis, and optionally
+    the Y axis too, between frames. As bodies move only a little per frame the end point lists are nearly sorted, so an insertion
+    sort fixes them in about O(N) and the overlapping pairs are updated from the swaps it makes, which keeps overlap detection
+    near O(N + k) for k overlapping pairs. Inserted bodies are collected and merged into the end point lists by the next sort,
+    so filling the structure with N bodies costs O(N log N + k). A circle is inserted as its centre point together with its radius.
+    """
+
+    def __init__(self, axes=1):
+        if axes == 2:
+            self.__axes = 2
+        else:
+            self.__axes = 1
+        self.__bodies = {}
+        self.__end_points = ([], [])
+        self.__overlaps = ({}, {})
+        self.__new_keys = {}
+        self.__sorted = True
+
+    @property
+    def axes(self):
+        return self.__axes
+
+    def insert(self, body, radius=None):
+        """
+        Inserts a polygon, a line or a circle centre with its radius
+        """
+
+        key = id(body)
+
+        if key not in self.__bodies:
+            bounds = obody_bounds(body, radius)
+            if bounds is not None:
+                self.__bodies[key] = [body, radius, bounds]
+                self.__new_keys[key] = None
+                self.__sorted = False
+
+    def move(self, body, radius=None):
+        """
+        Updates the bounding box of a body after it has moved or changed its shape, a circle may also be given a new radius
+        """
+
+        record = self.__bodies.get(id(body))
+
+        if record is not None:
+            if radius is not None:
+                record[1] = radius
+            bounds = obody_bounds(body, record[1])
+            if bounds is None:
+                self.remove(body)
+            else:
+                record[2] = bounds
+                self.__sorted = False
+
+    def update(self):
+        """
+        Updates the bounding boxes of all the bodies, meant to be called once per frame after the bodies have moved
+        """
+
+        for key in list(self.__bodies):
+            self.move(self.__bodies[key][0])
+
+    def remove(self, body):
+        """
+        Removes a body
+        """
+
+        key = id(body)
+        record = self.__bodies.pop(key, None)
+
+        if record is not None:
+            if key in self.__new_keys:
+                # not merged into the end point lists yet
+                del self.__new_keys[key]
+                return
+            for axis in range(self.__axes):
+                for other_key in self.__overlaps[axis].pop(key):
+                    self.__overlaps[axis][other_key].discard(key)
+                self.__end_points[axis][:] = [end_point for end_point in self.__end_points[axis] if end_point[2] != key]
+
+    def get_radius(self, body):
+        """
+        Returns the radius a circle was inserted with or None for other bodies
+        """
+
+        record = self.__bodies.get(id(body))
+
+        if record is not None:
+            return record[1]
+        else:
+            return None
+
+    def __sort(self):
+        if self.__sorted:
+            return
+
+        bodies = self.__bodies
+        new_keys = self.__new_keys
+
+        for axis in range(self.__axes):
+
+            end_points = self.__end_points[axis]
+            overlaps = self.__overlaps[axis]
+
+            for end_point in end_points:
+                end_point[0] = bodies[end_point[2]][2][axis + (2 * end_point[1])]
+
+            # insertion sort, a minimum passing a maximum starts an overlap and a maximum passing a minimum ends one
+            for i in range(1, len(end_points)):
+                end_point = end_points[i]
+                j = i - 1
+                while j >= 0 and end_points[j] > end_point:
+                    other = end_points[j]
+                    if end_point[1] == 0 and other[1] == 1:
+                        overlaps[end_point[2]].add(other[2])
+                        overlaps[other[2]].add(end_point[2])
+                    elif end_point[1] == 1 and other[1] == 0:
+                        overlaps[end_point[2]].discard(other[2])
+                        overlaps[other[2]].discard(end_point[2])
+                    end_points[j + 1] = other
+                    j -= 1
+                end_points[j + 1] = end_point
+
+            if len(new_keys) != 0:
+                self.__merge(end_points, overlaps, axis)
+
+        new_keys.clear()
+        self.__sorted = True
+
+    def __merge(self, end_points, overlaps, axis):
+        # the end points of the inserted bodies are sorted on their own and merged in, sort() merges the two sorted runs in
+        # linear time, then one sweep finds the overlaps of the inserted bodies with bodies open at their minimum end points
+        bodies = self.__bodies
+        new_keys = self.__new_keys
+        new_end_points = []
+
+        for key in new_keys:
+            bounds = bodies[key][2]
+            overlaps[key] = set()
+            new_end_points.append([bounds[axis], 0, key])
+            new_end_points.append([bounds[axis + 2], 1, key])
+
+        new_end_points.sort()
+        end_points.extend(new_end_points)
+        end_points.sort()
+
+        open_keys = set()
+        open_new_keys = set()
+
+        for end_point in end_points:
+            key = end_point[2]
+            is_new = key in new_keys
+            if end_point[1] == 0:
+                for other_key in open_new_keys:
+                    overlaps[key].add(other_key)
+                    overlaps[other_key].add(key)
+                if is_new:
+                    for other_key in open_keys:
+                        overlaps[key].add(other_key)
+                        overlaps[other_key].add(key)
+                    open_new_keys.add(key)
+                else:
+                    open_keys.add(key)
+            elif is_new:
+                open_new_keys.discard(key)
+            else:
+                open_keys.discard(key)
+
+    def query(self, bounds):
+        """
+        Returns a list of bodies whose bounding boxes overlap a region defined as (x min, y min, x max, y max)
+        """
+
+        return [record[0] for record in self.__bodies.values() if _overlap(record[2], bounds)]
+
+    def candidate_pairs(self):
+        """
+        Generates pairs of bodies whose bounding boxes overlap, every pair is generated once
+        """
+
+        self.__sort()
+
+        bodies = self.__bodies
+
+        for key, others in self.__overlaps[0].items():
+            bounds = bodies[key][2]
+            for other_key in others:
+                if other_key > key:
+                    if self.__axes == 2:
+                        if other_key in self.__overlaps[1][key]:
+                            yield (bodies[key][0], bodies[other_key][0])
+                    else:
+                        other_bounds = bodies[other_key][2]
+                        if bounds[3] >= other_bounds[1] and bounds[1] <= other_bounds[3]:
+                            yield (bodies[key][0], bodies[other_key][0])
+
+    def clear(self):
+        """
+        Removes all the bodies
+        """
+
+        self.__bodies.clear()
+        for axis in range(2):
+            self.__end_points[axis].clear()
+            self.__overlaps[axis].clear()
+        self.__new_keys.clear()
+        self.__sorted = True
+
+    def __contains__(self, body):
+        return id(body) in self.__bodies
+
+    def __iter__(self):
+        return iter([record[0] for record in self.__bodies.values()])
+
+    def __len__(self):
+        return len(self.__bodies)
@@ -6,16 +6,36 @@
 2D collision routines
 """
 
+from array import array
+from math import nan, inf
+from heapq import heapify, heappush, heappop
 from .point2d import OPoint2D
+from .pointarray2d import OPointArray2D
 from .vector2d import OVector2D
+from .line2d import OLine2D
+from .polygon import OPolygon
+from .hull2d import oconvex_hull
+from .broadphase2d import obody_bounds, osegment_box, OAABBTree2D
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+GJK_ITERATIONS = 20
+EPA_ITERATIONS = 32
 
 
 def ocircle2(circle1, circle1_radius, circle2, circle2_radius):
     """
-    Detects collision between two circles
+    Detects collision between two circles by comparing squared distance between the centres with squared sum of the radii
     """
 
-    if (circle1.distance_to(circle2) <= (circle1_radius+circle2_radius)):
+    dx = circle2[0] - circle1[0]
+    dy = circle2[1] - circle1[1]
+    radius = circle1_radius + circle2_radius
+
+    if ((dx*dx) + (dy*dy)) <= (radius*radius):
         return True
     else:
         return False
@@ -30,7 +50,9 @@ def oline2(line1, line2):
     numerator2 = ((line1[1] - line2[1]) * (line1[2] - line1[0])) - ((line1[0] - line2[0]) * (line1[3] - line1[1]))
 
     if denominator == 0:
-        return numerator1 == 0 and numerator2 == 0
+        if numerator1 == 0 and numerator2 == 0:
+            return _collinear_overlap(line1, line2)
+        return False
 
     t = numerator1 / denominator
 
@@ -41,27 +63,49 @@ def oline2(line1, line2):
     else:
         return None
 
+def _collinear_overlap(line1, line2):
+    # checks whether two collinear definite lines share a part by projecting them on the direction of the longer one
+    direction_x = line1[2] - line1[0]
+    direction_y = line1[3] - line1[1]
+    if (direction_x**2) + (direction_y**2) < ((line2[2] - line2[0])**2) + ((line2[3] - line2[1])**2):
+        direction_x = line2[2] - line2[0]
+        direction_y = line2[3] - line2[1]
+
+    if direction_x == 0 and direction_y == 0:
+        return line1[0] == line2[0] and line1[1] == line2[1]
+
+    start1 = (line1[0] * direction_x) + (line1[1] * direction_y)
+    end1 = (line1[2] * direction_x) + (line1[3] * direction_y)
+    start2 = (line2[0] * direction_x) + (line2[1] * direction_y)
+    end2 = (line2[2] * direction_x) + (line2[3] * direction_y)
+
+    return max(min(start1, end1), min(start2, end2)) <= min(max(start1, end1), max(start2, end2))
+
 def oline_circle(line, circle, circle_radius):
     """
-    Detects collision between a line and a circle and returns penetration distance
-    """
-
-    origin_circle = OPoint2D(circle[0]-line[0], circle[1]-line[1])
-    line_vector = OVector2D(0,0)
-    circle_vector = OVector2D(0, 0)
-    line_vector.define_line(line[0], line[1], line[2], line[3])
-    circle_vector[0] = origin_circle[0]
-    circle_vector[1] = origin_circle[1]
-    circle_vector_project = line_vector.project(circle_vector)
-    circle_project = OPoint2D(circle_vector_project[0], circle_vector_project[1])
-    distance = circle_project.distance_to(origin_circle)
-    if (distance < circle_radius):
-        line_vector_end = OPoint2D(line_vector[0], line_vector[1])
-        check_length = line_vector.length + circle_radius
-        if (circle_vector_project.length < check_length and line_vector_end.distance_to(circle_project) < check_length):
-            return circle_radius - distance
-        else:
-            return None
+    Detects collision between a line and a circle and returns penetration distance, the test compares squared distance from the
+    circle centre to the nearest point of the line with squared radius so a square root is only taken for a collision
+    """
+
+    line_x = line[2] - line[0]
+    line_y = line[3] - line[1]
+    circle_x = circle[0] - line[0]
+    circle_y = circle[1] - line[1]
+    length_sq = (line_x*line_x) + (line_y*line_y)
+
+    if length_sq != 0:
+        t = ((circle_x*line_x) + (circle_y*line_y)) / length_sq
+        if t > 1:
+            t = 1
+        elif t < 0:
+            t = 0
+        circle_x = circle_x - (t*line_x)
+        circle_y = circle_y - (t*line_y)
+
+    distance_sq = (circle_x*circle_x) + (circle_y*circle_y)
+
+    if (distance_sq < (circle_radius*circle_radius)):
+        return circle_radius - (distance_sq**0.5)
     else:
         return None
 
@@ -72,29 +116,8 @@ def obox2(poly1, poly2):
 
     if len(poly1) != 0 and len(poly2) != 0:
 
-        x_coords = []
-        y_coords = []
-
-        for coord_x, coord_y in poly1.coords:
-            x_coords.append(coord_x)
-            y_coords.append(coord_y)
-
-        poly1_xcoord_min = min(x_coords)
-        poly1_xcoord_max = max(x_coords)
-        poly1_ycoord_min = min(y_coords)
-        poly1_ycoord_max = max(y_coords)
-
-        x_coords.clear()
-        y_coords.clear()
-
-        for coord_x, coord_y in poly2.coords:
-            x_coords.append(coord_x)
-            y_coords.append(coord_y)
-
-        poly2_xcoord_min = min(x_coords)
-        poly2_xcoord_max = max(x_coords)
-        poly2_ycoord_min = min(y_coords)
-        poly2_ycoord_max = max(y_coords)
+        poly1_xcoord_min, poly1_ycoord_min, poly1_xcoord_max, poly1_ycoord_max = poly1.aabb
+        poly2_xcoord_min, poly2_ycoord_min, poly2_xcoord_max, poly2_ycoord_max = poly2.aabb
 
         if poly1_xcoord_max >= poly2_xcoord_min and poly1_xcoord_min <= poly2_xcoord_max and poly1_ycoord_max >= poly2_ycoord_min and poly1_ycoord_min <= poly2_ycoord_max:
             return True
@@ -110,17 +133,7 @@ def obox_circle(poly, circle, circle_radius):
 
     if len(poly) != 0:
 
-        x_coords = []
-        y_coords = []
-
-        for coord_x, coord_y in poly.coords:
-            x_coords.append(coord_x)
-            y_coords.append(coord_y)
-
-        poly_xcoord_min = min(x_coords)
-        poly_xcoord_max = max(x_coords)
-        poly_ycoord_min = min(y_coords)
-        poly_ycoord_max = max(y_coords)
+        poly_xcoord_min, poly_ycoord_min, poly_xcoord_max, poly_ycoord_max = poly.aabb
 
         if (circle[0] + circle_radius) >= poly_xcoord_min and circle[0] <= (poly_xcoord_max + circle_radius) and (circle[1] + circle_radius) >= poly_ycoord_min and circle[1] <= (poly_ycoord_max + circle_radius):
             return True
@@ -134,82 +147,1067 @@ def opoly_line(poly, line):
     ps = len(poly)
 
     if ps > 1:
+        coords = poly.coord_tuples
         for i in range(ps-1):
-            r = oline2((poly.coords[i][0], poly.coords[i][1], poly.coords[i+1][0], poly.coords[i+1][1]), line)
-            if r != None:
+            r = oline2((coords[i][0], coords[i][1], coords[i+1][0], coords[i+1][1]), line)
+            if r != None and r is not False:
                 return r
 
-        r = oline2((poly.coords[0][0], poly.coords[0][1], poly.coords[ps-1][0], poly.coords[ps-1][1]), line)
-        if r != None:
+        r = oline2((coords[0][0], coords[0][1], coords[ps-1][0], coords[ps-1][1]), line)
+        if r != None and r is not False:
             return r
 
     return None
 
-def opoly2(poly1, poly2):
+def _point_buffers(points):
+    # returns X and Y coordinate buffers of points given as an OPointArray2D or a list of coordinate pairs
+    if type(points) is OPointArray2D:
+        xs = points.x
+        ys = points.y
+    else:
+        xs = [point[0] for point in points]
+        ys = [point[1] for point in points]
+    if numpy is not None:
+        return numpy.asarray(xs, dtype=numpy.float64), numpy.asarray(ys, dtype=numpy.float64)
+    return xs, ys
+
+def _line_buffers(lines):
+    # returns end point coordinate buffers of lines given as a list of OLine2D objects or (x1, y1, x2, y2) values, or an N x 4 array
+    if numpy is not None:
+        if type(lines) is numpy.ndarray:
+            lines = lines.astype(numpy.float64, copy=False).reshape(-1, 4)
+        else:
+            lines = numpy.array([(line[0], line[1], line[2], line[3]) for line in lines], dtype=numpy.float64).reshape(-1, 4)
+        return lines[:, 0], lines[:, 1], lines[:, 2], lines[:, 3]
+    lines = [(line[0], line[1], line[2], line[3]) for line in lines]
+    return [line[0] for line in lines], [line[1] for line in lines], [line[2] for line in lines], [line[3] for line in lines]
+
+def ocircle2_many(circle, circle_radius, circles, circles_radius):
+    """
+    Detects collision between a circle and many circles given as an OPointArray2D or a list of points, with one radius or a radius per circle,
+    and returns a boolean mask with the result of ocircle2 for every circle
+    """
+
+    xs, ys = _point_buffers(circles)
+
+    if numpy is not None:
+        return (((xs - circle[0])**2) + ((ys - circle[1])**2)) <= ((circle_radius + numpy.asarray(circles_radius, dtype=numpy.float64))**2)
+
+    if type(circles_radius) is float or type(circles_radius) is int:
+        circles_radius = [circles_radius] * len(xs)
+
+    return [(((x - circle[0])**2) + ((y - circle[1])**2)) <= ((circle_radius + radius)**2) for x, y, radius in zip(xs, ys, circles_radius)]
+
+def _collinear_overlap_many(x1, y1, x2, y2, x3, y3, x4, y4):
+    # checks collinear definite lines for a shared part as _collinear_overlap does, for NumPy arrays of end points
+    length1 = ((x2 - x1)**2) + ((y2 - y1)**2)
+    length2 = ((x4 - x3)**2) + ((y4 - y3)**2)
+    longer = length1 >= length2
+    direction_x = numpy.where(longer, x2 - x1, x4 - x3)
+    direction_y = numpy.where(longer, y2 - y1, y4 - y3)
+    start1 = (x1 * direction_x) + (y1 * direction_y)
+    end1 = (x2 * direction_x) + (y2 * direction_y)
+    start2 = (x3 * direction_x) + (y3 * direction_y)
+    end2 = (x4 * direction_x) + (y4 * direction_y)
+    overlap = numpy.maximum(numpy.minimum(start1, end1), numpy.minimum(start2, end2)) <= numpy.minimum(numpy.maximum(start1, end1), numpy.maximum(start2, end2))
+    return numpy.where((direction_x == 0) & (direction_y == 0), (x1 == x3) & (y1 == y3), overlap)
+
+def oline2_many(line, lines):
+    """
+    Detects collision between a definite line and many definite lines and returns a boolean mask with a hit for every line
+    and an OPointArray2D of the intersecting points, the point is NaN for misses and for collinear lines
+    """
+
+    x1, y1, x2, y2 = line[0], line[1], line[2], line[3]
+    x3, y3, x4, y4 = _line_buffers(lines)
+    intersections = OPointArray2D()
+
+    if numpy is not None:
+        line_x = x2 - x1
+        line_y = y2 - y1
+        denominator = (line_x * (y4 - y3)) - (line_y * (x4 - x3))
+        numerator1 = ((y1 - y3) * (x4 - x3)) - ((x1 - x3) * (y4 - y3))
+        numerator2 = ((y1 - y3) * line_x) - ((x1 - x3) * line_y)
+        parallel = denominator == 0
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            t = numerator1 / denominator
+            u = numerator2 / denominator
+        crossing = ~parallel & (t >= 0) & (t <= 1) & (u >= 0) & (u <= 1)
+        mask = crossing | (parallel & (numerator1 == 0) & (numerator2 == 0) & _collinear_overlap_many(x1, y1, x2, y2, x3, y3, x4, y4))
+        with numpy.errstate(invalid='ignore'):
+            intersections.define_xy(numpy.where(crossing, x1 + (t * line_x), numpy.nan), numpy.where(crossing, y1 + (t * line_y), numpy.nan))
+        return mask, intersections
+
+    mask = []
+    xs = []
+    ys = []
+    for target in zip(x3, y3, x4, y4):
+        r = oline2(line, target)
+        mask.append(bool(r))
+        if type(r) is OPoint2D:
+            xs.append(r[0])
+            ys.append(r[1])
+        else:
+            xs.append(nan)
+            ys.append(nan)
+    intersections.define_xy(xs, ys)
+    return mask, intersections
+
+def oline_circle_many(lines, circle, circle_radius):
+    """
+    Detects collision between many lines and a circle and returns the penetration distance of oline_circle for every line
+    as a float array where misses are NaN
+    """
+
+    x1, y1, x2, y2 = _line_buffers(lines)
+
+    if numpy is not None:
+        line_x = x2 - x1
+        line_y = y2 - y1
+        circle_x = circle[0] - x1
+        circle_y = circle[1] - y1
+        length_sq = (line_x**2) + (line_y**2)
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            t = numpy.clip(numpy.where(length_sq != 0, ((line_x * circle_x) + (line_y * circle_y)) / length_sq, 0), 0, 1)
+        distance_sq = ((circle_x - (t * line_x))**2) + ((circle_y - (t * line_y))**2)
+        hit = distance_sq < (circle_radius**2)
+        penetrations = numpy.full(len(distance_sq), numpy.nan)
+        penetrations[hit] = circle_radius - numpy.sqrt(distance_sq[hit])
+        return penetrations
+
+    penetrations = array('d')
+    for line in zip(x1, y1, x2, y2):
+        r = oline_circle(line, circle, circle_radius)
+        penetrations.append(nan if r is None else r)
+    return penetrations
+
+def opoly_line_many(poly, lines):
+    """
+    Detects collision between a polygon and many definite lines and returns a boolean mask with a hit for every line and an OPointArray2D
+    of the first intersecting point found by opoly_line, the point is NaN for misses and for lines collinear to a side
+    """
+
+    x3, y3, x4, y4 = _line_buffers(lines)
+    ps = len(poly)
+
+    if numpy is None or ps < 2:
+        mask = []
+        xs = []
+        ys = []
+        for target in zip(x3, y3, x4, y4):
+            r = opoly_line(poly, target)
+            mask.append(bool(r))
+            if type(r) is OPoint2D:
+                xs.append(r[0])
+                ys.append(r[1])
+            else:
+                xs.append(nan)
+                ys.append(nan)
+        intersections = OPointArray2D()
+        intersections.define_xy(xs, ys)
+        if numpy is not None:
+            mask = numpy.array(mask, dtype=bool)
+        return mask, intersections
+
+    # sides in the order opoly_line tests them as a column of start and end points against a row of lines
+    x_coords, y_coords = poly.coord_lists
+    x1 = numpy.array(x_coords[:-1] + [x_coords[0]], dtype=numpy.float64)[:, None]
+    y1 = numpy.array(y_coords[:-1] + [y_coords[0]], dtype=numpy.float64)[:, None]
+    x2 = numpy.array(x_coords[1:] + [x_coords[-1]], dtype=numpy.float64)[:, None]
+    y2 = numpy.array(y_coords[1:] + [y_coords[-1]], dtype=numpy.float64)[:, None]
+
+    side_x = x2 - x1
+    side_y = y2 - y1
+    denominator = (side_x * (y4 - y3)) - (side_y * (x4 - x3))
+    numerator1 = ((y1 - y3) * (x4 - x3)) - ((x1 - x3) * (y4 - y3))
+    numerator2 = ((y1 - y3) * side_x) - ((x1 - x3) * side_y)
+    parallel = denominator == 0
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        t = numerator1 / denominator
+        u = numerator2 / denominator
+    crossing = ~parallel & (t >= 0) & (t <= 1) & (u >= 0) & (u <= 1)
+    hits = crossing | (parallel & (numerator1 == 0) & (numerator2 == 0) & _collinear_overlap_many(x1, y1, x2, y2, x3, y3, x4, y4))
+
+    first = hits.argmax(axis=0)
+    columns = numpy.arange(hits.shape[1])
+    mask = hits[first, columns]
+    found = crossing[first, columns]
+    first_t = t[first, columns]
+    intersections = OPointArray2D()
+    with numpy.errstate(invalid='ignore'):
+        intersections.define_xy(numpy.where(found, x1[first, 0] + (first_t * side_x[first, 0]), numpy.nan), numpy.where(found, y1[first, 0] + (first_t * side_y[first, 0]), numpy.nan))
+    return mask, intersections
+
+def _status_search(status, y, y_at, right):
+    # returns the position of y in a status list sorted by y_at, before equal values or after them when right is True
+    lo = 0
+    hi = len(status)
+    while lo < hi:
+        middle = (lo + hi) // 2
+        value = y_at(status[middle])
+        if value < y or (right and value == y):
+            lo = middle + 1
+        else:
+            hi = middle
+    return lo
+
+def oline2_sweep(lines):
+    """
+    Finds every intersection among many definite lines given as a list of OLine2D objects or (x1, y1, x2, y2) values, or an N x 4 array,
+    using the Bentley-Ottmann sweep line in O((N + K) log N) for K intersections. Generates tuples of intersecting point as OPoint2D
+    and indices of both lines, every candidate pair found by the sweep is confirmed with oline2 and generated once.
+    Lines which overlap along a collinear part give the point where the sweep first meets the overlap
+    """
+
+    x1s, y1s, x2s, y2s = _line_buffers(lines)
+    if numpy is not None:
+        x1s, y1s, x2s, y2s = x1s.tolist(), y1s.tolist(), x2s.tolist(), y2s.tolist()
+
+    count = len(x1s)
+    originals = list(zip(x1s, y1s, x2s, y2s))
+    segments = []
+    slopes = []
+    events = {}
+    queue = []
+    scale = 1.0
+
+    # every line runs from its left end point to its right one, vertical lines from bottom to top
+    for i in range(count):
+        start = (x1s[i], y1s[i])
+        end = (x2s[i], y2s[i])
+        if end < start:
+            start, end = end, start
+        segments.append((start[0], start[1], end[0], end[1]))
+        if start[0] == end[0]:
+            slopes.append(inf)
+        else:
+            slopes.append((end[1] - start[1]) / (end[0] - start[0]))
+        for point, kind in ((start, 0), (end, 1)):
+            event = events.get(point)
+            if event is None:
+                event = events[point] = ([], [])
+                queue.append(point)
+            event[kind].append(i)
+        scale = max(scale, abs(start[0]), abs(start[1]), abs(end[0]), abs(end[1]))
+
+    heapify(queue)
+    tolerance = scale * 1e-9
+    status = []
+    reported = set()
+    sweep = [0.0, 0.0]
+
+    def y_at(i):
+        segment = segments[i]
+        if slopes[i] == inf:
+            return min(max(sweep[1], segment[1]), segment[3])
+        return segment[1] + ((sweep[0] - segment[0]) * slopes[i])
+
+    def confirm(i, j):
+        # reports a pair once when oline2 confirms it
+        pair = (i, j) if i < j else (j, i)
+        if pair in reported:
+            return None
+        r = oline2(originals[pair[0]], originals[pair[1]])
+        if r is None or r is False:
+            return None
+        reported.add(pair)
+        if r is True:
+            r = OPoint2D(sweep[0], sweep[1])
+        return (r, pair[0], pair[1])
+
+    def new_event(i, j):
+        # queues the intersection of two neighbouring lines when it lies ahead of the sweep, or reports it at once when rounding
+        # placed it at or behind the sweep
+        r = oline2(originals[i], originals[j])
+        if r is None or r is False:
+            return None
+        if r is True or (r[0], r[1]) <= (sweep[0], sweep[1]):
+            return confirm(i, j)
+        point = (r[0], r[1])
+        if point not in events:
+            events[point] = ([], [])
+            heappush(queue, point)
+        return None
+
+    while queue:
+
+        point = heappop(queue)
+        starting, ending = events.pop(point)
+        sweep[0], sweep[1] = point
+
+        # lines through the event point lie next to each other in the status
+        lo = _status_search(status, point[1] - tolerance, y_at, False)
+        hi = _status_search(status, point[1] + tolerance, y_at, True)
+        through = status[lo:hi]
+
+        found = []
+        involved = list(through)
+        for i in starting + ending:
+            if i not in involved:
+                involved.append(i)
+        if len(involved) > 1:
+            for a in range(len(involved)):
+                for b in range(a + 1, len(involved)):
+                    hit = confirm(involved[a], involved[b])
+                    if hit is not None:
+                        found.append(hit)
+
+        del status[lo:hi]
+        for i in ending:
+            if i not in through and i in status:
+                position = status.index(i)
+                del status[position]
+                if 0 < position < len(status):
+                    hit = new_event(status[position - 1], status[position])
+                    if hit is not None:
+                        found.append(hit)
+
+        # lines continuing past the event point are put back in the order they leave it
+        continuing = [i for i in through + starting if i not in ending]
+        continuing.sort(key=lambda i: slopes[i])
+        position = _status_search(status, point[1], y_at, False)
+        status[position:position] = continuing
+
+        if len(continuing) == 0:
+            if 0 < position < len(status):
+                hit = new_event(status[position - 1], status[position])
+                if hit is not None:
+                    found.append(hit)
+        else:
+            if position > 0:
+                hit = new_event(status[position - 1], continuing[0])
+                if hit is not None:
+                    found.append(hit)
+            if position + len(continuing) < len(status):
+                hit = new_event(continuing[-1], status[position + len(continuing)])
+                if hit is not None:
+                    found.append(hit)
+
+        for hit in found:
+            yield hit
+
+def _ray_sides(x_coords, y_coords, x, y, dx, dy, max_fraction, closed=True):
+    # returns the fraction along a segment and the index of the nearest side it crosses within max_fraction or None,
+    # side i runs from vertex i to vertex i + 1 and the last side closes the polygon
+    count = len(x_coords)
+    nearest = None
+
+    for i in range(count if closed else count - 1):
+        j = i + 1 if i + 1 < count else 0
+        side_x = x_coords[j] - x_coords[i]
+        side_y = y_coords[j] - y_coords[i]
+        denominator = (dx * side_y) - (dy * side_x)
+        if denominator == 0:
+            continue
+        offset_x = x_coords[i] - x
+        offset_y = y_coords[i] - y
+        t = ((offset_x * side_y) - (offset_y * side_x)) / denominator
+        if t < 0 or t > max_fraction:
+            continue
+        u = ((offset_x * dy) - (offset_y * dx)) / denominator
+        if u >= 0 and u <= 1:
+            max_fraction = t
+            nearest = (t, i)
+
+    return nearest
+
+def _ray_body(body, x, y, dx, dy, max_fraction):
+    # returns the nearest crossing of a polygon or a line as for _ray_sides, other bodies are never hit
+    if type(body) is OPolygon:
+        if len(body) > 1:
+            x_coords, y_coords = body.coord_lists
+            return _ray_sides(x_coords, y_coords, x, y, dx, dy, max_fraction)
+    elif type(body) is OLine2D:
+        return _ray_sides((body[0], body[2]), (body[1], body[3]), x, y, dx, dy, max_fraction, False)
+    return None
+
+def oray_poly(poly, point1, point2):
+    """
+    Casts a segment from point1 to point2 against a polygon and returns the nearest hit as a tuple of hit point as OPoint2D,
+    side index and distance from point1 or None when the segment misses, side i runs from vertex i to vertex i + 1
+    """
+
+    x = point1[0]
+    y = point1[1]
+    dx = point2[0] - x
+    dy = point2[1] - y
+
+    nearest = _ray_body(poly, x, y, dx, dy, 1.0)
+
+    if nearest is None:
+        return None
+
+    t, index = nearest
+    return (OPoint2D(x + (t * dx), y + (t * dy)), index, t * (((dx**2) + (dy**2))**0.5))
+
+def oray_cast(bodies, point1, point2):
+    """
+    Casts a segment from point1 to point2 against polygons and lines given as an OAABBTree2D or a list, and returns the nearest hit
+    as a tuple of hit point as OPoint2D, body, side index and distance from point1 or None when the segment misses everything.
+    Bodies are visited in the order the segment enters their bounding boxes and the segment is shortened to the nearest hit found so far
+    """
+
+    x = point1[0]
+    y = point1[1]
+    dx = point2[0] - x
+    dy = point2[1] - y
+    nearest = [1.0, None, None]
+
+    if type(bodies) is OAABBTree2D:
+
+        def clip(body):
+            hit = _ray_body(body, x, y, dx, dy, nearest[0])
+            if hit is None:
+                return None
+            nearest[0], nearest[2] = hit
+            nearest[1] = body
+            return hit[0]
+
+        bodies.ray_cast(point1, point2, clip)
+
+    elif type(bodies) is list or type(bodies) is tuple:
+
+        entries = []
+        for body in bodies:
+            if type(body) is OPolygon or type(body) is OLine2D:
+                bounds = obody_bounds(body)
+                if bounds is not None:
+                    entry = osegment_box(point1, point2, bounds)
+                    if entry is not None:
+                        entries.append((entry, len(entries), body))
+        entries.sort()
+
+        for entry, order, body in entries:
+            if entry > nearest[0]:
+                break
+            hit = _ray_body(body, x, y, dx, dy, nearest[0])
+            if hit is not None:
+                nearest[0], nearest[2] = hit
+                nearest[1] = body
+
+    else:
+        return None
+
+    if nearest[1] is None:
+        return None
+
+    t = nearest[0]
+    return (OPoint2D(x + (t * dx), y + (t * dy)), nearest[1], nearest[2], t * (((dx**2) + (dy**2))**0.5))
+
+def _project(x_coords, y_coords, normal_x, normal_y):
+    # returns minimum and maximum of the vertices projected on a unit normal
+    mi = mx = (x_coords[0] * normal_x) + (y_coords[0] * normal_y)
+    for coord_x, coord_y in zip(x_coords, y_coords):
+        projection = (coord_x * normal_x) + (coord_y * normal_y)
+        if projection < mi:
+            mi = projection
+        elif projection > mx:
+            mx = projection
+    return mi, mx
+
+def _best_edge(x_coords, y_coords, normal_x, normal_y):
+    # returns the side most perpendicular to a normal among the two sides of the vertex furthest along the normal,
+    # as the furthest vertex and the side end points
+    count = len(x_coords)
+    index = 0
+    furthest = (x_coords[0] * normal_x) + (y_coords[0] * normal_y)
+    for i in range(1, count):
+        projection = (x_coords[i] * normal_x) + (y_coords[i] * normal_y)
+        if projection > furthest:
+            furthest = projection
+            index = i
+
+    vertex = (x_coords[index], y_coords[index])
+    next_vertex = (x_coords[(index + 1) % count], y_coords[(index + 1) % count])
+    previous_vertex = (x_coords[index - 1], y_coords[index - 1])
+    left = (vertex[0] - next_vertex[0], vertex[1] - next_vertex[1])
+    right = (vertex[0] - previous_vertex[0], vertex[1] - previous_vertex[1])
+    left_length = ((left[0]**2) + (left[1]**2))**0.5
+    right_length = ((right[0]**2) + (right[1]**2))**0.5
+
+    if right_length == 0 or (left_length != 0 and abs((right[0] * normal_x) + (right[1] * normal_y)) / right_length > abs((left[0] * normal_x) + (left[1] * normal_y)) / left_length):
+        return vertex, vertex, next_vertex
+    else:
+        return vertex, previous_vertex, vertex
+
+def _clip(point1, point2, normal_x, normal_y, offset):
+    # keeps the part of a segment whose projection on a normal is at least offset
+    clipped = []
+    distance1 = (point1[0] * normal_x) + (point1[1] * normal_y) - offset
+    distance2 = (point2[0] * normal_x) + (point2[1] * normal_y) - offset
+    if distance1 >= 0:
+        clipped.append(point1)
+    if distance2 >= 0:
+        clipped.append(point2)
+    if distance1 * distance2 < 0:
+        ratio = distance1 / (distance1 - distance2)
+        clipped.append((point1[0] + ((point2[0] - point1[0]) * ratio), point1[1] + ((point2[1] - point1[1]) * ratio)))
+    return clipped
+
+def _contact_points(x_coords1, y_coords1, x_coords2, y_coords2, normal_x, normal_y):
+    # finds contact points by clipping the incident side against the reference side, the normal points from the first polygon to the second
+    edge1 = _best_edge(x_coords1, y_coords1, normal_x, normal_y)
+    edge2 = _best_edge(x_coords2, y_coords2, -normal_x, -normal_y)
+    edge1_x = edge1[2][0] - edge1[1][0]
+    edge1_y = edge1[2][1] - edge1[1][1]
+    edge2_x = edge2[2][0] - edge2[1][0]
+    edge2_y = edge2[2][1] - edge2[1][1]
+    edge1_length = ((edge1_x**2) + (edge1_y**2))**0.5
+    edge2_length = ((edge2_x**2) + (edge2_y**2))**0.5
+
+    if edge1_length != 0 and (edge2_length == 0 or abs((edge1_x * normal_x) + (edge1_y * normal_y)) / edge1_length <= abs((edge2_x * normal_x) + (edge2_y * normal_y)) / edge2_length):
+        reference, incident, reference_length = edge1, edge2, edge1_length
+        outward_x, outward_y = normal_x, normal_y
+    elif edge2_length != 0:
+        reference, incident, reference_length = edge2, edge1, edge2_length
+        outward_x, outward_y = -normal_x, -normal_y
+    else:
+        return [OPoint2D(edge2[0][0], edge2[0][1])]
+
+    side_x = (reference[2][0] - reference[1][0]) / reference_length
+    side_y = (reference[2][1] - reference[1][1]) / reference_length
+
+    clipped = _clip(incident[1], incident[2], side_x, side_y, (side_x * reference[1][0]) + (side_y * reference[1][1]))
+    if len(clipped) < 2:
+        return [OPoint2D(edge2[0][0], edge2[0][1])]
+    clipped = _clip(clipped[0], clipped[1], -side_x, -side_y, -((side_x * reference[2][0]) + (side_y * reference[2][1])))
+    if len(clipped) < 2:
+        return [OPoint2D(edge2[0][0], edge2[0][1])]
+
+    face_x = -side_y
+    face_y = side_x
+    if (face_x * outward_x) + (face_y * outward_y) < 0:
+        face_x = -face_x
+        face_y = -face_y
+    face = (face_x * reference[0][0]) + (face_y * reference[0][1])
+
+    contacts = [OPoint2D(point[0], point[1]) for point in clipped if (face_x * point[0]) + (face_y * point[1]) <= face]
+
+    if len(contacts) == 0:
+        return [OPoint2D(edge2[0][0], edge2[0][1])]
+
+    return contacts
+
+def _sat(x_coords1, y_coords1, normals1, x_coords2, y_coords2, normals2, manifold):
+    # separating axis test of two convex parts, returns None when an axis separates them, otherwise the penetration depth and the unit
+    # direction which moves the second part out of the first when manifold is set, the depth is None when there is no axis to test
+    axes = normals1 + tuple([normal for normal in normals2 if normal not in normals1])
+    depth = None
+    mtv_x = mtv_y = 0
+
+    for normal_x, normal_y in axes:
+
+        mi1, mx1 = _project(x_coords1, y_coords1, normal_x, normal_y)
+        mi2, mx2 = _project(x_coords2, y_coords2, normal_x, normal_y)
+
+        if (mx1 < mi2) or (mi1 > mx2):
+            return None
+
+        if manifold:
+            # the overlap on this axis when the second part is pushed along the normal and against it
+            if (mx1 - mi2) < (mx2 - mi1):
+                if depth is None or (mx1 - mi2) < depth:
+                    depth = mx1 - mi2
+                    mtv_x, mtv_y = normal_x, normal_y
+            else:
+                if depth is None or (mx2 - mi1) < depth:
+                    depth = mx2 - mi1
+                    mtv_x, mtv_y = -normal_x, -normal_y
+
+    return (depth, mtv_x, mtv_y)
+
+def opoly2(poly1, poly2, manifold=False):
     """
-    Detects collision between two polygons using SAT
+    Detects collision between two polygons using SAT. With manifold set to True returns None when there is no collision, otherwise a tuple of
+    the minimum translation vector as an OVector2D which separates the polygons when poly2 is moved by it, penetration depth and a list of contact points.
+    Concave polygons are tested as their convex parts, pairs of parts whose bounding boxes do not overlap are skipped and the manifold is the one
+    of the most deeply overlapping pair of parts
     """
 
-    col = 1
     p1s = len(poly1)
     p2s = len(poly2)
+    found = None
+
+    if p1s != 0 and p2s != 0 and obox2(poly1, poly2):
+
+        if len(poly1.convex_parts) == 1 and len(poly2.convex_parts) == 1:
+
+            x_coords1, y_coords1 = poly1.coord_lists
+            x_coords2, y_coords2 = poly2.coord_lists
+            result = _sat(x_coords1, y_coords1, poly1.edge_normals, x_coords2, y_coords2, poly2.edge_normals, manifold)
+
+            if not manifold:
+                return 0 if result is None else 1
+            if result is not None:
+                found = (result, x_coords1, y_coords1, x_coords2, y_coords2)
+
+        else:
+
+            # parts outside the bounding box of the other polygon are left out before pairing
+            bounds = poly2.aabb
+            parts1 = [part for part in poly1.convex_part_lists if part[3][2] >= bounds[0] and part[3][0] <= bounds[2] and part[3][3] >= bounds[1] and part[3][1] <= bounds[3]]
+            bounds = poly1.aabb
+            parts2 = [part for part in poly2.convex_part_lists if part[3][2] >= bounds[0] and part[3][0] <= bounds[2] and part[3][3] >= bounds[1] and part[3][1] <= bounds[3]]
+
+            for x_coords1, y_coords1, normals1, bounds1 in parts1:
+                for x_coords2, y_coords2, normals2, bounds2 in parts2:
+
+                    if bounds1[2] < bounds2[0] or bounds1[0] > bounds2[2] or bounds1[3] < bounds2[1] or bounds1[1] > bounds2[3]:
+                        continue
+
+                    result = _sat(x_coords1, y_coords1, normals1, x_coords2, y_coords2, normals2, manifold)
+
+                    if result is not None:
+                        if not manifold:
+                            return 1
+                        if found is None or (result[0] is not None and (found[0][0] is None or result[0] > found[0][0])):
+                            found = (result, x_coords1, y_coords1, x_coords2, y_coords2)
+
+    if manifold:
+        if found is None:
+            return None
+        (depth, mtv_x, mtv_y), x_coords1, y_coords1, x_coords2, y_coords2 = found
+        if depth is None:
+            return (OVector2D(0, 0), 0, [])
+        else:
+            return (OVector2D(mtv_x * depth, mtv_y * depth), depth, _contact_points(x_coords1, y_coords1, x_coords2, y_coords2, mtv_x, mtv_y))
+
+    return 0 if found is None else 1
+
+def _support(x_coords, y_coords, direction_x, direction_y, start):
+    # finds the vertex furthest along a direction by hill climbing from a starting vertex, which holds for convex polygons. Runs of
+    # vertices projecting equal to the current one up to rounding, such as collinear vertices on a side facing across the direction,
+    # are walked over instead of stopping on them
+    count = len(x_coords)
+    index = start if 0 <= start < count else 0
+    best = (x_coords[index] * direction_x) + (y_coords[index] * direction_y)
+    scale = (abs(direction_x) + abs(direction_y)) * 1e-9
+
+    while True:
+        next_index = (index + 1) % count
+        previous_index = index - 1 if index > 0 else count - 1
+        next_projection = (x_coords[next_index] * direction_x) + (y_coords[next_index] * direction_y)
+        previous_projection = (x_coords[previous_index] * direction_x) + (y_coords[previous_index] * direction_y)
+        if next_projection > best and next_projection >= previous_projection:
+            index = next_index
+            best = next_projection
+        elif previous_projection > best:
+            index = previous_index
+            best = previous_projection
+        else:
+            # both neighbours below the current vertex by more than rounding is the usual end of the climb
+            lower = best - (scale * (abs(x_coords[index]) + abs(y_coords[index]) + abs(x_coords[next_index]) + abs(y_coords[next_index]) +
+                                     abs(x_coords[previous_index]) + abs(y_coords[previous_index])))
+            if next_projection < lower and previous_projection < lower:
+                return index
+
+            # walks both ways while the vertices project within rounding of the current one and climbs on from the first one further along
+            tolerance = scale * (abs(x_coords[index]) + abs(y_coords[index]))
+            further = None
+            for step in (1, -1):
+                other = index
+                for _ in range(count - 1):
+                    other = (other + step) % count
+                    projection = (x_coords[other] * direction_x) + (y_coords[other] * direction_y)
+                    limit = tolerance + (scale * (abs(x_coords[other]) + abs(y_coords[other])))
+                    if projection > best + limit:
+                        further = other
+                        break
+                    if projection < best - limit:
+                        break
+                if further is not None:
+                    break
+            if further is None:
+                return index
+            index = further
+            best = projection
+
+def _gjk(x_coords1, y_coords1, x_coords2, y_coords2, cache=None):
+    # GJK distance between two convex polygons on the Minkowski difference poly2 - poly1. Returns the distance, closest points on
+    # both polygons and the final simplex as a list of [index1, index2, w_x, w_y, barycentric coordinate] where a distance of 0 with a
+    # three vertex simplex means the polygons overlap. The distance is None when the iteration limit is reached before convergence
+    count1 = len(x_coords1)
+    count2 = len(x_coords2)
+    simplex = []
+
+    if cache:
+        for index1, index2 in cache:
+            if index1 < count1 and index2 < count2:
+                simplex.append([index1, index2, x_coords2[index2] - x_coords1[index1], y_coords2[index2] - y_coords1[index1], 0.0])
+
+    if len(simplex) == 0:
+        simplex.append([0, 0, x_coords2[0] - x_coords1[0], y_coords2[0] - y_coords1[0], 1.0])
+
+    hint1 = simplex[0][0]
+    hint2 = simplex[0][1]
 
+    for iteration in range(GJK_ITERATIONS):
 
-    if p1s != 0 and p2s != 0:
+        saved = [(vertex[0], vertex[1]) for vertex in simplex]
 
-        for i in range(p1s):
-            norm = OPoint2D(0, 0)
-            sm1 = []
-            sm2 = []
-            if i == (p1s-1):
-                norm[0] = -1 * (poly1.coords[0][1] - poly1.coords[i][1])
-                norm[1] = poly1.coords[0][0] - poly1.coords[i][0]
+        if len(simplex) == 1:
+            simplex[0][4] = 1.0
+        elif len(simplex) == 2:
+            w1 = simplex[0]
+            w2 = simplex[1]
+            e12_x = w2[2] - w1[2]
+            e12_y = w2[3] - w1[3]
+            d12_2 = -((w1[2] * e12_x) + (w1[3] * e12_y))
+            d12_1 = (w2[2] * e12_x) + (w2[3] * e12_y)
+            if d12_2 <= 0:
+                w1[4] = 1.0
+                del simplex[1]
+            elif d12_1 <= 0:
+                w2[4] = 1.0
+                del simplex[0]
             else:
-                norm[0] = -1 * (poly1.coords[i + 1][1] - poly1.coords[i][1])
-                norm[1] = poly1.coords[i + 1][0] - poly1.coords[i][0]
+                w1[4] = d12_1 / (d12_1 + d12_2)
+                w2[4] = d12_2 / (d12_1 + d12_2)
+        else:
+            w1, w2, w3 = simplex
+            e12_x = w2[2] - w1[2]
+            e12_y = w2[3] - w1[3]
+            d12_1 = (w2[2] * e12_x) + (w2[3] * e12_y)
+            d12_2 = -((w1[2] * e12_x) + (w1[3] * e12_y))
+            e13_x = w3[2] - w1[2]
+            e13_y = w3[3] - w1[3]
+            d13_1 = (w3[2] * e13_x) + (w3[3] * e13_y)
+            d13_2 = -((w1[2] * e13_x) + (w1[3] * e13_y))
+            e23_x = w3[2] - w2[2]
+            e23_y = w3[3] - w2[3]
+            d23_1 = (w3[2] * e23_x) + (w3[3] * e23_y)
+            d23_2 = -((w2[2] * e23_x) + (w2[3] * e23_y))
+            n123 = (e12_x * e13_y) - (e12_y * e13_x)
+            d123_1 = n123 * ((w2[2] * w3[3]) - (w2[3] * w3[2]))
+            d123_2 = n123 * ((w3[2] * w1[3]) - (w3[3] * w1[2]))
+            d123_3 = n123 * ((w1[2] * w2[3]) - (w1[3] * w2[2]))
+
+            if d12_2 <= 0 and d13_2 <= 0:
+                w1[4] = 1.0
+                simplex = [w1]
+            elif d12_1 > 0 and d12_2 > 0 and d123_3 <= 0:
+                w1[4] = d12_1 / (d12_1 + d12_2)
+                w2[4] = d12_2 / (d12_1 + d12_2)
+                simplex = [w1, w2]
+            elif d13_1 > 0 and d13_2 > 0 and d123_2 <= 0:
+                w1[4] = d13_1 / (d13_1 + d13_2)
+                w3[4] = d13_2 / (d13_1 + d13_2)
+                simplex = [w1, w3]
+            elif d12_1 <= 0 and d23_2 <= 0:
+                w2[4] = 1.0
+                simplex = [w2]
+            elif d13_1 <= 0 and d23_1 <= 0:
+                w3[4] = 1.0
+                simplex = [w3]
+            elif d23_1 > 0 and d23_2 > 0 and d123_1 <= 0:
+                w2[4] = d23_1 / (d23_1 + d23_2)
+                w3[4] = d23_2 / (d23_1 + d23_2)
+                simplex = [w2, w3]
+            else:
+                total = d123_1 + d123_2 + d123_3
+                w1[4] = d123_1 / total
+                w2[4] = d123_2 / total
+                w3[4] = d123_3 / total
+                break
+
+        if len(simplex) == 1:
+            direction_x = -simplex[0][2]
+            direction_y = -simplex[0][3]
+        else:
+            e12_x = simplex[1][2] - simplex[0][2]
+            e12_y = simplex[1][3] - simplex[0][3]
+            if (e12_x * -simplex[0][3]) - (e12_y * -simplex[0][2]) > 0:
+                direction_x = -e12_y
+                direction_y = e12_x
+            else:
+                direction_x = e12_y
+                direction_y = -e12_x
+
+        if (direction_x**2) + (direction_y**2) < 1e-24:
+            break
+
+        hint1 = _support(x_coords1, y_coords1, -direction_x, -direction_y, hint1)
+        hint2 = _support(x_coords2, y_coords2, direction_x, direction_y, hint2)
+
+        if (hint1, hint2) in saved:
+            break
+
+        simplex.append([hint1, hint2, x_coords2[hint2] - x_coords1[hint1], y_coords2[hint2] - y_coords1[hint1], 0.0])
+
+    else:
+        # the last support point was never solved, the simplex neither proves an overlap nor gives a final distance
+        del simplex[-1]
+        if cache is not None:
+            cache[:] = [(vertex[0], vertex[1]) for vertex in simplex]
+        return None, None, None, simplex
+
+    point1_x = point1_y = point2_x = point2_y = 0.0
+    for vertex in simplex:
+        point1_x += vertex[4] * x_coords1[vertex[0]]
+        point1_y += vertex[4] * y_coords1[vertex[0]]
+        point2_x += vertex[4] * x_coords2[vertex[1]]
+        point2_y += vertex[4] * y_coords2[vertex[1]]
+
+    if len(simplex) == 3:
+        distance = 0.0
+    elif len(simplex) == 2:
+        # distance of origin to the side line, which is exactly 0 when origin lies on the side unlike the rounded closest points
+        e12_x = simplex[1][2] - simplex[0][2]
+        e12_y = simplex[1][3] - simplex[0][3]
+        distance = abs((simplex[0][2] * simplex[1][3]) - (simplex[0][3] * simplex[1][2])) / (((e12_x**2) + (e12_y**2))**0.5)
+    else:
+        distance = (((point2_x - point1_x)**2) + ((point2_y - point1_y)**2))**0.5
+
+    if cache is not None:
+        cache[:] = [(vertex[0], vertex[1]) for vertex in simplex]
+
+    return distance, (point1_x, point1_y), (point2_x, point2_y), simplex
+
+def ogjk2(poly1, poly2, cache=None):
+    """
+    Finds distance between two convex polygons using GJK, which is 0 when they touch or overlap, or None when GJK does not converge
+    within its iteration limit. A list passed as cache keeps the final simplex of the call and warm starts the next call for the same
+    pair of polygons
+    """
+
+    if len(poly1) != 0 and len(poly2) != 0:
+
+        x_coords1, y_coords1 = poly1.coord_lists
+        x_coords2, y_coords2 = poly2.coord_lists
+
+        return _gjk(x_coords1, y_coords1, x_coords2, y_coords2, cache)[0]
+
+    else:
+        return None
+
+def oepa2(poly1, poly2, cache=None):
+    """
+    Detects collision between two convex polygons using GJK and finds the penetration using EPA. Returns None when there is no collision,
+    otherwise a tuple of the minimum translation vector as an OVector2D which separates the polygons when poly2 is moved by it,
+    penetration depth and a list of contact points. None is also returned when GJK or EPA does not converge within its iteration limit,
+    as an overlap or its depth is then not proven. A list passed as cache warm starts GJK as in ogjk2
+    """
+
+    if len(poly1) == 0 or len(poly2) == 0:
+        return None
+
+    x_coords1, y_coords1 = poly1.coord_lists
+    x_coords2, y_coords2 = poly2.coord_lists
 
-            for ii in range(p1s):
-                sm1.append(OVector2D(poly1.coords[ii][0], poly1.coords[ii][1]).dot(norm)/norm.distance)
-            for ii in range(p2s):
-                sm2.append(OVector2D(poly2.coords[ii][0], poly2.coords[ii][1]).dot(norm)/norm.distance)
+    distance, point1, point2, simplex = _gjk(x_coords1, y_coords1, x_coords2, y_coords2, cache)
 
-            mi1 = min(sm1)
-            mx1 = max(sm1)
-            mi2 = min(sm2)
-            mx2 = max(sm2)
+    if distance is None or distance > 0:
+        return None
 
-            if (mx1 < mi2) or (mi1 > mx2):
-                col = 0
+    if len(simplex) < 3:
+        # the origin lies on a vertex or a side of the simplex, which happens when the polygons only touch but also when vertices or
+        # sides of overlapping polygons coincide, support points along the axes complete a starting polytope around the origin
+        points = [(vertex[2], vertex[3]) for vertex in simplex]
+        directions = ((1, 0), (0, 1), (-1, 0), (0, -1))
+        for attempt in range(2):
+            for direction_x, direction_y in directions:
+                index1 = _support(x_coords1, y_coords1, -direction_x, -direction_y, simplex[0][0])
+                index2 = _support(x_coords2, y_coords2, direction_x, direction_y, simplex[0][1])
+                points.append((x_coords2[index2] - x_coords1[index1], y_coords2[index2] - y_coords1[index1]))
+            hull_x, hull_y = oconvex_hull(points).coord_lists
+            if len(hull_x) != 2:
                 break
+            # every support point so far lies on one line through origin, the normals of the line find the rest of the Minkowski difference
+            normal_x = hull_y[0] - hull_y[1]
+            normal_y = hull_x[1] - hull_x[0]
+            directions = ((normal_x, normal_y), (-normal_x, -normal_y))
+        if len(hull_x) < 3:
+            # the Minkowski difference has no area, the polygons only touch
+            return (OVector2D(0, 0), 0, [OPoint2D(point1[0], point1[1])])
+        polytope = list(zip(hull_x, hull_y))
+    else:
+        polytope = [(vertex[2], vertex[3]) for vertex in simplex]
+        if ((polytope[1][0] - polytope[0][0]) * (polytope[2][1] - polytope[0][1])) - ((polytope[1][1] - polytope[0][1]) * (polytope[2][0] - polytope[0][0])) < 0:
+            polytope.reverse()
 
-        if col == 1:
-            for i in range(p2s):
-                norm = OPoint2D(0, 0)
-                sm1 = []
-                sm2 = []
-
-                if i == (p2s - 1):
-                    norm[0] = -1 * (poly2.coords[0][1] - poly2.coords[i][1])
-                    norm[1] = poly2.coords[0][0] - poly2.coords[i][0]
-                else:
-                    norm[0] = -1 * (poly2.coords[i+1][1] - poly2.coords[i][1])
-                    norm[1] = poly2.coords[i+1][0] - poly2.coords[i][0]
-
-                for ii in range(p1s):
-                    sm1.append(OVector2D(poly1.coords[ii][0], poly1.coords[ii][1]).dot(norm) / norm.distance)
-                for ii in range(p2s):
-                    sm2.append(OVector2D(poly2.coords[ii][0], poly2.coords[ii][1]).dot(norm) / norm.distance)
-
-                mi1 = min(sm1)
-                mx1 = max(sm1)
-                mi2 = min(sm2)
-                mx2 = max(sm2)
-
-                if (mx1 < mi2) or (mi1 > mx2):
-                    col = 0
-                    break
+    hint1 = simplex[0][0]
+    hint2 = simplex[0][1]
+
+    for iteration in range(EPA_ITERATIONS):
+
+        # side of the anticlockwise polytope closest to origin
+        closest = None
+        for i in range(len(polytope)):
+            j = (i + 1) % len(polytope)
+            edge_x = polytope[j][0] - polytope[i][0]
+            edge_y = polytope[j][1] - polytope[i][1]
+            length = ((edge_x**2) + (edge_y**2))**0.5
+            if length == 0:
+                continue
+            normal_x = edge_y / length
+            normal_y = -edge_x / length
+            side_distance = (normal_x * polytope[i][0]) + (normal_y * polytope[i][1])
+            if closest is None or side_distance < closest[0]:
+                closest = (side_distance, normal_x, normal_y, j)
+
+        side_distance, normal_x, normal_y, insert_index = closest
+
+        hint1 = _support(x_coords1, y_coords1, -normal_x, -normal_y, hint1)
+        hint2 = _support(x_coords2, y_coords2, normal_x, normal_y, hint2)
+        w_x = x_coords2[hint2] - x_coords1[hint1]
+        w_y = y_coords2[hint2] - y_coords1[hint1]
+
+        if ((w_x * normal_x) + (w_y * normal_y)) - side_distance < 1e-9:
+            break
+
+        polytope.insert(insert_index, (w_x, w_y))
+
+        # removes vertices left inside the polytope, the starting simplex may hold vertices which are not on the Minkowski difference boundary
+        index = insert_index
+        while len(polytope) > 3:
+            previous_index = (index - 1) % len(polytope)
+            before_index = (index - 2) % len(polytope)
+            if ((polytope[previous_index][0] - polytope[before_index][0]) * (w_y - polytope[previous_index][1])) - ((polytope[previous_index][1] - polytope[before_index][1]) * (w_x - polytope[previous_index][0])) > 0:
+                break
+            del polytope[previous_index]
+            index = polytope.index((w_x, w_y))
+        while len(polytope) > 3:
+            next_index = (index + 1) % len(polytope)
+            after_index = (index + 2) % len(polytope)
+            if ((polytope[next_index][0] - w_x) * (polytope[after_index][1] - polytope[next_index][1])) - ((polytope[next_index][1] - w_y) * (polytope[after_index][0] - polytope[next_index][0])) > 0:
+                break
+            del polytope[next_index]
+            index = polytope.index((w_x, w_y))
+
+    else:
+        # the polytope was still growing, its closest side is not proven to be on the Minkowski difference boundary
+        return None
+
+    depth = side_distance
+
+    if depth <= 0:
+        # the polygons only touch, the origin lies on the boundary of the Minkowski difference
+        return (OVector2D(0, 0), 0, [OPoint2D(point1[0], point1[1])])
+
+    return (OVector2D(-normal_x * depth, -normal_y * depth), depth, _contact_points(x_coords1, y_coords1, x_coords2, y_coords2, -normal_x, -normal_y))
+
+def _toi_circle(offset_x, offset_y, velocity_x, velocity_y, radius):
+    # returns the first time between 0 and 1 when a point at offset moving by velocity comes within radius of origin or None
+    c = (offset_x**2) + (offset_y**2) - (radius**2)
+
+    if c <= 0:
+        return 0.0
+
+    a = (velocity_x**2) + (velocity_y**2)
+    b = (offset_x * velocity_x) + (offset_y * velocity_y)
+
+    if a == 0 or b >= 0:
+        return None
+
+    discriminant = (b**2) - (a * c)
+
+    if discriminant < 0:
+        return None
 
+    t = (-b - (discriminant**0.5)) / a
+
+    if t <= 1:
+        return t
     else:
-        col = 0
+        return None
+
+def otoi_circle2(circle1, circle1_radius, velocity1, circle2, circle2_radius, velocity2):
+    """
+    Finds time of impact between two circles moving by velocities given as OVector2D objects or pairs over a time step, returns the fraction
+    of the time step between 0 and 1 when the circles first touch, 0 when they already collide or None when they do not meet in the time step
+    """
+
+    return _toi_circle(circle1[0] - circle2[0], circle1[1] - circle2[1], velocity1[0] - velocity2[0], velocity1[1] - velocity2[1], circle1_radius + circle2_radius)
+
+def otoi_line_circle(line, circle, circle_radius, velocity):
+    """
+    Finds time of impact between a definite line and a circle moving by a velocity given as an OVector2D object or a pair over a time step,
+    returns the fraction of the time step between 0 and 1 when the circle first touches the line, 0 when they already collide or None
+    when they do not meet in the time step
+    """
+
+    line_x = line[2] - line[0]
+    line_y = line[3] - line[1]
+    velocity_x = velocity[0]
+    velocity_y = velocity[1]
+    length_sq = (line_x**2) + (line_y**2)
+
+    if oline_circle(line, circle, circle_radius) is not None:
+        return 0.0
+
+    # the end points of the line
+    toi = _toi_circle(circle[0] - line[0], circle[1] - line[1], velocity_x, velocity_y, circle_radius)
+    t = _toi_circle(circle[0] - line[2], circle[1] - line[3], velocity_x, velocity_y, circle_radius)
+    if t is not None and (toi is None or t < toi):
+        toi = t
+
+    if toi == 0 or length_sq == 0:
+        return toi
+
+    # the side of the line the circle starts on
+    length = length_sq**0.5
+    normal_x = -line_y / length
+    normal_y = line_x / length
+    offset = ((circle[0] - line[0]) * normal_x) + ((circle[1] - line[1]) * normal_y)
+    speed = (velocity_x * normal_x) + (velocity_y * normal_y)
+    if offset < 0:
+        offset = -offset
+        speed = -speed
+
+    if speed < 0:
+        t = (offset - circle_radius) / -speed
+        if t >= 0 and t <= 1 and (toi is None or t < toi):
+            along = ((circle[0] + (velocity_x * t) - line[0]) * line_x) + ((circle[1] + (velocity_y * t) - line[1]) * line_y)
+            if along >= 0 and along <= length_sq:
+                toi = t
+
+    return toi
+
+def otoi_poly2(poly1, velocity1, poly2, velocity2, tolerance=1e-4, iterations=50):
+    """
+    Finds time of impact between two convex polygons moving by velocities given as OVector2D objects or pairs over a time step using
+    conservative advancement with GJK distances. Returns the fraction of the time step between 0 and 1 when the polygons come within
+    tolerance of each other, 0 when they already collide or None when they do not meet in the time step. None is also returned when
+    they are still apart after the given number of iterations, as the time of impact is then not found
+    """
+
+    if len(poly1) == 0 or len(poly2) == 0:
+        return None
+
+    x_coords1, y_coords1 = poly1.coord_lists
+    x_coords2, y_coords2 = poly2.coord_lists
+    velocity_x = velocity2[0] - velocity1[0]
+    velocity_y = velocity2[1] - velocity1[1]
+    cache = []
+    t = 0.0
+
+    for iteration in range(iterations):
+
+        # poly2 moves by the relative velocity while poly1 stays in place
+        if t == 0:
+            moved_x = x_coords2
+            moved_y = y_coords2
+        else:
+            moved_x = [x + (velocity_x * t) for x in x_coords2]
+            moved_y = [y + (velocity_y * t) for y in y_coords2]
+
+        distance, point1, point2, simplex = _gjk(x_coords1, y_coords1, moved_x, moved_y, cache)
+
+        if distance is None:
+            return None
 
-    return col
+        if distance <= tolerance:
+            return t
+
+        # the distance shrinks no faster than the relative velocity along the separating direction
+        speed = -(((point2[0] - point1[0]) * velocity_x) + ((point2[1] - point1[1]) * velocity_y)) / distance
+
+        if speed <= 0:
+            return None
+
+        t = t + ((distance - (tolerance / 2)) / speed)
+
+        if t > 1:
+            return None
+
+    return None
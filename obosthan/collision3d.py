@@ -0,0 +1,715 @@
+# Copyright (c) 2023, Md Imam Hossain (emamhd at gmail dot com)
+# see LICENSE.txt for details
+
+
+"""
+3D collision routines
+"""
+
+from array import array
+from math import nan, inf
+from .point3d import OPoint3D
+from .surface import OSurface
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+NUM_OF_BINS = 16
+RAY_CHUNK_SIZE = 16384
+
+
+def osphere3(sphere1, sphere1_radius, sphere2, sphere2_radius):
+    """
+    Detects collision between two spheres by comparing squared distance between the centres with squared sum of the radii
+    """
+
+    dx = sphere2[0] - sphere1[0]
+    dy = sphere2[1] - sphere1[1]
+    dz = sphere2[2] - sphere1[2]
+    radius = sphere1_radius + sphere2_radius
+
+    if ((dx*dx) + (dy*dy) + (dz*dz)) <= (radius*radius):
+        return True
+    else:
+        return False
+
+def obox3(surface1, surface2):
+    """
+    Detects axis aligned collision between two surfaces' bounding boxes
+    """
+
+    if len(surface1) != 0 and len(surface2) != 0:
+
+        range1 = surface1.get_range()
+        range2 = surface2.get_range()
+
+        for axis in range(3):
+            if range1[axis][1] < range2[axis][0] or range1[axis][0] > range2[axis][1]:
+                return False
+        return True
+    else:
+        return None
+
+def obox_sphere3(surface, sphere, sphere_radius):
+    """
+    Detects collision between a surface's bounding box and a sphere by comparing squared distance from the sphere centre to the
+    nearest point of the box with squared radius
+    """
+
+    if len(surface) != 0:
+
+        distance_sq = 0
+        for axis, (coord_min, coord_max) in enumerate(surface.get_range()):
+            if sphere[axis] < coord_min:
+                distance_sq = distance_sq + ((coord_min - sphere[axis])**2)
+            elif sphere[axis] > coord_max:
+                distance_sq = distance_sq + ((sphere[axis] - coord_max)**2)
+
+        if distance_sq <= (sphere_radius*sphere_radius):
+            return True
+        else:
+            return False
+    else:
+        return None
+
+def _unit_ray(direction):
+    # returns a direction scaled to unit length or None for a zero direction
+    length = ((direction[0]**2) + (direction[1]**2) + (direction[2]**2))**0.5
+    if length == 0:
+        return None
+    return (direction[0] / length, direction[1] / length, direction[2] / length)
+
+def _triangle_buffers(surface):
+    # returns first vertices and the two edges leaving them for every face of a surface as M x 3 NumPy arrays,
+    # or as flat array('d') objects holding nine values per face
+    vertices = surface.vertices
+    faces = surface.faces
+
+    if numpy is not None:
+        v0 = vertices.take(faces[:, 0], axis=0)
+        return v0, vertices.take(faces[:, 1], axis=0) - v0, vertices.take(faces[:, 2], axis=0) - v0
+
+    triangles = array('d')
+    for f in range(0, len(faces), 3):
+        a = faces[f] * 3
+        b = faces[f + 1] * 3
+        c = faces[f + 2] * 3
+        triangles.extend((vertices[a], vertices[a + 1], vertices[a + 2],
+                          vertices[b] - vertices[a], vertices[b + 1] - vertices[a + 1], vertices[b + 2] - vertices[a + 2],
+                          vertices[c] - vertices[a], vertices[c + 1] - vertices[a + 1], vertices[c + 2] - vertices[a + 2]))
+    return triangles
+
+def _ray_triangles_many(origins, directions, v0, e1, e2):
+    # Moller-Trumbore test of rays against triangles given as NumPy arrays which broadcast against each other with the
+    # coordinates along the last axis, returns distances along the unit directions where misses and triangles behind the origins are inf
+    d_x = directions[..., 0]
+    d_y = directions[..., 1]
+    d_z = directions[..., 2]
+    e1_x = e1[..., 0]
+    e1_y = e1[..., 1]
+    e1_z = e1[..., 2]
+    e2_x = e2[..., 0]
+    e2_y = e2[..., 1]
+    e2_z = e2[..., 2]
+    p_x = (d_y * e2_z) - (d_z * e2_y)
+    p_y = (d_z * e2_x) - (d_x * e2_z)
+    p_z = (d_x * e2_y) - (d_y * e2_x)
+    det = (p_x * e1_x) + (p_y * e1_y) + (p_z * e1_z)
+    s = origins - v0
+    s_x = s[..., 0]
+    s_y = s[..., 1]
+    s_z = s[..., 2]
+    q_x = (s_y * e1_z) - (s_z * e1_y)
+    q_y = (s_z * e1_x) - (s_x * e1_z)
+    q_z = (s_x * e1_y) - (s_y * e1_x)
+
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        inv_det = 1.0 / det
+        u = ((s_x * p_x) + (s_y * p_y) + (s_z * p_z)) * inv_det
+        v = ((q_x * d_x) + (q_y * d_y) + (q_z * d_z)) * inv_det
+        t = ((q_x * e2_x) + (q_y * e2_y) + (q_z * e2_z)) * inv_det
+        hit = (det != 0) & (u >= 0) & (v >= 0) & ((u + v) <= 1) & (t >= 0)
+    return numpy.where(hit, t, inf)
+
+def _ray_triangle(ox, oy, oz, dx, dy, dz, triangles, i):
+    # Moller-Trumbore test of a ray against triangle i of a flat buffer from _triangle_buffers, returns the distance or None
+    v0_x, v0_y, v0_z, e1_x, e1_y, e1_z, e2_x, e2_y, e2_z = triangles[i * 9:(i * 9) + 9]
+    p_x = (dy * e2_z) - (dz * e2_y)
+    p_y = (dz * e2_x) - (dx * e2_z)
+    p_z = (dx * e2_y) - (dy * e2_x)
+    det = (p_x * e1_x) + (p_y * e1_y) + (p_z * e1_z)
+    if det == 0:
+        return None
+    s_x = ox - v0_x
+    s_y = oy - v0_y
+    s_z = oz - v0_z
+    u = ((s_x * p_x) + (s_y * p_y) + (s_z * p_z)) / det
+    if u < 0 or u > 1:
+        return None
+    q_x = (s_y * e1_z) - (s_z * e1_y)
+    q_y = (s_z * e1_x) - (s_x * e1_z)
+    q_z = (s_x * e1_y) - (s_y * e1_x)
+    v = ((q_x * dx) + (q_y * dy) + (q_z * dz)) / det
+    if v < 0 or (u + v) > 1:
+        return None
+    t = ((q_x * e2_x) + (q_y * e2_y) + (q_z * e2_z)) / det
+    if t < 0:
+        return None
+    return t
+
+def oray_surface(surface, origin, direction, max_distance=inf):
+    """
+    Casts a ray from origin along direction against every face of a surface and returns the nearest hit within max_distance
+    as a tuple of hit point as OPoint3D, face index and distance from origin or None when the ray misses
+    """
+
+    unit = _unit_ray(direction)
+
+    if unit is None or surface.num_of_faces == 0:
+        return None
+
+    if numpy is not None:
+        v0, e1, e2 = _triangle_buffers(surface)
+        distances = _ray_triangles_many(numpy.array((origin[0], origin[1], origin[2]), dtype=numpy.float64), numpy.array(unit), v0, e1, e2)
+        index = int(distances.argmin())
+        distance = float(distances[index])
+        if distance > max_distance or distance == inf:
+            return None
+    else:
+        triangles = _triangle_buffers(surface)
+        index = None
+        distance = max_distance
+        for i in range(surface.num_of_faces):
+            t = _ray_triangle(origin[0], origin[1], origin[2], unit[0], unit[1], unit[2], triangles, i)
+            if t is not None and t <= distance:
+                index = i
+                distance = t
+        if index is None:
+            return None
+
+    return (OPoint3D(origin[0] + (distance * unit[0]), origin[1] + (distance * unit[1]), origin[2] + (distance * unit[2])), index, distance)
+
+def _half_area(dx, dy, dz):
+    # half surface area of a box with the given sides
+    return (dx * dy) + (dy * dz) + (dz * dx)
+
+def _segment_bounds(tri_min, tri_max, starts, counts):
+    # returns minimum and maximum corners of the row ranges [start, start + count) of two (N + 1) x 3 NumPy arrays whose
+    # last row is padding, the ranges must be increasing and must not overlap
+    indices = numpy.empty(2 * len(starts), dtype=numpy.int64)
+    indices[0::2] = starts
+    indices[1::2] = starts + counts
+    return numpy.minimum.reduceat(tri_min, indices, axis=0)[0::2], numpy.maximum.reduceat(tri_max, indices, axis=0)[0::2]
+
+
+class OBVH3D:
+    """
+    A bounding volume hierarchy over the triangles of one or many OSurface meshes, split by the surface area heuristic over
+    binned triangle centroids, so that a ray is only tested against the triangles whose boxes it passes through.
+    Rays are cast one at a time with ray_cast or in batches with ray_cast_many, which walks the hierarchy with all the rays at
+    once and tests every reached leaf against all the rays reaching it in one pass. The hierarchy keeps its own copy of the
+    triangles, refit updates it after the surfaces move without changing their faces.
+    """
+
+    def __init__(self, surfaces, leaf_size=4):
+        if type(surfaces) is OSurface:
+            surfaces = [surfaces]
+        self.__surfaces = tuple(surface for surface in surfaces if type(surface) is OSurface)
+        self.__leaf_size = max(1, leaf_size)
+        self.__build()
+
+    @property
+    def surfaces(self):
+        return self.__surfaces
+
+    @property
+    def leaf_size(self):
+        return self.__leaf_size
+
+    @property
+    def num_of_nodes(self):
+        return len(self.__node_left)
+
+    @property
+    def num_of_triangles(self):
+        return len(self.__tri_face)
+
+    def __gather(self):
+        # collects the triangles of all the surfaces along with the surface and the face each one comes from
+        if numpy is not None:
+            buffers = [_triangle_buffers(surface) for surface in self.__surfaces]
+            if len(buffers) == 0:
+                empty = numpy.empty((0, 3))
+                return empty, empty, empty, numpy.empty(0, dtype=numpy.int32), numpy.empty(0, dtype=numpy.int32)
+            v0 = numpy.concatenate([buffer[0] for buffer in buffers])
+            e1 = numpy.concatenate([buffer[1] for buffer in buffers])
+            e2 = numpy.concatenate([buffer[2] for buffer in buffers])
+            tri_surface = numpy.concatenate([numpy.full(len(buffer[0]), i, dtype=numpy.int32) for i, buffer in enumerate(buffers)])
+            tri_face = numpy.concatenate([numpy.arange(len(buffer[0]), dtype=numpy.int32) for buffer in buffers])
+            return v0, e1, e2, tri_surface, tri_face
+
+        triangles = array('d')
+        tri_surface = array('i')
+        tri_face = array('i')
+        for i, surface in enumerate(self.__surfaces):
+            triangles.extend(_triangle_buffers(surface))
+            tri_surface.extend([i] * surface.num_of_faces)
+            tri_face.extend(range(surface.num_of_faces))
+        return triangles, tri_surface, tri_face
+
+    def __build(self):
+        if numpy is not None:
+            v0, e1, e2, tri_surface, tri_face = self.__gather()
+            tri_min = numpy.minimum(numpy.minimum(v0, v0 + e1), v0 + e2)
+            tri_max = numpy.maximum(numpy.maximum(v0, v0 + e1), v0 + e2)
+            order = self.__build_numpy(tri_min, tri_max)
+            self.__v0 = v0[order]
+            self.__e1 = e1[order]
+            self.__e2 = e2[order]
+            self.__tri_surface = tri_surface[order]
+            self.__tri_face = tri_face[order]
+        else:
+            triangles, tri_surface, tri_face = self.__gather()
+            order = self.__build_python(triangles)
+            self.__triangles = array('d', [value for i in order for value in triangles[i * 9:(i * 9) + 9]])
+            self.__tri_surface = array('i', [tri_surface[i] for i in order])
+            self.__tri_face = array('i', [tri_face[i] for i in order])
+        self.__order = order
+
+    def __build_numpy(self, tri_min, tri_max):
+        # builds the hierarchy one level at a time where every level splits all of its nodes together, the nodes of a level
+        # are numbered after the nodes of the levels above and the children of a node are numbered next to each other
+        count = len(tri_min)
+        order = numpy.arange(count)
+        centroids = (tri_min + tri_max) * 0.5
+        padding = numpy.full((1, 3), inf)
+        levels = []
+        node_min = []
+        node_max = []
+        node_left = []
+        node_start = []
+        node_count = []
+
+        starts = numpy.zeros(1 if count > 0 else 0, dtype=numpy.int64)
+        counts = numpy.full(len(starts), count, dtype=numpy.int64)
+        first = 0
+
+        while len(starts) > 0:
+            levels.append((first, first + len(starts)))
+            ordered_min = numpy.concatenate((tri_min[order], padding))
+            ordered_max = numpy.concatenate((tri_max[order], -padding))
+            bounds_min, bounds_max = _segment_bounds(ordered_min, ordered_max, starts, counts)
+            left = numpy.full(len(starts), -1, dtype=numpy.int64)
+            node_min.append(bounds_min)
+            node_max.append(bounds_max)
+            node_left.append(left)
+            node_start.append(starts)
+            node_count.append(counts)
+            first = first + len(starts)
+
+            active = numpy.flatnonzero(counts > self.__leaf_size)
+            if len(active) == 0:
+                break
+
+            active_starts = starts[active]
+            active_counts = counts[active]
+            num_of_active = len(active)
+
+            # rows of the ordered triangles in the active nodes and the active node each row belongs to
+            segment = numpy.repeat(numpy.arange(num_of_active), active_counts)
+            offsets = numpy.cumsum(active_counts) - active_counts
+            rows = active_starts[segment] + (numpy.arange(len(segment)) - offsets[segment])
+            triangles = order[rows]
+
+            ordered_centroids = centroids[order]
+            centroid_min, centroid_max = _segment_bounds(numpy.concatenate((ordered_centroids, padding)), numpy.concatenate((ordered_centroids, -padding)),
+                                                         active_starts, active_counts)
+            extent = centroid_max - centroid_min
+
+            costs = numpy.empty((num_of_active, 3, NUM_OF_BINS - 1))
+            bins = numpy.empty((3, len(segment)), dtype=numpy.int64)
+            row_min = tri_min[triangles]
+            row_max = tri_max[triangles]
+
+            for axis in range(3):
+                with numpy.errstate(divide='ignore', invalid='ignore'):
+                    scale = numpy.where(extent[:, axis] > 0, NUM_OF_BINS / extent[:, axis], 0)
+                bin_index = ((centroids[triangles, axis] - centroid_min[segment, axis]) * scale[segment]).astype(numpy.int64)
+                numpy.clip(bin_index, 0, NUM_OF_BINS - 1, out=bin_index)
+                bins[axis] = bin_index
+                key = (segment * NUM_OF_BINS) + bin_index
+
+                bin_counts = numpy.bincount(key, minlength=num_of_active * NUM_OF_BINS).reshape(num_of_active, NUM_OF_BINS)
+                bin_min = numpy.full((3, num_of_active * NUM_OF_BINS), inf)
+                bin_max = numpy.full((3, num_of_active * NUM_OF_BINS), -inf)
+                for k in range(3):
+                    numpy.minimum.at(bin_min[k], key, row_min[:, k])
+                    numpy.maximum.at(bin_max[k], key, row_max[:, k])
+                bin_min = bin_min.T.reshape(num_of_active, NUM_OF_BINS, 3)
+                bin_max = bin_max.T.reshape(num_of_active, NUM_OF_BINS, 3)
+
+                left_size = numpy.maximum.accumulate(bin_max, axis=1)[:, :-1] - numpy.minimum.accumulate(bin_min, axis=1)[:, :-1]
+                right_size = (numpy.maximum.accumulate(bin_max[:, ::-1], axis=1)[:, ::-1] - numpy.minimum.accumulate(bin_min[:, ::-1], axis=1)[:, ::-1])[:, 1:]
+                left_count = numpy.cumsum(bin_counts, axis=1)[:, :-1]
+                right_count = active_counts[:, None] - left_count
+
+                with numpy.errstate(invalid='ignore'):
+                    cost = (_half_area(left_size[:, :, 0], left_size[:, :, 1], left_size[:, :, 2]) * left_count) + \
+                           (_half_area(right_size[:, :, 0], right_size[:, :, 1], right_size[:, :, 2]) * right_count)
+                costs[:, axis, :] = numpy.where((left_count > 0) & (right_count > 0), cost, inf)
+
+            costs = costs.reshape(num_of_active, -1)
+            best = costs.argmin(axis=1)
+            split = numpy.isfinite(costs[numpy.arange(num_of_active), best])
+            best_axis = numpy.where(split, best // (NUM_OF_BINS - 1), 0)
+            best_bin = best % (NUM_OF_BINS - 1)
+
+            # triangles of a node whose centroids all coincide are halved in their current order to keep leaves small
+            position = numpy.arange(len(segment)) - offsets[segment]
+            side = numpy.where(split[segment], bins[best_axis[segment], numpy.arange(len(segment))] > best_bin[segment],
+                               position >= (active_counts[segment] // 2))
+            order[rows] = triangles[numpy.argsort((segment * 2) + side, kind='stable')]
+
+            left_counts = numpy.bincount(segment, weights=~side, minlength=num_of_active).astype(numpy.int64)
+            left[active] = first + (2 * numpy.arange(num_of_active))
+
+            starts = numpy.empty(2 * num_of_active, dtype=numpy.int64)
+            counts = numpy.empty(2 * num_of_active, dtype=numpy.int64)
+            starts[0::2] = active_starts
+            starts[1::2] = active_starts + left_counts
+            counts[0::2] = left_counts
+            counts[1::2] = active_counts - left_counts
+
+        self.__levels = levels
+        if len(node_min) > 0:
+            self.__node_min = numpy.concatenate(node_min)
+            self.__node_max = numpy.concatenate(node_max)
+            self.__node_left = numpy.concatenate(node_left)
+            self.__node_start = numpy.concatenate(node_start)
+            self.__node_count = numpy.concatenate(node_count)
+        else:
+            self.__node_min = numpy.empty((0, 3))
+            self.__node_max = numpy.empty((0, 3))
+            self.__node_left = numpy.empty(0, dtype=numpy.int64)
+            self.__node_start = numpy.empty(0, dtype=numpy.int64)
+            self.__node_count = numpy.empty(0, dtype=numpy.int64)
+        self.__max_leaf_size = int(self.__node_count[self.__node_left < 0].max()) if len(self.__node_left) > 0 else 0
+
+        return order
+
+    @staticmethod
+    def __triangle_bounds(triangles, i):
+        v0_x, v0_y, v0_z, e1_x, e1_y, e1_z, e2_x, e2_y, e2_z = triangles[i * 9:(i * 9) + 9]
+        return ((v0_x + min(0, e1_x, e2_x), v0_y + min(0, e1_y, e2_y), v0_z + min(0, e1_z, e2_z)),
+                (v0_x + max(0, e1_x, e2_x), v0_y + max(0, e1_y, e2_y), v0_z + max(0, e1_z, e2_z)))
+
+    def __build_python(self, triangles):
+        # builds the hierarchy node by node in the same layout as __build_numpy
+        count = len(triangles) // 9
+        tri_bounds = [self.__triangle_bounds(triangles, i) for i in range(count)]
+        centroids = [tuple((low + high) * 0.5 for low, high in zip(*bounds)) for bounds in tri_bounds]
+        order = list(range(count))
+        self.__node_left = []
+        self.__node_axis = []
+        self.__node_start = []
+        self.__node_count = []
+        if count > 0:
+            self.__node_left.append(-1)
+            self.__node_axis.append(0)
+            self.__node_start.append(0)
+            self.__node_count.append(count)
+
+        node = 0
+        while node < len(self.__node_left):
+            start = self.__node_start[node]
+            size = self.__node_count[node]
+            node = node + 1
+            if size <= self.__leaf_size:
+                continue
+
+            rows = order[start:start + size]
+            centroid_min = [min(centroids[i][axis] for i in rows) for axis in range(3)]
+            centroid_max = [max(centroids[i][axis] for i in rows) for axis in range(3)]
+            best = None
+
+            for axis in range(3):
+                extent = centroid_max[axis] - centroid_min[axis]
+                if extent <= 0:
+                    continue
+                scale = NUM_OF_BINS / extent
+                bins = [min(int((centroids[i][axis] - centroid_min[axis]) * scale), NUM_OF_BINS - 1) for i in rows]
+                bin_counts = [0] * NUM_OF_BINS
+                bin_min = [[inf, inf, inf] for b in range(NUM_OF_BINS)]
+                bin_max = [[-inf, -inf, -inf] for b in range(NUM_OF_BINS)]
+                for i, b in zip(rows, bins):
+                    bin_counts[b] = bin_counts[b] + 1
+                    low, high = tri_bounds[i]
+                    for k in range(3):
+                        bin_min[b][k] = min(bin_min[b][k], low[k])
+                        bin_max[b][k] = max(bin_max[b][k], high[k])
+
+                right_areas = [0.0] * NUM_OF_BINS
+                low = [inf, inf, inf]
+                high = [-inf, -inf, -inf]
+                for b in range(NUM_OF_BINS - 1, 0, -1):
+                    low = [min(low[k], bin_min[b][k]) for k in range(3)]
+                    high = [max(high[k], bin_max[b][k]) for k in range(3)]
+                    if high[0] >= low[0]:
+                        right_areas[b] = _half_area(high[0] - low[0], high[1] - low[1], high[2] - low[2])
+
+                low = [inf, inf, inf]
+                high = [-inf, -inf, -inf]
+                left_count = 0
+                for b in range(NUM_OF_BINS - 1):
+                    low = [min(low[k], bin_min[b][k]) for k in range(3)]
+                    high = [max(high[k], bin_max[b][k]) for k in range(3)]
+                    left_count = left_count + bin_counts[b]
+                    if left_count == 0 or left_count == size:
+                        continue
+                    cost = (_half_area(high[0] - low[0], high[1] - low[1], high[2] - low[2]) * left_count) + (right_areas[b + 1] * (size - left_count))
+                    if best is None or cost < best[0]:
+                        best = (cost, axis, b, bins)
+
+            if best is None:
+                # triangles whose centroids all coincide are halved in their current order to keep leaves small
+                axis = 0
+                left_rows = rows[0:size // 2]
+            else:
+                cost, axis, split_bin, bins = best
+                left_rows = [i for i, b in zip(rows, bins) if b <= split_bin]
+                order[start:start + size] = left_rows + [i for i, b in zip(rows, bins) if b > split_bin]
+            self.__node_left[node - 1] = len(self.__node_left)
+            self.__node_axis[node - 1] = axis
+            self.__node_left.extend((-1, -1))
+            self.__node_axis.extend((0, 0))
+            self.__node_start.extend((start, start + len(left_rows)))
+            self.__node_count.extend((len(left_rows), size - len(left_rows)))
+
+        ordered_bounds = [tri_bounds[i] for i in order]
+        self.__node_min = []
+        self.__node_max = []
+        for start, size in zip(self.__node_start, self.__node_count):
+            self.__node_min.append(tuple(min(bounds[0][k] for bounds in ordered_bounds[start:start + size]) for k in range(3)))
+            self.__node_max.append(tuple(max(bounds[1][k] for bounds in ordered_bounds[start:start + size]) for k in range(3)))
+
+        return order
+
+    def refit(self):
+        """
+        Updates the triangles and the node boxes after the surfaces move, the hierarchy is rebuilt when the number of faces changes
+        """
+
+        if numpy is not None:
+            v0, e1, e2, tri_surface, tri_face = self.__gather()
+            if len(v0) != len(self.__order):
+                self.__build()
+                return
+            self.__v0 = v0[self.__order]
+            self.__e1 = e1[self.__order]
+            self.__e2 = e2[self.__order]
+            padding = numpy.full((1, 3), inf)
+            ordered_min = numpy.concatenate((numpy.minimum(numpy.minimum(self.__v0, self.__v0 + self.__e1), self.__v0 + self.__e2), padding))
+            ordered_max = numpy.concatenate((numpy.maximum(numpy.maximum(self.__v0, self.__v0 + self.__e1), self.__v0 + self.__e2), -padding))
+            for first, last in self.__levels:
+                self.__node_min[first:last], self.__node_max[first:last] = _segment_bounds(ordered_min, ordered_max, self.__node_start[first:last],
+                                                                                           self.__node_count[first:last])
+        else:
+            triangles, tri_surface, tri_face = self.__gather()
+            if len(tri_face) != len(self.__order):
+                self.__build()
+                return
+            self.__triangles = array('d', [value for i in self.__order for value in triangles[i * 9:(i * 9) + 9]])
+            ordered_bounds = [self.__triangle_bounds(self.__triangles, i) for i in range(len(self.__order))]
+            for node, (start, size) in enumerate(zip(self.__node_start, self.__node_count)):
+                self.__node_min[node] = tuple(min(bounds[0][k] for bounds in ordered_bounds[start:start + size]) for k in range(3))
+                self.__node_max[node] = tuple(max(bounds[1][k] for bounds in ordered_bounds[start:start + size]) for k in range(3))
+
+    def __ray_cast_python(self, ox, oy, oz, dx, dy, dz, max_distance):
+        # walks the hierarchy with a single ray nearest child first and returns the distance and the ordered triangle index of the nearest hit
+        inv_x = 1.0 / dx if dx != 0 else inf
+        inv_y = 1.0 / dy if dy != 0 else inf
+        inv_z = 1.0 / dz if dz != 0 else inf
+        nearest = -1
+        stack = [0] if len(self.__node_left) > 0 else []
+
+        while len(stack) > 0:
+            node = stack.pop()
+            t_near = 0.0
+            t_far = max_distance
+            for o, inv, low, high in ((ox, inv_x, self.__node_min[node][0], self.__node_max[node][0]),
+                                      (oy, inv_y, self.__node_min[node][1], self.__node_max[node][1]),
+                                      (oz, inv_z, self.__node_min[node][2], self.__node_max[node][2])):
+                if inv == inf:
+                    if o < low or o > high:
+                        t_near = inf
+                        break
+                    continue
+                t1 = (low - o) * inv
+                t2 = (high - o) * inv
+                if t1 > t2:
+                    t1, t2 = t2, t1
+                t_near = max(t_near, t1)
+                t_far = min(t_far, t2)
+            if t_near > t_far:
+                continue
+
+            left = self.__node_left[node]
+            if left < 0:
+                start = self.__node_start[node]
+                for i in range(start, start + self.__node_count[node]):
+                    t = _ray_triangle(ox, oy, oz, dx, dy, dz, self.__triangles, i)
+                    if t is not None and t <= max_distance:
+                        max_distance = t
+                        nearest = i
+            elif (dx, dy, dz)[self.__node_axis[node]] >= 0:
+                stack.append(left + 1)
+                stack.append(left)
+            else:
+                stack.append(left)
+                stack.append(left + 1)
+
+        return max_distance, nearest
+
+    def __ray_cast_numpy(self, origins, directions, max_distances):
+        # walks the hierarchy one level at a time with every pair of a ray and a node box it reaches, pairs whose box lies
+        # beyond the nearest hit of their ray so far are dropped, returns distances and ordered triangle indices of the nearest hits
+        inv_directions = (1.0 / numpy.where(directions == 0, 1e-300, directions)).T.copy()
+        origins_by_axis = origins.T.copy()
+        node_min = self.__node_min.T.copy()
+        node_max = self.__node_max.T.copy()
+        nearest_distances = max_distances.copy()
+        nearest = numpy.full(len(origins), -1, dtype=numpy.int64)
+        leaf_columns = numpy.arange(self.__max_leaf_size)
+
+        rays = numpy.arange(len(origins)) if len(self.__node_left) > 0 else numpy.empty(0, dtype=numpy.int64)
+        nodes = numpy.zeros(len(rays), dtype=numpy.int64)
+
+        while len(rays) > 0:
+            t_near = numpy.zeros(len(rays))
+            t_far = nearest_distances[rays]
+            for axis in range(3):
+                ray_origins = origins_by_axis[axis][rays]
+                ray_inv_directions = inv_directions[axis][rays]
+                t1 = (node_min[axis][nodes] - ray_origins) * ray_inv_directions
+                t2 = (node_max[axis][nodes] - ray_origins) * ray_inv_directions
+                t_near = numpy.maximum(t_near, numpy.minimum(t1, t2))
+                t_far = numpy.minimum(t_far, numpy.maximum(t1, t2))
+            reached = t_near <= t_far
+            rays = rays[reached]
+            nodes = nodes[reached]
+
+            left = self.__node_left[nodes]
+            leaf = left < 0
+
+            if leaf.any():
+                leaf_rays = rays[leaf]
+                leaf_nodes = nodes[leaf]
+                triangles = self.__node_start[leaf_nodes][:, None] + leaf_columns
+                valid = leaf_columns < self.__node_count[leaf_nodes][:, None]
+                triangles = numpy.where(valid, triangles, 0)
+                distances = _ray_triangles_many(origins[leaf_rays][:, None, :], directions[leaf_rays][:, None, :],
+                                                self.__v0[triangles], self.__e1[triangles], self.__e2[triangles])
+                distances = numpy.where(valid, distances, inf)
+                column = distances.argmin(axis=1)
+                distances = distances[numpy.arange(len(leaf_rays)), column]
+                hit = distances < inf
+                leaf_rays = leaf_rays[hit]
+                distances = distances[hit]
+                triangles = triangles[hit, column[hit]]
+
+                # a ray may hit several leaves in this level, only the nearest of them is kept
+                numpy.minimum.at(nearest_distances, leaf_rays, distances)
+                closer = distances == nearest_distances[leaf_rays]
+                nearest[leaf_rays[closer]] = triangles[closer]
+
+            inner = ~leaf
+            rays = numpy.repeat(rays[inner], 2)
+            nodes = numpy.repeat(left[inner], 2)
+            nodes[1::2] += 1
+
+        return nearest_distances, nearest
+
+    def ray_cast(self, origin, direction, max_distance=inf):
+        """
+        Casts a ray from origin along direction and returns the nearest hit within max_distance as a tuple of hit point as
+        OPoint3D, surface, face index and distance from origin or None when the ray misses every surface
+        """
+
+        unit = _unit_ray(direction)
+
+        if unit is None:
+            return None
+
+        if numpy is not None:
+            distances, nearest = self.__ray_cast_numpy(numpy.array([(origin[0], origin[1], origin[2])], dtype=numpy.float64),
+                                                       numpy.array([unit], dtype=numpy.float64), numpy.array([max_distance], dtype=numpy.float64))
+            distance = float(distances[0])
+            nearest = int(nearest[0])
+        else:
+            distance, nearest = self.__ray_cast_python(origin[0], origin[1], origin[2], unit[0], unit[1], unit[2], max_distance)
+
+        if nearest < 0:
+            return None
+
+        return (OPoint3D(origin[0] + (distance * unit[0]), origin[1] + (distance * unit[1]), origin[2] + (distance * unit[2])),
+                self.__surfaces[self.__tri_surface[nearest]], int(self.__tri_face[nearest]), distance)
+
+    def ray_cast_many(self, origins, directions, max_distance=inf):
+        """
+        Casts many rays given as N x 3 buffers of origins and directions, either of which may be a single point or direction
+        shared by all the rays, and returns distances, surface indices and face indices of the nearest hits within max_distance
+        where misses are NaN and -1
+        """
+
+        if numpy is not None:
+            origins = numpy.asarray(origins, dtype=numpy.float64).reshape(-1, 3)
+            directions = numpy.asarray(directions, dtype=numpy.float64).reshape(-1, 3)
+            origins, directions = numpy.broadcast_arrays(origins, directions)
+            lengths = numpy.sqrt((directions * directions).sum(axis=1))
+            valid = lengths != 0
+            with numpy.errstate(divide='ignore', invalid='ignore'):
+                directions = numpy.where(valid[:, None], directions / lengths[:, None], 0)
+            origins = numpy.ascontiguousarray(origins)
+            max_distances = numpy.where(valid, max_distance, -inf)
+
+            distances = numpy.full(len(origins), nan)
+            surface_indices = numpy.full(len(origins), -1, dtype=numpy.int32)
+            face_indices = numpy.full(len(origins), -1, dtype=numpy.int32)
+
+            for start in range(0, len(origins), RAY_CHUNK_SIZE):
+                end = start + RAY_CHUNK_SIZE
+                chunk_distances, nearest = self.__ray_cast_numpy(origins[start:end], directions[start:end], max_distances[start:end])
+                hit = nearest >= 0
+                distances[start:end][hit] = chunk_distances[hit]
+                surface_indices[start:end][hit] = self.__tri_surface[nearest[hit]]
+                face_indices[start:end][hit] = self.__tri_face[nearest[hit]]
+
+            return distances, surface_indices, face_indices
+
+        if len(origins) == 3 and not hasattr(origins[0], '__len__'):
+            origins = [origins] * len(directions)
+        elif len(directions) == 3 and not hasattr(directions[0], '__len__'):
+            directions = [directions] * len(origins)
+
+        distances = array('d')
+        surface_indices = array('i')
+        face_indices = array('i')
+        for origin, direction in zip(origins, directions):
+            unit = _unit_ray(direction)
+            nearest = -1
+            if unit is not None:
+                distance, nearest = self.__ray_cast_python(origin[0], origin[1], origin[2], unit[0], unit[1], unit[2], max_distance)
+            if nearest < 0:
+                distances.append(nan)
+                surface_indices.append(-1)
+                face_indices.append(-1)
+            else:
+                distances.append(distance)
+                surface_indices.append(self.__tri_surface[nearest])
+                face_indices.append(self.__tri_face[nearest])
+        return distances, surface_indices, face_indices
+
+    def __len__(self):
+        return len(self.__tri_face)
@@ -0,0 +1,18 @@
+import sys
+import pytest
+
+
+@pytest.fixture(params=['numpy', 'array'])
+def backend(request, monkeypatch):
+    """
+    Runs a test once with the NumPy buffers and once with the array('d') fallback of every obosthan module
+    """
+
+    modules = [module for name, module in list(sys.modules.items()) if name.startswith('obosthan.') and hasattr(module, 'numpy')]
+    if request.param == 'numpy':
+        if any(module.numpy is None for module in modules):
+            pytest.skip('NumPy is not installed')
+    else:
+        for module in modules:
+            monkeypatch.setattr(module, 'numpy', None)
+    return request.param
@@ -0,0 +1,219 @@
+# Copyright (c) 2018-2019, Md Imam Hossain (emamhd at gmail dot com)
+# see LICENSE.txt for details
+
+
+"""
+2D convex hull routines
+"""
+
+from bisect import bisect_left
+from .point2d import OPoint2D
+from .pointarray2d import OPointArray2D
+from .polygon import OPolygon
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _sorted_points(points):
+    # returns unique points as (x, y) tuples sorted by X and then Y from a list of points, an OPointArray2D, an OPolygon or an N x 2 array
+    if type(points) is OPolygon:
+        xs, ys = points.coord_lists
+    elif type(points) is OPointArray2D:
+        xs, ys = points.x, points.y
+    elif numpy is not None and type(points) is numpy.ndarray:
+        points = points.reshape(-1, 2)
+        xs, ys = points[:, 0], points[:, 1]
+    elif type(points) is list or type(points) is tuple:
+        xs = [point[0] for point in points]
+        ys = [point[1] for point in points]
+    else:
+        return []
+
+    if numpy is not None:
+        xs = numpy.asarray(xs, dtype=numpy.float64)
+        ys = numpy.asarray(ys, dtype=numpy.float64)
+        order = numpy.lexsort((ys, xs))
+        xs = xs[order]
+        ys = ys[order]
+        if len(xs) > 1:
+            unique = numpy.concatenate(((True,), (xs[1:] != xs[:-1]) | (ys[1:] != ys[:-1])))
+            xs = xs[unique]
+            ys = ys[unique]
+        return list(zip(xs.tolist(), ys.tolist()))
+
+    return sorted(set(zip(xs, ys)))
+
+def _chain(points):
+    # returns the chain of the monotone chain algorithm which turns left through points sorted along X
+    chain = []
+    for point in points:
+        while len(chain) > 1 and (((chain[-1][0] - chain[-2][0]) * (point[1] - chain[-2][1])) - ((chain[-1][1] - chain[-2][1]) * (point[0] - chain[-2][0]))) <= 0:
+            chain.pop()
+        chain.append(point)
+    return chain
+
+def oconvex_hull(points):
+    """
+    Finds convex hull of points given as a list of points, an OPointArray2D, an OPolygon or an N x 2 array using the monotone chain algorithm
+    in O(n log n) and returns it as an OPolygon with anticlockwise vertices, collinear points on the hull sides are left out
+    """
+
+    points = _sorted_points(points)
+
+    if len(points) < 3:
+        return OPolygon(points)
+
+    lower = _chain(points)
+    upper = _chain(reversed(points))
+
+    return OPolygon(lower[:-1] + upper[:-1])
+
+
+class OConvexHull2D:
+    """
+    A convex hull object which grows as points are added one at a time. The hull is kept as a lower and an upper chain of vertices sorted
+    along X, so that a point inside the hull is rejected after a binary search in O(log h) and a point outside it is inserted by removing
+    only the vertices it hides. Instance variables such as num_of_points and polygon give number of hull vertices and the hull as an OPolygon.
+    """
+
+    def __init__(self, points=None):
+        self.__lower = []
+        self.__upper = []
+        self.__polygon = None
+        if points is not None:
+            self.add_points(points)
+
+    @property
+    def num_of_points(self):
+        lower_count = len(self.__lower)
+        if lower_count < 2:
+            return lower_count
+        return lower_count + len(self.__upper) - 2
+
+    @property
+    def polygon(self):
+        """
+        Returns the hull as an OPolygon with anticlockwise vertices
+        """
+
+        if self.__polygon is None:
+            self.__polygon = OPolygon(self.get_points())
+
+        return self.__polygon
+
+    def get_points(self):
+        """
+        Returns the hull vertices anticlockwise as a list of (x, y) tuples
+        """
+
+        if len(self.__lower) < 2:
+            return list(self.__lower)
+
+        return self.__lower[:-1] + self.__upper[:0:-1]
+
+    def __insert(self, chain, point, turn):
+        # inserts a point into a chain which turns left (turn 1) or right (turn -1), returns False when the point lies inside the chain
+        i = bisect_left(chain, point)
+        count = len(chain)
+
+        if i < count and chain[i] == point:
+            return False
+
+        if 0 < i < count:
+            a = chain[i - 1]
+            b = chain[i]
+            if turn * (((b[0] - a[0]) * (point[1] - a[1])) - ((b[1] - a[1]) * (point[0] - a[0]))) >= 0:
+                return False
+
+        chain.insert(i, point)
+
+        while i + 2 < len(chain):
+            a = chain[i + 1]
+            b = chain[i + 2]
+            if turn * (((a[0] - point[0]) * (b[1] - point[1])) - ((a[1] - point[1]) * (b[0] - point[0]))) > 0:
+                break
+            del chain[i + 1]
+
+        while i > 1:
+            a = chain[i - 2]
+            b = chain[i - 1]
+            if turn * (((b[0] - a[0]) * (point[1] - a[1])) - ((b[1] - a[1]) * (point[0] - a[0]))) > 0:
+                break
+            del chain[i - 1]
+            i -= 1
+
+        return True
+
+    def add_point(self, _x, _y):
+        """
+        Adds a single point and returns True when the hull changed
+        """
+
+        if _x is not None and _y is not None:
+            point = (float(_x), float(_y))
+            lower_changed = self.__insert(self.__lower, point, 1)
+            upper_changed = self.__insert(self.__upper, point, -1)
+            if lower_changed or upper_changed:
+                self.__polygon = None
+                return True
+
+        return False
+
+    def add_points(self, points):
+        """
+        Adds points given in any form accepted by oconvex_hull, the hull is rebuilt with the monotone chain algorithm when it is empty
+        """
+
+        if len(self.__lower) == 0:
+            points = _sorted_points(points)
+            if len(points) > 0:
+                self.__lower = _chain(points)
+                self.__upper = _chain(reversed(points))[::-1]
+                self.__polygon = None
+        else:
+            for point in _sorted_points(points):
+                self.add_point(point[0], point[1])
+
+    def contains(self, point):
+        """
+        Checks whether a point lies inside the hull or on its sides in O(log h)
+        """
+
+        if type(point) is tuple or type(point) is list or type(point) is OPoint2D:
+
+            if len(point) == 2:
+
+                point = (point[0], point[1])
+
+                for chain, turn in ((self.__lower, 1), (self.__upper, -1)):
+                    count = len(chain)
+                    if count == 0:
+                        return False
+                    i = bisect_left(chain, point)
+                    if i < count and chain[i] == point:
+                        continue
+                    if i == 0 or i == count:
+                        return False
+                    a = chain[i - 1]
+                    b = chain[i]
+                    if turn * (((b[0] - a[0]) * (point[1] - a[1])) - ((b[1] - a[1]) * (point[0] - a[0]))) < 0:
+                        return False
+
+                return True
+
+        return None
+
+    def clear(self):
+        """
+        Removes all the points from the hull
+        """
+
+        self.__lower = []
+        self.__upper = []
+        self.__polygon = None
+
+    def __len__(self):
+        return self.num_of_points
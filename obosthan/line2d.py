@@ -8,22 +8,26 @@
 
 from math import sin, cos, radians, dist, sqrt
 from .point2d import OPoint2D
+from .affine2d import OAffine2D
 
 class OLine2D:
     """
     A definite line object in 2D space
     Instance variable such as length contains length of the line.
+    Transformations are composed into a pending affine transformation which is applied to the end points only when they are read.
     """
 
     def __init__(self, _x1, _y1, _x2, _y2):
         self.__coord = [_x1, _y1, _x2, _y2]
         self.__length = self.__cal_length()
+        self.__pending = None
 
     def __cal_length(self):
         return (((self.__coord[2]-self.__coord[0])**2) + ((self.__coord[3]-self.__coord[1])**2))**0.5
 
     @property
     def length(self):
+        self.__materialise()
         return self.__length
 
     def copy(self):
@@ -31,6 +35,8 @@ class OLine2D:
         Returns a copy of the line object
         """
 
+        self.__materialise()
+
         return OLine2D(self.__coord[0], self.__coord[1], self.__coord[2], self.__coord[3])
 
     def get_points(self):
@@ -38,6 +44,8 @@ class OLine2D:
         Returns end points of the line as two points in a tuple
         """
 
+        self.__materialise()
+
         return (OPoint2D(self.__coord[0], self.__coord[1]), OPoint2D(self.__coord[2], self.__coord[3]))
 
     def distance_to_point(self, point):
@@ -45,6 +53,8 @@ class OLine2D:
         Returns perpendicular distance to a point
         """
 
+        self.__materialise()
+
         tri_a = dist((self.__coord[0], self.__coord[1]), point)
         tri_b = dist((self.__coord[0], self.__coord[1]), (self.__coord[2], self.__coord[3]))
         tri_c = dist((self.__coord[2], self.__coord[3]), point)
@@ -56,35 +66,104 @@ class OLine2D:
         else:
             return None
 
+    def distance_sq_to(self, point):
+        """
+        Returns squared distance from a point to the nearest point of the line without taking a square root
+        """
+
+        if type(point) is tuple or type(point) is list or type(point) is OPoint2D:
+
+            if len(point) == 2:
+
+                self.__materialise()
+
+                x1, y1, x2, y2 = self.__coord
+                line_x = x2 - x1
+                line_y = y2 - y1
+                point_x = point[0] - x1
+                point_y = point[1] - y1
+                length_sq = (line_x*line_x) + (line_y*line_y)
+
+                if length_sq != 0:
+                    t = ((point_x*line_x) + (point_y*line_y)) / length_sq
+                    if t > 1:
+                        t = 1
+                    elif t < 0:
+                        t = 0
+                    point_x = point_x - (t*line_x)
+                    point_y = point_y - (t*line_y)
+
+                return (point_x*point_x) + (point_y*point_y)
+
+        return None
+
+    def within_radius(self, point, radius):
+        """
+        Checks whether a point lies within a radius of the line by comparing squared distances
+        """
+
+        distance_sq = self.distance_sq_to(point)
+
+        if distance_sq is not None:
+            return distance_sq <= radius*radius
+        else:
+            return None
+
+    def __materialise(self):
+        if self.__pending is not None:
+            a, b, c, d, e, f = self.__pending.matrix
+            x1, y1, x2, y2 = self.__coord
+            self.__coord[0] = (a * x1) + (b * y1) + c
+            self.__coord[1] = (d * x1) + (e * y1) + f
+            self.__coord[2] = (a * x2) + (b * y2) + c
+            self.__coord[3] = (d * x2) + (e * y2) + f
+            self.__pending = None
+            self.__length = self.__cal_length()
+
+    def __apply(self, a, b, c, d, e, f):
+        # composes x' = ax + by + c, y' = dx + ey + f into the pending transformation
+        if self.__pending is None:
+            self.__pending = OAffine2D((a, b, c, d, e, f))
+        else:
+            self.__pending.transform((a, b, c, d, e, f))
+
+    def __apply_about(self, a, b, d, e, origin):
+        # applies the linear part (a, b, d, e) about an origin point instead of about (0, 0)
+        self.__apply(a, b, origin[0] - (a * origin[0]) - (b * origin[1]), d, e, origin[1] - (d * origin[0]) - (e * origin[1]))
+
+    def __cal_centroid(self):
+        centroid = (((self.__coord[2]-self.__coord[0])/2)+self.__coord[0], ((self.__coord[3]-self.__coord[1])/2)+self.__coord[1])
+
+        if self.__pending is not None:
+            centroid = tuple(self.__pending.apply(centroid))
+
+        return centroid
+
+    def apply_affine(self, affine):
+        """
+        Applies an OAffine2D transformation or the top two rows of a 3x3 matrix (a, b, c, d, e, f) to the line vertices,
+        the vertices are only recalculated when they are read
+        """
+
+        if type(affine) is OAffine2D or ((type(affine) is tuple or type(affine) is list) and len(affine) == 6):
+            self.__apply(affine[0], affine[1], affine[2], affine[3], affine[4], affine[5])
+
     def translate(self, x, y):
         """
         Moves the line in space along X and Y axes by amounts defined by x and y arguments
         """
 
-        self.__coord[0] = self.__coord[0] + x
-        self.__coord[1] = self.__coord[1] + y
-        self.__coord[2] = self.__coord[2] + x
-        self.__coord[3] = self.__coord[3] + y
+        self.__apply(1, 0, x, 0, 1, y)
 
     def rotate_centroid(self, angle):
         """
         Rotates the polygon by degrees about it's centroid
         """
 
-        old_centroid = (((self.__coord[2]-self.__coord[0])/2)+self.__coord[0], ((self.__coord[3]-self.__coord[1])/2)+self.__coord[1])
-
-        self.translate(-old_centroid[0], -old_centroid[1])
-
-        old_coord_x = self.__coord[0]
-        old_coord_y = self.__coord[1]
-        self.__coord[0] = (cos(radians(angle)) * old_coord_x) - (sin(radians(angle)) * old_coord_y)
-        self.__coord[1] = (sin(radians(angle)) * old_coord_x) + (cos(radians(angle)) * old_coord_y)
-        old_coord_x = self.__coord[2]
-        old_coord_y = self.__coord[3]
-        self.__coord[2] = (cos(radians(angle)) * old_coord_x) - (sin(radians(angle)) * old_coord_y)
-        self.__coord[3] = (sin(radians(angle)) * old_coord_x) + (cos(radians(angle)) * old_coord_y)
+        cos_angle = cos(radians(angle))
+        sin_angle = sin(radians(angle))
 
-        self.translate(old_centroid[0], old_centroid[1])
+        self.__apply_about(cos_angle, -sin_angle, sin_angle, cos_angle, self.__cal_centroid())
 
     def rotate_point(self, angle, point):
         """
@@ -95,19 +174,10 @@ class OLine2D:
 
             if len(point) == 2:
 
-                origin = (point[0], point[1])
-                self.translate(-origin[0], -origin[1])
+                cos_angle = cos(radians(angle))
+                sin_angle = sin(radians(angle))
 
-                old_coord_x = self.__coord[0]
-                old_coord_y = self.__coord[1]
-                self.__coord[0] = (cos(radians(angle)) * old_coord_x) - (sin(radians(angle)) * old_coord_y)
-                self.__coord[1] = (sin(radians(angle)) * old_coord_x) + (cos(radians(angle)) * old_coord_y)
-                old_coord_x = self.__coord[2]
-                old_coord_y = self.__coord[3]
-                self.__coord[2] = (cos(radians(angle)) * old_coord_x) - (sin(radians(angle)) * old_coord_y)
-                self.__coord[3] = (sin(radians(angle)) * old_coord_x) + (cos(radians(angle)) * old_coord_y)
-
-                self.translate(origin[0], origin[1])
+                self.__apply_about(cos_angle, -sin_angle, sin_angle, cos_angle, point)
 
     def transform(self, matrix):
         """
@@ -118,18 +188,7 @@ class OLine2D:
 
             if len(matrix) == 4:
 
-                old_centroid = (((self.__coord[2] - self.__coord[0]) / 2) + self.__coord[0], ((self.__coord[3] - self.__coord[1]) / 2) + self.__coord[1])
-
-                self.translate(-old_centroid[0], -old_centroid[1])
-
-                old_point = (self.__coord[0], self.__coord[1])
-                self.__coord[0] = (old_point[0] * matrix[0]) + (old_point[1] * matrix[1])
-                self.__coord[1] = (old_point[0] * matrix[2]) + (old_point[1] * matrix[3])
-                old_point = (self.__coord[2], self.__coord[3])
-                self.__coord[2] = (old_point[0] * matrix[0]) + (old_point[1] * matrix[1])
-                self.__coord[3] = (old_point[0] * matrix[2]) + (old_point[1] * matrix[3])
-
-                self.translate(old_centroid[0], old_centroid[1])
+                self.__apply_about(matrix[0], matrix[1], matrix[2], matrix[3], self.__cal_centroid())
 
     def transform_point(self, matrix, point):
         """
@@ -140,36 +199,14 @@ class OLine2D:
 
             if len(matrix) == 4 and len(point) == 2:
 
-                old_centroid = (point[0], point[1])
-
-                self.translate(-old_centroid[0], -old_centroid[1])
-
-                old_point = (self.__coord[0], self.__coord[1])
-                self.__coord[0] = (old_point[0] * matrix[0]) + (old_point[1] * matrix[1])
-                self.__coord[1] = (old_point[0] * matrix[2]) + (old_point[1] * matrix[3])
-                old_point = (self.__coord[2], self.__coord[3])
-                self.__coord[2] = (old_point[0] * matrix[0]) + (old_point[1] * matrix[1])
-                self.__coord[3] = (old_point[0] * matrix[2]) + (old_point[1] * matrix[3])
-
-                self.translate(old_centroid[0], old_centroid[1])
+                self.__apply_about(matrix[0], matrix[1], matrix[2], matrix[3], point)
 
     def scale(self, x, y):
         """
         Applies a scale transformation to the line vertices about it's centroid
         """
 
-        old_centroid = (((self.__coord[2] - self.__coord[0]) / 2) + self.__coord[0], ((self.__coord[3] - self.__coord[1]) / 2) + self.__coord[1])
-
-        self.translate(-old_centroid[0], -old_centroid[1])
-
-        old_point = (self.__coord[0], self.__coord[1])
-        self.__coord[0] = (old_point[0] * x) + (old_point[1] * 0)
-        self.__coord[1] = (old_point[0] * 0) + (old_point[1] * y)
-        old_point = (self.__coord[2], self.__coord[3])
-        self.__coord[2] = (old_point[0] * x) + (old_point[1] * 0)
-        self.__coord[3] = (old_point[0] * 0) + (old_point[1] * y)
-
-        self.translate(old_centroid[0], old_centroid[1])
+        self.__apply_about(x, 0, 0, y, self.__cal_centroid())
 
     def scale_point(self, x, y, point):
         """
@@ -180,36 +217,14 @@ class OLine2D:
 
             if len(point) == 2:
 
-                old_centroid = (point[0], point[1])
-
-                self.translate(-old_centroid[0], -old_centroid[1])
-
-                old_point = (self.__coord[0], self.__coord[1])
-                self.__coord[0] = (old_point[0] * x) + (old_point[1] * 0)
-                self.__coord[1] = (old_point[0] * 0) + (old_point[1] * y)
-                old_point = (self.__coord[2], self.__coord[3])
-                self.__coord[2] = (old_point[0] * x) + (old_point[1] * 0)
-                self.__coord[3] = (old_point[0] * 0) + (old_point[1] * y)
-
-                self.translate(old_centroid[0], old_centroid[1])
+                self.__apply_about(x, 0, 0, y, point)
 
     def shear(self, x, y):
         """
         Applies a shear transformation to the line vertices about it's centroid
         """
 
-        old_centroid = (((self.__coord[2] - self.__coord[0]) / 2) + self.__coord[0], ((self.__coord[3] - self.__coord[1]) / 2) + self.__coord[1])
-
-        self.translate(-old_centroid[0], -old_centroid[1])
-
-        old_point = (self.__coord[0], self.__coord[1])
-        self.__coord[0] = (old_point[0] * 1) + (old_point[1] * x)
-        self.__coord[1] = (old_point[0] * y) + (old_point[1] * 1)
-        old_point = (self.__coord[2], self.__coord[3])
-        self.__coord[2] = (old_point[0] * 1) + (old_point[1] * x)
-        self.__coord[3] = (old_point[0] * y) + (old_point[1] * 1)
-
-        self.translate(old_centroid[0], old_centroid[1])
+        self.__apply_about(1, x, y, 1, self.__cal_centroid())
 
     def shear_point(self, x, y, point):
         """
@@ -220,23 +235,14 @@ class OLine2D:
 
             if len(point) == 2:
 
-                old_centroid = (point[0], point[1])
-
-                self.translate(-old_centroid[0], -old_centroid[1])
-
-                old_point = (self.__coord[0], self.__coord[1])
-                self.__coord[0] = (old_point[0] * 1) + (old_point[1] * x)
-                self.__coord[1] = (old_point[0] * y) + (old_point[1] * 1)
-                old_point = (self.__coord[2], self.__coord[3])
-                self.__coord[2] = (old_point[0] * 1) + (old_point[1] * x)
-                self.__coord[3] = (old_point[0] * y) + (old_point[1] * 1)
-
-                self.translate(old_centroid[0], old_centroid[1])
+                self.__apply_about(1, x, y, 1, point)
 
     def __iter__(self):
+        self.__materialise()
         return iter(self.__coord)
 
     def __setitem__(self, i, val):
+        self.__materialise()
         if type(val) is float or type(val) is int:
             self.__coord[i] = val
         elif type(val) is OLine2D or (type(val) is list and len(val) == 4):
@@ -250,10 +256,13 @@ class OLine2D:
         self.__length = (((self.__coord[2]-self.__coord[0])**2) + ((self.__coord[3]-self.__coord[1])**2))**0.5
 
     def __getitem__(self, i):
+        if self.__pending is not None:
+            self.__materialise()
         return self.__coord[i]
 
     def __len__(self):
         return len(self.__coord)
 
     def __repr__(self):
+        self.__materialise()
         return str(self.__coord)
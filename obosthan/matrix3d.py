@@ -0,0 +1,409 @@
+# Copyright (c) 2023, Md Imam Hossain (emamhd at gmail dot com)
+# see LICENSE.txt for details
+
+
+"""
+3D transformation matrix objects
+"""
+
+from math import sin, cos, radians
+from .point3d import OPoint3D
+from .quaternion import OQuaternion
+
+
+def _rotation_matrix(angle_x, angle_y, angle_z):
+    # composes the rotations by degrees about the X axis, then the Y axis and then the Z axis into one row major 3x3 matrix
+    cos_x = cos(radians(angle_x))
+    sin_x = sin(radians(angle_x))
+    cos_y = cos(radians(angle_y))
+    sin_y = sin(radians(angle_y))
+    cos_z = cos(radians(angle_z))
+    sin_z = sin(radians(angle_z))
+    return (cos_z * cos_y, (cos_z * sin_y * sin_x) - (sin_z * cos_x), (cos_z * sin_y * cos_x) + (sin_z * sin_x),
+            sin_z * cos_y, (sin_z * sin_y * sin_x) + (cos_z * cos_x), (sin_z * sin_y * cos_x) - (cos_z * sin_x),
+            -sin_y, cos_y * sin_x, cos_y * cos_x)
+
+def _multiply(a, b, size):
+    # returns the row major product of two square row major matrices
+    return tuple(sum(a[(row * size) + k] * b[(k * size) + column] for k in range(size)) for row in range(size) for column in range(size))
+
+def _homogeneous(matrix):
+    # returns the row major 4x4 matrix of a 3x3 matrix, the top three rows of a 4x4 matrix, a 4x4 matrix or a quaternion
+    if type(matrix) is OQuaternion:
+        matrix = matrix.matrix
+    if len(matrix) == 9:
+        return (matrix[0], matrix[1], matrix[2], 0, matrix[3], matrix[4], matrix[5], 0, matrix[6], matrix[7], matrix[8], 0, 0, 0, 0, 1)
+    elif len(matrix) == 12:
+        return tuple(matrix) + (0, 0, 0, 1)
+    elif len(matrix) == 16:
+        return tuple(matrix)
+    else:
+        return None
+
+
+class OMatrix3D:
+    """
+    A 3x3 matrix object which stores a linear 3D transformation as a row major tuple where x' = ax + by + cz,
+    y' = dx + ey + fz and z' = gx + hy + iz.
+    Transformations such as rotate, scale and shear are composed onto the matrix so that they are applied after the ones
+    already composed. Instance variables such as determinant and inverse are calculated on first access and cached until
+    the matrix changes.
+    """
+
+    def __init__(self, matrix=(1, 0, 0, 0, 1, 0, 0, 0, 1)):
+        self.__matrix = (1, 0, 0, 0, 1, 0, 0, 0, 1)
+        self.__inverse = None
+        self.define_matrix(matrix)
+
+    @property
+    def matrix(self):
+        return self.__matrix
+
+    @property
+    def determinant(self):
+        a, b, c, d, e, f, g, h, i = self.__matrix
+        return (a * ((e * i) - (f * h))) - (b * ((d * i) - (f * g))) + (c * ((d * h) - (e * g)))
+
+    @property
+    def inverse(self):
+        """
+        Returns the inverse transformation as a new object or None when the matrix is singular, only the inverse matrix is
+        cached so changing the returned object does not change the cache
+        """
+
+        if self.__inverse is None:
+            det = self.determinant
+            if det == 0:
+                return None
+            a, b, c, d, e, f, g, h, i = self.__matrix
+            self.__inverse = (((e * i) - (f * h)) / det, ((c * h) - (b * i)) / det, ((b * f) - (c * e)) / det,
+                              ((f * g) - (d * i)) / det, ((a * i) - (c * g)) / det, ((c * d) - (a * f)) / det,
+                              ((d * h) - (e * g)) / det, ((b * g) - (a * h)) / det, ((a * e) - (b * d)) / det)
+
+        return OMatrix3D(self.__inverse)
+
+    @property
+    def transpose(self):
+        a, b, c, d, e, f, g, h, i = self.__matrix
+        return OMatrix3D((a, d, g, b, e, h, c, f, i))
+
+    @property
+    def quaternion(self):
+        """
+        Returns the rotation of the matrix as a quaternion, the matrix is expected to be a rotation
+        """
+
+        new_quaternion = OQuaternion()
+        new_quaternion.define_matrix(self.__matrix)
+        return new_quaternion
+
+    def is_identity(self):
+        return self.__matrix == (1, 0, 0, 0, 1, 0, 0, 0, 1)
+
+    def define_matrix(self, matrix):
+        """
+        Alters the transformation to a row major 3x3 matrix, another OMatrix3D or the rotation of an OQuaternion
+        """
+
+        if type(matrix) is OQuaternion:
+            self.__matrix = matrix.matrix
+        elif (type(matrix) is tuple or type(matrix) is list or type(matrix) is OMatrix3D) and len(matrix) == 9:
+            self.__matrix = tuple(matrix)
+        else:
+            return
+
+        self.__inverse = None
+
+    def reset(self):
+        """
+        Alters the transformation to identity
+        """
+
+        self.__matrix = (1, 0, 0, 0, 1, 0, 0, 0, 1)
+        self.__inverse = None
+
+    def copy(self):
+        """
+        Returns a copy of the transformation object
+        """
+
+        return OMatrix3D(self.__matrix)
+
+    def transform(self, matrix):
+        """
+        Composes a matrix transformation given in any form accepted by define_matrix after the current transformation
+        """
+
+        if type(matrix) is OQuaternion:
+            other = matrix.matrix
+        elif (type(matrix) is tuple or type(matrix) is list or type(matrix) is OMatrix3D) and len(matrix) == 9:
+            other = matrix
+        else:
+            return
+
+        self.__matrix = _multiply(other, self.__matrix, 3)
+        self.__inverse = None
+
+    def rotate(self, angle_x, angle_y, angle_z):
+        """
+        Composes rotations by degrees about the X axis, then the Y axis and then the Z axis after the current transformation
+        """
+
+        self.transform(_rotation_matrix(angle_x, angle_y, angle_z))
+
+    def rotate_axis(self, axis, angle):
+        """
+        Composes a rotation by degrees (anticlockwise) about an axis given as a 3D vector after the current transformation
+        """
+
+        rotation = OQuaternion()
+        rotation.define_axis_angle(axis, angle)
+        self.transform(rotation)
+
+    def scale(self, x, y, z):
+        """
+        Composes a scale about origin after the current transformation
+        """
+
+        self.transform((x, 0, 0, 0, y, 0, 0, 0, z))
+
+    def shear(self, xy, yx, xz, zx, yz, zy):
+        """
+        Composes a shear about origin after the current transformation
+        """
+
+        self.transform((1, yx, zx, xy, 1, zy, xz, yz, 1))
+
+    def apply(self, point):
+        """
+        Returns a new point which is the transformed copy of a point
+        """
+
+        a, b, c, d, e, f, g, h, i = self.__matrix
+        return OPoint3D((a * point[0]) + (b * point[1]) + (c * point[2]),
+                        (d * point[0]) + (e * point[1]) + (f * point[2]),
+                        (g * point[0]) + (h * point[1]) + (i * point[2]))
+
+    def __iter__(self):
+        return iter(self.__matrix)
+
+    def __getitem__(self, i):
+        return self.__matrix[i]
+
+    def __len__(self):
+        return 9
+
+    def __repr__(self):
+        return str([list(self.__matrix[0:3]), list(self.__matrix[3:6]), list(self.__matrix[6:9])])
+
+    def __mul__(self, other):
+        if type(other) is OMatrix3D:
+            new_matrix = other.copy()
+            new_matrix.transform(self)
+            return new_matrix
+        elif type(other) is OPoint3D or ((type(other) is list or type(other) is tuple) and len(other) == 3):
+            return self.apply(other)
+        else:
+            return self
+
+
+class OMatrix4D:
+    """
+    A 4x4 matrix object which stores a homogeneous 3D transformation as a row major tuple, points are divided by the
+    transformed w coordinate whenever the last row is not (0, 0, 0, 1).
+    Transformations such as translate, rotate and scale are composed onto the matrix so that they are applied after the
+    ones already composed. Instance variables such as determinant and inverse are calculated on first access and cached
+    until the matrix changes.
+    """
+
+    def __init__(self, matrix=(1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1)):
+        self.__matrix = (1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1)
+        self.__inverse = None
+        self.define_matrix(matrix)
+
+    @property
+    def matrix(self):
+        return self.__matrix
+
+    def __sub_determinants(self):
+        # 2x2 determinants of the top two rows and of the bottom two rows used by both determinant and inverse
+        m = self.__matrix
+        top = ((m[0] * m[5]) - (m[1] * m[4]), (m[0] * m[6]) - (m[2] * m[4]), (m[0] * m[7]) - (m[3] * m[4]),
+               (m[1] * m[6]) - (m[2] * m[5]), (m[1] * m[7]) - (m[3] * m[5]), (m[2] * m[7]) - (m[3] * m[6]))
+        bottom = ((m[8] * m[13]) - (m[9] * m[12]), (m[8] * m[14]) - (m[10] * m[12]), (m[8] * m[15]) - (m[11] * m[12]),
+                  (m[9] * m[14]) - (m[10] * m[13]), (m[9] * m[15]) - (m[11] * m[13]), (m[10] * m[15]) - (m[11] * m[14]))
+        return top, bottom
+
+    @property
+    def determinant(self):
+        s, c = self.__sub_determinants()
+        return (s[0] * c[5]) - (s[1] * c[4]) + (s[2] * c[3]) + (s[3] * c[2]) - (s[4] * c[1]) + (s[5] * c[0])
+
+    @property
+    def inverse(self):
+        """
+        Returns the inverse transformation as a new object or None when the matrix is singular, only the inverse matrix is
+        cached so changing the returned object does not change the cache
+        """
+
+        if self.__inverse is None:
+            s, c = self.__sub_determinants()
+            det = (s[0] * c[5]) - (s[1] * c[4]) + (s[2] * c[3]) + (s[3] * c[2]) - (s[4] * c[1]) + (s[5] * c[0])
+            if det == 0:
+                return None
+            m = self.__matrix
+            self.__inverse = (((m[5] * c[5]) - (m[6] * c[4]) + (m[7] * c[3])) / det,
+                              ((-m[1] * c[5]) + (m[2] * c[4]) - (m[3] * c[3])) / det,
+                              ((m[13] * s[5]) - (m[14] * s[4]) + (m[15] * s[3])) / det,
+                              ((-m[9] * s[5]) + (m[10] * s[4]) - (m[11] * s[3])) / det,
+                              ((-m[4] * c[5]) + (m[6] * c[2]) - (m[7] * c[1])) / det,
+                              ((m[0] * c[5]) - (m[2] * c[2]) + (m[3] * c[1])) / det,
+                              ((-m[12] * s[5]) + (m[14] * s[2]) - (m[15] * s[1])) / det,
+                              ((m[8] * s[5]) - (m[10] * s[2]) + (m[11] * s[1])) / det,
+                              ((m[4] * c[4]) - (m[5] * c[2]) + (m[7] * c[0])) / det,
+                              ((-m[0] * c[4]) + (m[1] * c[2]) - (m[3] * c[0])) / det,
+                              ((m[12] * s[4]) - (m[13] * s[2]) + (m[15] * s[0])) / det,
+                              ((-m[8] * s[4]) + (m[9] * s[2]) - (m[11] * s[0])) / det,
+                              ((-m[4] * c[3]) + (m[5] * c[1]) - (m[6] * c[0])) / det,
+                              ((m[0] * c[3]) - (m[1] * c[1]) + (m[2] * c[0])) / det,
+                              ((-m[12] * s[3]) + (m[13] * s[1]) - (m[14] * s[0])) / det,
+                              ((m[8] * s[3]) - (m[9] * s[1]) + (m[10] * s[0])) / det)
+
+        return OMatrix4D(self.__inverse)
+
+    @property
+    def transpose(self):
+        m = self.__matrix
+        return OMatrix4D(tuple(m[(column * 4) + row] for row in range(4) for column in range(4)))
+
+    def is_identity(self):
+        return self.__matrix == (1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1)
+
+    def is_affine(self):
+        return self.__matrix[12:16] == (0, 0, 0, 1)
+
+    def define_matrix(self, matrix):
+        """
+        Alters the transformation to a 3x3 matrix, the top three rows of a 4x4 matrix, a full 4x4 matrix, an OMatrix3D,
+        another OMatrix4D or the rotation of an OQuaternion, all row major
+        """
+
+        if type(matrix) is tuple or type(matrix) is list or type(matrix) is OMatrix3D or type(matrix) is OMatrix4D or type(matrix) is OQuaternion:
+            matrix = _homogeneous(matrix)
+            if matrix is None:
+                return
+            self.__matrix = matrix
+        else:
+            return
+
+        self.__inverse = None
+
+    def reset(self):
+        """
+        Alters the transformation to identity
+        """
+
+        self.__matrix = (1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1)
+        self.__inverse = None
+
+    def copy(self):
+        """
+        Returns a copy of the transformation object
+        """
+
+        return OMatrix4D(self.__matrix)
+
+    def transform(self, matrix):
+        """
+        Composes a matrix transformation given in any form accepted by define_matrix after the current transformation
+        """
+
+        if type(matrix) is tuple or type(matrix) is list or type(matrix) is OMatrix3D or type(matrix) is OMatrix4D or type(matrix) is OQuaternion:
+            other = _homogeneous(matrix)
+            if other is None:
+                return
+        else:
+            return
+
+        self.__matrix = _multiply(other, self.__matrix, 4)
+        self.__inverse = None
+
+    def translate(self, x, y, z):
+        """
+        Composes a translation along X, Y and Z axes after the current transformation
+        """
+
+        self.transform((1, 0, 0, x, 0, 1, 0, y, 0, 0, 1, z))
+
+    def rotate(self, angle_x, angle_y, angle_z):
+        """
+        Composes rotations by degrees about the X axis, then the Y axis and then the Z axis after the current transformation
+        """
+
+        self.transform(_rotation_matrix(angle_x, angle_y, angle_z))
+
+    def rotate_point(self, angle_x, angle_y, angle_z, point):
+        """
+        Composes rotations by degrees about the X axis, then the Y axis and then the Z axis about a defined point after
+        the current transformation
+        """
+
+        if (type(point) is tuple or type(point) is list or type(point) is OPoint3D) and len(point) == 3:
+            self.translate(-point[0], -point[1], -point[2])
+            self.rotate(angle_x, angle_y, angle_z)
+            self.translate(point[0], point[1], point[2])
+
+    def rotate_axis(self, axis, angle):
+        """
+        Composes a rotation by degrees (anticlockwise) about an axis given as a 3D vector after the current transformation
+        """
+
+        rotation = OQuaternion()
+        rotation.define_axis_angle(axis, angle)
+        self.transform(rotation)
+
+    def scale(self, x, y, z):
+        """
+        Composes a scale about origin after the current transformation
+        """
+
+        self.transform((x, 0, 0, 0, y, 0, 0, 0, z))
+
+    def apply(self, point):
+        """
+        Returns a new point which is the transformed copy of a point
+        """
+
+        m = self.__matrix
+        x = (m[0] * point[0]) + (m[1] * point[1]) + (m[2] * point[2]) + m[3]
+        y = (m[4] * point[0]) + (m[5] * point[1]) + (m[6] * point[2]) + m[7]
+        z = (m[8] * point[0]) + (m[9] * point[1]) + (m[10] * point[2]) + m[11]
+        if m[12:16] != (0, 0, 0, 1):
+            w = (m[12] * point[0]) + (m[13] * point[1]) + (m[14] * point[2]) + m[15]
+            if w != 0:
+                x = x / w
+                y = y / w
+                z = z / w
+        return OPoint3D(x, y, z)
+
+    def __iter__(self):
+        return iter(self.__matrix)
+
+    def __getitem__(self, i):
+        return self.__matrix[i]
+
+    def __len__(self):
+        return 16
+
+    def __repr__(self):
+        return str([list(self.__matrix[0:4]), list(self.__matrix[4:8]), list(self.__matrix[8:12]), list(self.__matrix[12:16])])
+
+    def __mul__(self, other):
+        if type(other) is OMatrix4D:
+            new_matrix = other.copy()
+            new_matrix.transform(self)
+            return new_matrix
+        elif type(other) is OPoint3D or ((type(other) is list or type(other) is tuple) and len(other) == 3):
+            return self.apply(other)
+        else:
+            return self
@@ -13,40 +13,46 @@ class OPoint2D:
     A point object can be used for storing a 2D point coordinate as well as finding distances to other points,
     calculating new points in space for a given vector. Instance variables such as distance, and heading contain distance to origin,
     and absolute angle of the vector made from the point which lies between 0 and 360 degrees respectively.
+    Both are calculated on first access and recalculated only after the point coordinate changes.
+    The coordinate is kept as two plain numbers in slots without a per-instance dictionary, which keeps
+    an instance at 64 bytes (CPython, 64-bit) not counting the coordinate values themselves.
     """
 
+    __slots__ = ('__x', '__y', '__distance', '__heading')
+
     def __init__(self, _x, _y):
-        self.__coord = [_x, _y]
-        self.__distance = self.__cal_distance()
-        self.__x_axis = self.__cal_x_axis()
-        self.__heading = self.__cal_heading()
+        self.__x = _x
+        self.__y = _y
+        self.__distance = None
+        self.__heading = None
 
     def __cal_distance(self):
-        return ((self.__coord[0]**2)+(self.__coord[1]**2))**0.5
-
-    def __cal_x_axis(self):
-        return [self.__distance, 0]
+        return ((self.__x**2)+(self.__y**2))**0.5
 
     def __cal_heading(self):
-        if (self.__coord[1] == 0 and self.__coord[0] == 0.0):
+        if (self.__y == 0 and self.__x == 0.0):
             return 0.0
-        elif (self.__coord[1] > 0 and self.__coord[0] == 0.0):
+        elif (self.__y > 0 and self.__x == 0.0):
             return 90.0
-        elif (self.__coord[1] < 0 and self.__coord[0] == 0.0):
+        elif (self.__y < 0 and self.__x == 0.0):
             return 270.0
-        elif (self.__coord[0] < 0):
-            return 180 + degrees(atan(self.__coord[1] / self.__coord[0]))
-        elif (self.__coord[0] > 0 and self.__coord[1] < 0):
-            return 360 + degrees(atan(self.__coord[1]/self.__coord[0]))
+        elif (self.__x < 0):
+            return 180 + degrees(atan(self.__y / self.__x))
+        elif (self.__x > 0 and self.__y < 0):
+            return 360 + degrees(atan(self.__y/self.__x))
         else:
-            return degrees(atan(self.__coord[1] / self.__coord[0]))
+            return degrees(atan(self.__y / self.__x))
 
     @property
     def distance(self):
+        if self.__distance is None:
+            self.__distance = self.__cal_distance()
         return self.__distance
 
     @property
     def heading(self):
+        if self.__heading is None:
+            self.__heading = self.__cal_heading()
         return self.__heading
 
     def copy(self):
@@ -54,81 +60,111 @@ class OPoint2D:
         Returns a copy of the object
         """
 
-        return OPoint2D(self.__coord[0], self.__coord[1])
+        return OPoint2D(self.__x, self.__y)
 
     def vector_copy(self, vec, distance):
         """
         Returns a new point which follows a vector and maintains a distance from the point
         """
 
-        return OPoint2D(self.__coord[0] + (distance * cos(radians(vec.angle))), self.__coord[1] + (distance * sin(radians(vec.angle))))
+        return OPoint2D(self.__x + (distance * cos(radians(vec.angle))), self.__y + (distance * sin(radians(vec.angle))))
 
     def distance_to(self, other):
         """
-        Finds distance to another point
+        Finds squared distance to another point
         """
 
         if type(other) is list or type(other) is OPoint2D:
-            return ((other[0] - self.__coord[0])**2)+((other[1] - self.__coord[1])**2)
+            return ((other[0] - self.__x)**2)+((other[1] - self.__y)**2)
+        else:
+            return None
+
+    def distance_sq_to(self, other):
+        """
+        Finds squared distance to another point, which orders points the same way as distance without taking a square root
+        """
+
+        if type(other) is list or type(other) is tuple or type(other) is OPoint2D:
+            dx = other[0] - self.__x
+            dy = other[1] - self.__y
+            return (dx*dx)+(dy*dy)
+        else:
+            return None
+
+    def within_radius(self, other, radius):
+        """
+        Checks whether another point lies within a radius of the point by comparing squared distances
+        """
+
+        if type(other) is list or type(other) is tuple or type(other) is OPoint2D:
+            dx = other[0] - self.__x
+            dy = other[1] - self.__y
+            return (dx*dx)+(dy*dy) <= radius*radius
         else:
             return None
 
     def __iter__(self):
-        return iter(self.__coord)
+        return iter((self.__x, self.__y))
 
     def __setitem__(self, i, val):
         if type(val) is float or type(val) is int:
-            self.__coord[i] = val
-        elif type(val) is OPoint2D:
-            self.__coord[0] = val[0]
-            self.__coord[1] = val[1]
-        elif type(val) is list:
-            self.__coord[0] = val[0]
-            self.__coord[1] = val[1]
+            if i == 0 or i == -2:
+                self.__x = val
+            elif i == 1 or i == -1:
+                self.__y = val
+            else:
+                raise IndexError("point index out of range")
+        elif type(val) is OPoint2D or type(val) is list:
+            self.__x = val[0]
+            self.__y = val[1]
         else:
             return self
 
-        self.__distance = ((self.__coord[0]**2)+(self.__coord[1]**2))**0.5
-        self.__x_axis = [self.__distance, 0]
-        self.__heading = self.__cal_heading()
+        self.__distance = None
+        self.__heading = None
 
     def __str__(self):
-        return "X: " + str(self.__coord[0]) + ", Y: " + str(self.__coord[1])
+        return "X: " + str(self.__x) + ", Y: " + str(self.__y)
 
     def __getitem__(self, i):
-        return self.__coord[i]
+        if i == 0:
+            return self.__x
+        elif i == 1:
+            return self.__y
+        else:
+            return (self.__x, self.__y)[i]
 
     def __len__(self):
-        return len(self.__coord)
+        return 2
 
     def __repr__(self):
-        return str(self.__coord)
+        return str([self.__x, self.__y])
 
     def __add__(self, fac):
         if type(fac) is float or type(fac) is int:
-            return OPoint2D(self.__coord[0] + fac, self.__coord[1] + fac)
+            return OPoint2D(self.__x + fac, self.__y + fac)
         else:
             return self
 
     def __sub__(self, fac):
         if type(fac) is float or type(fac) is int:
-            return OPoint2D(self.__coord[0] - fac, self.__coord[1] - fac)
+            return OPoint2D(self.__x - fac, self.__y - fac)
         else:
             return self
 
     def __neg__(self):
-        return OPoint2D(-self.__coord[0], -self.__coord[1])
+        return OPoint2D(-self.__x, -self.__y)
 
     def __mul__(self, fac):
         if type(fac) is float or type(fac) is int:
-            return OPoint2D(self.__coord[0]*fac, self.__coord[1]*fac)
+            return OPoint2D(self.__x*fac, self.__y*fac)
         else:
             return self
 
     def __truediv__(self, fac):
         if type(fac) is float or type(fac) is int:
             if fac != 0:
-                return OPoint2D(self.__coord[0]/fac, self.__coord[1]/fac)
+                return OPoint2D(self.__x/fac, self.__y/fac)
             else:
                 return self
         else:
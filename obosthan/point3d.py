@@ -6,82 +6,45 @@
 3D point object
 """
 
-from math import degrees, atan
+from math import degrees, atan2
 
 class OPoint3D:
     """
     A point object can be used for storing a 3D point coordinate as well as finding distances to other points,
     calculating new points in space for a given vector. Instance variables such as distance, and heading contain distance to origin,
-    and absolute angle of the vector made from the point which lies between 0 and 360 degrees respectively.
+    and absolute angles of the vector made from the point in the XY, YZ and XZ planes which lie between 0 and 360 degrees respectively.
+    Both are calculated on first access and recalculated only after the point coordinate changes.
     """
 
     def __init__(self, _x, _y, _z):
         self.__coord = [_x, _y, _z]
-        self.__distance = self.__cal_distance()
-        self.__xy_axes = self.__cal_xy_axes()
-        self.__heading = self.__cal_heading()
+        self.__distance = None
+        self.__heading = None
 
     def __cal_distance(self):
         return ((self.__coord[0]**2)+(self.__coord[1]**2)+(self.__coord[2]**2))**0.5
 
-    def __cal_xy_axes(self):
-        return [(self.__distance, 0), (self.__distance, 0)]
-
     def __cal_heading(self):
-
-        xy_plane = 0.0
-        yz_plane = 0.0
-        xz_plane = 0.0
-
-        if (self.__coord[1] == 0 and self.__coord[0] == 0.0):
-            xy_plane = 0.0
-        elif (self.__coord[1] > 0 and self.__coord[0] == 0.0):
-            xy_plane = 90.0
-        elif (self.__coord[1] < 0 and self.__coord[0] == 0.0):
-            xy_plane = 270.0
-        elif (self.__coord[0] < 0):
-            xy_plane = 180 + degrees(atan(self.__coord[1] / self.__coord[0]))
-        elif (self.__coord[0] > 0 and self.__coord[1] < 0):
-            xy_plane = 360 + degrees(atan(self.__coord[1]/self.__coord[0]))
-        else:
-            xy_plane = degrees(atan(self.__coord[1] / self.__coord[0]))
-
-        if (self.__coord[2] == 0 and self.__coord[1] == 0.0):
-            yz_plane = 0.0
-        elif (self.__coord[2] > 0 and self.__coord[1] == 0.0):
-            yz_plane = 90.0
-        elif (self.__coord[2] < 0 and self.__coord[1] == 0.0):
-            yz_plane = 270.0
-        elif (self.__coord[1] < 0):
-            yz_plane = 180 + degrees(atan(self.__coord[2] / self.__coord[1]))
-        elif (self.__coord[1] > 0 and self.__coord[2] < 0):
-            yz_plane = 360 + degrees(atan(self.__coord[2]/self.__coord[1]))
-        else:
-            yz_plane = degrees(atan(self.__coord[2] / self.__coord[1]))
-
-        if (self.__coord[2] == 0 and self.__coord[0] == 0.0):
-            xz_plane = 0.0
-        elif (self.__coord[2] > 0 and self.__coord[0] == 0.0):
-            xz_plane = 90.0
-        elif (self.__coord[2] < 0 and self.__coord[0] == 0.0):
-            xz_plane = 270.0
-        elif (self.__coord[0] < 0):
-            xz_plane = 180 + degrees(atan(self.__coord[2] / self.__coord[0]))
-        elif (self.__coord[0] > 0 and self.__coord[2] < 0):
-            xz_plane = 360 + degrees(atan(self.__coord[2]/self.__coord[0]))
-        else:
-            xz_plane = degrees(atan(self.__coord[2] / self.__coord[0]))
-
-        return [xy_plane, yz_plane, xz_plane]
+        # adding 0.0 turns -0.0 into 0.0 so atan2 agrees with the quadrant rules of the 2D objects on the axes
+        x, y, z = self.__coord[0] + 0.0, self.__coord[1] + 0.0, self.__coord[2] + 0.0
+        return [degrees(atan2(y, x)) % 360.0, degrees(atan2(z, y)) % 360.0, degrees(atan2(z, x)) % 360.0]
 
     @property
     def distance(self):
+        if self.__distance is None:
+            self.__distance = self.__cal_distance()
         return self.__distance
 
     @property
     def heading(self):
+        if self.__heading is None:
+            self.__heading = self.__cal_heading()
         return self.__heading
 
+    def __invalidate(self):
+        self.__distance = None
+        self.__heading = None
+
     def copy(self):
         """
         Returns a copy of the object
@@ -99,6 +62,32 @@ class OPoint3D:
         else:
             return None
 
+    def distance_sq_to(self, other):
+        """
+        Finds squared distance to another point, which orders points the same way as distance_to without taking a square root
+        """
+
+        if type(other) is list or type(other) is tuple or type(other) is OPoint3D:
+            dx = other[0] - self.__coord[0]
+            dy = other[1] - self.__coord[1]
+            dz = other[2] - self.__coord[2]
+            return (dx*dx) + (dy*dy) + (dz*dz)
+        else:
+            return None
+
+    def within_radius(self, other, radius):
+        """
+        Checks whether another point lies within a radius of the point by comparing squared distances
+        """
+
+        if type(other) is list or type(other) is tuple or type(other) is OPoint3D:
+            dx = other[0] - self.__coord[0]
+            dy = other[1] - self.__coord[1]
+            dz = other[2] - self.__coord[2]
+            return (dx*dx) + (dy*dy) + (dz*dz) <= radius*radius
+        else:
+            return None
+
     def __str__(self):
         return "X: " + str(self.__coord[0]) + ", Y: " + str(self.__coord[1]) + ", Z: " + str(self.__coord[2])
 
@@ -115,9 +104,7 @@ class OPoint3D:
         else:
             return self
 
-        self.__distance = self.__cal_distance()
-        self.__xy_axes = self.__cal_xy_axes()
-        self.__heading = self.__cal_heading()
+        self.__invalidate()
 
     def __getitem__(self, i):
         return self.__coord[i]
@@ -0,0 +1,374 @@
+# Copyright (c) 2018-2019, Md Imam Hossain (emamhd at gmail dot com)
+# see LICENSE.txt for details
+
+
+"""
+2D point array object
+"""
+
+from array import array
+from operator import add, sub, mul, truediv
+from math import sin, cos, radians, degrees, atan2
+from .point2d import OPoint2D
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class OPointArray2D:
+    """
+    A point array object which stores many 2D points as two contiguous coordinate buffers (structure of arrays)
+    so that distances, headings and transformations are calculated for all the points in one pass.
+    The buffers are NumPy float arrays when NumPy is available and array('d') objects otherwise. NumPy buffers are
+    allocated with spare capacity which doubles when it runs out, so adding points one by one costs amortised O(1)
+    like array('d') appends do.
+    Instance variables such as x and y give direct access to the coordinate buffers without copying them.
+    """
+
+    def __init__(self, points=None):
+        self.__set_xy(self.__new_buffer(()), self.__new_buffer(()))
+        if points is not None:
+            self.add_points(points)
+
+    @staticmethod
+    def __new_buffer(values):
+        if numpy is not None:
+            return numpy.array(values, dtype=numpy.float64)
+        else:
+            return array('d', values)
+
+    def __set_xy(self, xs, ys):
+        # the x and y buffers hold the points, the NumPy capacity buffers may extend past them with unused space
+        self.__x = xs
+        self.__y = ys
+        self.__x_capacity = xs
+        self.__y_capacity = ys
+
+    def __reserve(self, size):
+        capacity = len(self.__x_capacity)
+        if size > capacity:
+            capacity = max(size, 2 * capacity, 8)
+            num_of_points = len(self.__x)
+            x_capacity = numpy.empty(capacity, dtype=numpy.float64)
+            y_capacity = numpy.empty(capacity, dtype=numpy.float64)
+            x_capacity[:num_of_points] = self.__x
+            y_capacity[:num_of_points] = self.__y
+            self.__x_capacity = x_capacity
+            self.__y_capacity = y_capacity
+
+    def __extend(self, xs, ys):
+        num_of_points = len(self.__x)
+        new_num_of_points = num_of_points + len(xs)
+        self.__reserve(new_num_of_points)
+        self.__x_capacity[num_of_points:new_num_of_points] = xs
+        self.__y_capacity[num_of_points:new_num_of_points] = ys
+        self.__x = self.__x_capacity[:new_num_of_points]
+        self.__y = self.__y_capacity[:new_num_of_points]
+
+    @property
+    def x(self):
+        return self.__x
+
+    @property
+    def y(self):
+        return self.__y
+
+    @property
+    def num_of_points(self):
+        return len(self.__x)
+
+    @property
+    def distance(self):
+        """
+        Returns distances of the points to origin
+        """
+
+        if numpy is not None:
+            return numpy.hypot(self.__x, self.__y)
+        else:
+            return array('d', [((x**2)+(y**2))**0.5 for x, y in zip(self.__x, self.__y)])
+
+    @property
+    def heading(self):
+        """
+        Returns absolute angles of the points which lie between 0 and 360 degrees
+        """
+
+        if numpy is not None:
+            return numpy.degrees(numpy.arctan2(self.__y, self.__x)) % 360.0
+        else:
+            return array('d', [degrees(atan2(y, x)) % 360.0 for x, y in zip(self.__x, self.__y)])
+
+    def define_xy(self, xs, ys):
+        """
+        Replaces all the points with the coordinates from two equally sized buffers, NumPy float arrays are used without copying
+        """
+
+        if len(xs) == len(ys):
+            if numpy is not None:
+                self.__set_xy(numpy.asarray(xs, dtype=numpy.float64), numpy.asarray(ys, dtype=numpy.float64))
+            else:
+                self.__set_xy(array('d', xs), array('d', ys))
+
+    def add_points(self, points):
+        """
+        Adds points defined as OPoint2D objects or coordinate pairs into the array
+        """
+
+        if type(points) is list or type(points) is tuple:
+            if len(points) > 0:
+                xs = [point[0] for point in points]
+                ys = [point[1] for point in points]
+                if numpy is not None:
+                    self.__extend(xs, ys)
+                else:
+                    self.__x.extend(xs)
+                    self.__y.extend(ys)
+        elif type(points) is OPointArray2D:
+            if numpy is not None:
+                self.__extend(points.x, points.y)
+            else:
+                self.__x.extend(points.x)
+                self.__y.extend(points.y)
+
+    def add_point(self, _x, _y):
+        """
+        Adds a single point into the array
+        """
+
+        if _x is not None and _y is not None:
+            if numpy is not None:
+                num_of_points = len(self.__x)
+                self.__reserve(num_of_points + 1)
+                self.__x_capacity[num_of_points] = _x
+                self.__y_capacity[num_of_points] = _y
+                self.__x = self.__x_capacity[:num_of_points + 1]
+                self.__y = self.__y_capacity[:num_of_points + 1]
+            else:
+                self.__x.append(_x)
+                self.__y.append(_y)
+
+    def remove_point(self, i):
+        """
+        Removes an existing point from the array defined by index
+        """
+
+        if numpy is not None:
+            self.__set_xy(numpy.delete(self.__x, i), numpy.delete(self.__y, i))
+        else:
+            del self.__x[i]
+            del self.__y[i]
+
+    def get_point(self, i):
+        """
+        Returns an existing point from the array defined by index
+        """
+
+        return (float(self.__x[i]), float(self.__y[i]))
+
+    def get_points(self):
+        """
+        Returns the points of the array as a list of OPoint2D objects
+        """
+
+        return [OPoint2D(x, y) for x, y in zip(self.__x.tolist(), self.__y.tolist())]
+
+    def get_range(self):
+        """
+        Returns range of the points as minimum and maximum X and Y coordinates
+        """
+
+        if len(self.__x) != 0:
+            if numpy is not None:
+                return [[float(self.__x.min()), float(self.__x.max())], [float(self.__y.min()), float(self.__y.max())]]
+            else:
+                return [[min(self.__x), max(self.__x)], [min(self.__y), max(self.__y)]]
+        else:
+            return None
+
+    def get_centroid(self):
+        """
+        Returns the mean coordinate of the points
+        """
+
+        if len(self.__x) != 0:
+            if numpy is not None:
+                return (float(self.__x.mean()), float(self.__y.mean()))
+            else:
+                return (sum(self.__x) / len(self.__x), sum(self.__y) / len(self.__y))
+        else:
+            return None
+
+    def copy(self):
+        """
+        Returns a copy of the point array object
+        """
+
+        new_array = OPointArray2D()
+        if numpy is not None:
+            new_array.define_xy(self.__x.copy(), self.__y.copy())
+        else:
+            new_array.define_xy(self.__x, self.__y)
+        return new_array
+
+    def distance_to(self, other):
+        """
+        Finds distances to another point as OPoint2D.distance_to does for every point in the array, or point by point distances to another point array of the same size
+        """
+
+        if type(other) is list or type(other) is tuple or type(other) is OPoint2D:
+            ox = other[0]
+            oy = other[1]
+            if numpy is not None:
+                return ((ox - self.__x)**2)+((oy - self.__y)**2)
+            else:
+                return array('d', [((ox - x)**2)+((oy - y)**2) for x, y in zip(self.__x, self.__y)])
+        elif type(other) is OPointArray2D and len(other) == len(self):
+            if numpy is not None:
+                return ((other.x - self.__x)**2)+((other.y - self.__y)**2)
+            else:
+                return array('d', [((ox - x)**2)+((oy - y)**2) for x, y, ox, oy in zip(self.__x, self.__y, other.x, other.y)])
+        else:
+            return None
+
+    def translate(self, x, y):
+        """
+        Moves all the points in space along X and Y axes by amounts defined by x and y arguments
+        """
+
+        self.transform((1, 0, x, 0, 1, y))
+
+    def scale(self, x, y):
+        """
+        Scales all the points about origin
+        """
+
+        self.transform((x, 0, 0, 0, y, 0))
+
+    def rotate(self, angle):
+        """
+        Rotates all the points by degrees (anticlockwise) about origin
+        """
+
+        cos_angle = cos(radians(angle))
+        sin_angle = sin(radians(angle))
+        self.transform((cos_angle, -sin_angle, 0, sin_angle, cos_angle, 0))
+
+    def rotate_point(self, angle, point):
+        """
+        Rotates all the points by degrees (anticlockwise) about a defined point
+        """
+
+        if type(point) is tuple or type(point) is list or type(point) is OPoint2D:
+
+            if len(point) == 2:
+
+                cos_angle = cos(radians(angle))
+                sin_angle = sin(radians(angle))
+                self.transform((cos_angle, -sin_angle, point[0] - (cos_angle * point[0]) + (sin_angle * point[1]),
+                                sin_angle, cos_angle, point[1] - (sin_angle * point[0]) - (cos_angle * point[1])))
+
+    def transform(self, matrix):
+        """
+        Applies a matrix transformation to all the points in one pass, the matrix is either a 2x2 matrix (a, b, d, e) or
+        the top two rows of a homogeneous 3x3 matrix (a, b, c, d, e, f) where x' = ax + by + c and y' = dx + ey + f
+        """
+
+        if type(matrix) is tuple or type(matrix) is list:
+
+            if len(matrix) == 4:
+                a, b, d, e = matrix
+                c = f = 0
+            elif len(matrix) == 6:
+                a, b, c, d, e, f = matrix
+            else:
+                return
+
+            old_x = self.__x
+            old_y = self.__y
+
+            if numpy is not None:
+                self.__set_xy((old_x * a) + (old_y * b) + c, (old_x * d) + (old_y * e) + f)
+            else:
+                self.__set_xy(array('d', [(x * a) + (y * b) + c for x, y in zip(old_x, old_y)]),
+                              array('d', [(x * d) + (y * e) + f for x, y in zip(old_x, old_y)]))
+
+    def __apply(self, other, operation):
+        if type(other) is float or type(other) is int:
+            ox = oy = other
+        elif type(other) is list or type(other) is tuple or type(other) is OPoint2D:
+            if len(other) != 2:
+                return None
+            ox = other[0]
+            oy = other[1]
+        elif type(other) is OPointArray2D:
+            if len(other) != len(self):
+                return None
+            ox = other.x
+            oy = other.y
+        else:
+            return None
+
+        new_array = OPointArray2D()
+        if numpy is not None:
+            new_array.define_xy(operation(self.__x, ox), operation(self.__y, oy))
+        elif type(other) is OPointArray2D:
+            new_array.define_xy([operation(x, o) for x, o in zip(self.__x, ox)], [operation(y, o) for y, o in zip(self.__y, oy)])
+        else:
+            new_array.define_xy([operation(x, ox) for x in self.__x], [operation(y, oy) for y in self.__y])
+        return new_array
+
+    def __iter__(self):
+        return iter(self.get_points())
+
+    def __getitem__(self, i):
+        return OPoint2D(float(self.__x[i]), float(self.__y[i]))
+
+    def __setitem__(self, i, val):
+        if type(val) is list or type(val) is tuple or type(val) is OPoint2D:
+            self.__x[i] = val[0]
+            self.__y[i] = val[1]
+        else:
+            return self
+
+    def __len__(self):
+        return len(self.__x)
+
+    def __repr__(self):
+        return str([[x, y] for x, y in zip(self.__x.tolist(), self.__y.tolist())])
+
+    def __add__(self, other):
+        new_array = self.__apply(other, add)
+        return self if new_array is None else new_array
+
+    def __sub__(self, other):
+        new_array = self.__apply(other, sub)
+        return self if new_array is None else new_array
+
+    def __neg__(self):
+        new_array = OPointArray2D()
+        if numpy is not None:
+            new_array.define_xy(-self.__x, -self.__y)
+        else:
+            new_array.define_xy([-x for x in self.__x], [-y for y in self.__y])
+        return new_array
+
+    def __mul__(self, other):
+        new_array = self.__apply(other, mul)
+        return self if new_array is None else new_array
+
+    def __truediv__(self, other):
+        # a zero divisor leaves the array unchanged on both backends instead of giving inf with NumPy and raising with array('d')
+        if type(other) is float or type(other) is int:
+            if other == 0:
+                return self
+        elif type(other) is list or type(other) is tuple or type(other) is OPoint2D:
+            if 0 in other:
+                return self
+        elif type(other) is OPointArray2D:
+            if 0 in other.x or 0 in other.y:
+                return self
+        new_array = self.__apply(other, truediv)
+        return self if new_array is None else new_array
@@ -8,19 +8,134 @@ Polygon object
 
 from math import cos, sin, radians
 from .point2d import OPoint2D
+from .pointarray2d import OPointArray2D
+from .affine2d import OAffine2D
 from .line2d import OLine2D
 
+def _unique_normals(x_coords, y_coords):
+    # returns unit normals of the sides through the vertices where parallel sides share a single normal
+    normals = []
+    unique_normals = set()
+    for i in range(len(x_coords)):
+        normal_x = y_coords[i] - y_coords[i-1]
+        normal_y = x_coords[i-1] - x_coords[i]
+        length = ((normal_x**2) + (normal_y**2))**0.5
+        if length == 0:
+            continue
+        normal_x = normal_x / length
+        normal_y = normal_y / length
+        if normal_x < 0 or (normal_x == 0 and normal_y < 0):
+            normal_x = -normal_x
+            normal_y = -normal_y
+        normal_key = (round(normal_x, 12), round(normal_y, 12))
+        if normal_key not in unique_normals:
+            unique_normals.add(normal_key)
+            normals.append((normal_x, normal_y))
+    return tuple(normals)
+
+def _cross(x_coords, y_coords, a, b, c):
+    # returns the cross product of the vectors from vertex a to vertex b and from vertex a to vertex c
+    return ((x_coords[b] - x_coords[a]) * (y_coords[c] - y_coords[a])) - ((y_coords[b] - y_coords[a]) * (x_coords[c] - x_coords[a]))
+
+def _triangulate(x_coords, y_coords, indices):
+    # ear clipping of a simple anticlockwise polygon given as vertex indices, returns triangles as anticlockwise index lists
+    remaining = list(indices)
+    triangles = []
+
+    while len(remaining) > 3:
+        count = len(remaining)
+        reflex = [remaining[i] for i in range(count) if _cross(x_coords, y_coords, remaining[i - 1], remaining[i], remaining[(i + 1) % count]) < 0]
+        clipped = False
+        for i in range(count):
+            a = remaining[i - 1]
+            b = remaining[i]
+            c = remaining[(i + 1) % count]
+            turn = _cross(x_coords, y_coords, a, b, c)
+            if turn < 0:
+                continue
+            if turn > 0:
+                # an ear holds no reflex vertex inside or on its sides
+                ear = True
+                for r in reflex:
+                    if r != a and r != b and r != c and _cross(x_coords, y_coords, a, b, r) >= 0 and _cross(x_coords, y_coords, b, c, r) >= 0 and _cross(x_coords, y_coords, c, a, r) >= 0:
+                        ear = False
+                        break
+                if not ear:
+                    continue
+                triangles.append([a, b, c])
+            # collinear vertices are dropped without a triangle
+            del remaining[i]
+            clipped = True
+            break
+        if not clipped:
+            break
+
+    if len(remaining) == 3 and _cross(x_coords, y_coords, remaining[0], remaining[1], remaining[2]) > 0:
+        triangles.append(remaining)
+    elif len(remaining) > 3:
+        # the polygon is not simple, the rest is kept as a fan
+        for i in range(1, len(remaining) - 1):
+            triangles.append([remaining[0], remaining[i], remaining[i + 1]])
+
+    return triangles
+
+def _merge_convex(x_coords, y_coords, parts):
+    # Hertel-Mehlhorn, removes diagonals between anticlockwise parts whenever the merged part stays convex at both ends of the diagonal
+    parts = dict(enumerate(parts))
+    sides = {}
+    for key, part in parts.items():
+        for i in range(len(part)):
+            sides[(part[i - 1], part[i])] = key
+
+    merged = True
+    while merged:
+        merged = False
+        for (a, b), key in list(sides.items()):
+            other = sides.get((b, a))
+            if other is None or other == key or key not in parts or other not in parts:
+                continue
+            part = parts[key]
+            other_part = parts[other]
+            # part runs from b round to a and other_part from a round to b
+            i = part.index(b)
+            part = part[i:] + part[:i]
+            i = other_part.index(a)
+            other_part = other_part[i:] + other_part[:i]
+            if _cross(x_coords, y_coords, part[-2], a, other_part[1]) < 0 or _cross(x_coords, y_coords, other_part[-2], b, part[1]) < 0:
+                continue
+            new_part = part + other_part[1:-1]
+            del parts[other]
+            del sides[(a, b)]
+            del sides[(b, a)]
+            parts[key] = new_part
+            for i in range(len(new_part)):
+                sides[(new_part[i - 1], new_part[i])] = key
+            merged = True
+
+    return [parts[key] for key in sorted(parts)]
+
+
 class OPolygon:
     """
     A polygon object which can be used for storing a polygon vertices.
     Instance variables such as num_of_points, centroid tell number of vertices and centroid coordinate respectively.
+    The vertices are stored in an OPointArray2D. Transformations are composed into a pending affine transformation which is
+    applied to all the vertices in a single pass only when the vertices are read.
+    The axis aligned bounding box is cached and kept up to date when points are added, and when the polygon is moved or scaled.
     """
 
     def __init__(self, points):
-        self.__coord_list = []
+        self.__point_array = OPointArray2D()
+        self.__coord_tuples = None
+        self.__coord_lists = None
+        self.__edge_normals = None
+        self.__convex_parts = None
+        self.__part_lists = None
         self.__num_of_points = 0
+        self.__centroid = None
+        self.__pending = None
+        self.__bounds = None
         self.add_points(points)
-        self.__centroid = self.__cal_centroid()
 
     @property
     def num_of_points(self):
@@ -28,87 +143,264 @@ class OPolygon:
 
     @property
     def centroid(self):
+        if self.__centroid is None:
+            self.__centroid = self.__cal_centroid()
         return self.__centroid
 
+    @property
+    def aabb(self):
+        """
+        Returns axis aligned bounding box of the polygon as a tuple (x min, y min, x max, y max)
+        """
+
+        if self.__bounds is None and self.__num_of_points != 0:
+            self.__materialise()
+            (xcoord_min, xcoord_max), (ycoord_min, ycoord_max) = self.__point_array.get_range()
+            self.__bounds = (xcoord_min, ycoord_min, xcoord_max, ycoord_max)
+
+        return self.__bounds
+
+    def __extend_bounds(self, points):
+        if self.__bounds is not None:
+            xcoord_min, ycoord_min, xcoord_max, ycoord_max = self.__bounds
+            for point in points:
+                if point[0] < xcoord_min:
+                    xcoord_min = point[0]
+                if point[0] > xcoord_max:
+                    xcoord_max = point[0]
+                if point[1] < ycoord_min:
+                    ycoord_min = point[1]
+                if point[1] > ycoord_max:
+                    ycoord_max = point[1]
+            self.__bounds = (xcoord_min, ycoord_min, xcoord_max, ycoord_max)
+
+    @property
+    def point_array(self):
+        """
+        Returns a copy of the vertices of the polygon as an OPointArray2D, changing the copy does not change the polygon
+        """
+
+        self.__materialise()
+        return self.__point_array.copy()
+
+    def __materialise(self):
+        if self.__pending is not None:
+            self.__point_array.transform(self.__pending.matrix)
+            self.__pending = None
+
+    def __update(self):
+        self.__coord_tuples = None
+        self.__coord_lists = None
+        self.__edge_normals = None
+        self.__convex_parts = None
+        self.__part_lists = None
+        self.__num_of_points = len(self.__point_array)
+        self.__centroid = None
+
     def add_points(self, points):
         """
         Adds points into the polygon where points must be ordered in clockwise or anti clockwise fashion for correct caculation of the area formed by the polygon vertices
         """
 
+        self.__materialise()
+
         if type(points) is list or type(points) is tuple:
             if len(points) > 0:
-                for point in points:
-                    self.__coord_list.append(OPoint2D(point[0], point[1]))
-                self.__num_of_points = len(self.__coord_list)
-                self.__centroid = self.__cal_centroid()
+                self.__point_array.add_points(points)
+                self.__extend_bounds(points)
+                self.__update()
 
     def add_point(self, _x, _y):
         """
         Adds a single point into the polygon
         """
 
+        self.__materialise()
+
         if _x is not None and _y is not None:
-            self.__coord_list.append(OPoint2D(_x, _y))
-            self.__num_of_points = len(self.__coord_list)
-            self.__centroid = self.__cal_centroid()
+            self.__point_array.add_point(_x, _y)
+            self.__extend_bounds(((_x, _y),))
+            self.__update()
 
     def add_side(self, side):
         """
         Creates a new side for the polygon where the side is defined by a line having two end points
         """
 
+        self.__materialise()
+
         if type(side) is OLine2D or ((type(side) is list or type(side) is tuple) and len(side) == 4):
-            self.__coord_list.append(OPoint2D(side[0], side[1]))
-            self.__coord_list.append(OPoint2D(side[2], side[3]))
-            self.__num_of_points = len(self.__coord_list)
-            self.__centroid = self.__cal_centroid()
+            self.__point_array.add_points(((side[0], side[1]), (side[2], side[3])))
+            self.__extend_bounds(((side[0], side[1]), (side[2], side[3])))
+            self.__update()
 
     def remove_point(self, point):
         """
         Removes an existing point from the polygon
         """
 
-        if type(point) is list or type(point) is tuple:
-            val = OPoint2D(point[0], point[1])
-            if val in self.__coord_list:
-                self.__coord_list.remove(val)
-                self.__num_of_points = len(self.__coord_list)
-                self.__centroid = self.__cal_centroid()
-        elif type(point) is OPoint2D:
-            if point in self.__coord_list:
-                self.__coord_list.remove(point)
-                self.__num_of_points = len(self.__coord_list)
-                self.__centroid = self.__cal_centroid()
+        self.__materialise()
+
+        if type(point) is list or type(point) is tuple or type(point) is OPoint2D:
+            for i in range(self.__num_of_points):
+                if self.__point_array.get_point(i) == (point[0], point[1]):
+                    self.__point_array.remove_point(i)
+                    self.__bounds = None
+                    self.__update()
+                    break
 
     def get_point(self, i):
         """
         Returns an existing point from the polygon defined by index
         """
 
-        return (self.__coord_list[i][0], self.__coord_list[i][1])
+        self.__materialise()
+
+        return self.__point_array.get_point(i)
 
     @property
     def coords(self):
         """
-        Returns the polygon points
+        Returns the polygon points as a tuple of OPoint2D objects built from the vertices on every call, changing them does not
+        change the polygon, which is changed through __setitem__ or add_point
+        """
+
+        return tuple(OPoint2D(x, y) for x, y in self.coord_tuples)
+
+    @property
+    def coord_tuples(self):
+        """
+        Returns the polygon points as a tuple of immutable (x, y) tuples
+        """
+
+        if self.__coord_tuples is None:
+            x_coords, y_coords = self.coord_lists
+            self.__coord_tuples = tuple(zip(x_coords, y_coords))
+
+        return self.__coord_tuples
+
+    @property
+    def coord_lists(self):
         """
+        Returns the polygon points as a list of X coordinates and a list of Y coordinates
+        """
+
+        if self.__coord_lists is None:
+            self.__materialise()
+            self.__coord_lists = (self.__point_array.x.tolist(), self.__point_array.y.tolist())
+
+        return self.__coord_lists
+
+    @property
+    def edge_normals(self):
+        """
+        Returns unit normals of the polygon sides as a tuple of (x, y) pairs, parallel sides share a single normal which
+        points towards positive X (or positive Y for vertical normals)
+        """
+
+        if self.__edge_normals is None:
+            x_coords, y_coords = self.coord_lists
+            self.__edge_normals = _unique_normals(x_coords, y_coords)
+
+        return self.__edge_normals
+
+    def is_convex(self):
+        """
+        Checks whether the polygon is convex, collinear vertices are allowed
+        """
+
+        x_coords, y_coords = self.coord_lists
+        count = self.__num_of_points
+
+        if count < 4:
+            return True
+
+        sign = 0
+        x_turns = 0
+        previous_x = 0
+        for i in range(count):
+            turn = _cross(x_coords, y_coords, i - 2, i - 1, i)
+            if turn != 0:
+                if sign == 0:
+                    sign = 1 if turn > 0 else -1
+                elif (turn > 0) != (sign > 0):
+                    return False
+            # a convex polygon changes direction along X at most twice, which rules out star shapes
+            step_x = x_coords[i] - x_coords[i - 1]
+            if step_x != 0:
+                if previous_x != 0 and (step_x > 0) != (previous_x > 0):
+                    x_turns += 1
+                previous_x = step_x
+
+        first_x = 0
+        for i in range(count):
+            first_x = x_coords[i] - x_coords[i - 1]
+            if first_x != 0:
+                break
+        if previous_x != 0 and first_x != 0 and (first_x > 0) != (previous_x > 0):
+            x_turns += 1
+        return x_turns <= 2
+
+    @property
+    def convex_parts(self):
+        """
+        Returns convex parts of the polygon as a tuple of anticlockwise vertex index tuples, a convex polygon is a single part and a concave simple polygon
+        is triangulated by ear clipping and then the triangles are merged with Hertel-Mehlhorn into at most four times the optimal number of parts.
+        The parts are kept while the polygon is transformed and worked out again after vertices change
+        """
+
+        if self.__convex_parts is None:
+            x_coords, y_coords = self.coord_lists
+            indices = list(range(self.__num_of_points))
+            area = 0
+            for i in range(self.__num_of_points):
+                area += (x_coords[i - 1] * y_coords[i]) - (x_coords[i] * y_coords[i - 1])
+            if area < 0:
+                indices.reverse()
+            if self.is_convex():
+                self.__convex_parts = (tuple(indices),)
+            else:
+                parts = _merge_convex(x_coords, y_coords, _triangulate(x_coords, y_coords, indices))
+                self.__convex_parts = tuple([tuple(part) for part in parts])
+
+        return self.__convex_parts
+
+    @property
+    def convex_part_lists(self):
+        """
+        Returns convex parts of the polygon as a tuple of (X coordinates, Y coordinates, side normals, bounding box) for every part
+        where the coordinates are lists, normals are as in edge_normals and the bounding box is (x min, y min, x max, y max)
+        """
+
+        if self.__part_lists is None:
+            x_coords, y_coords = self.coord_lists
+            part_lists = []
+            for part in self.convex_parts:
+                part_x = [x_coords[i] for i in part]
+                part_y = [y_coords[i] for i in part]
+                part_lists.append((part_x, part_y, _unique_normals(part_x, part_y), (min(part_x), min(part_y), max(part_x), max(part_y))))
+            self.__part_lists = tuple(part_lists)
+
+        return self.__part_lists
+
+    def get_convex_parts(self):
+        """
+        Returns convex parts of the polygon as a list of polygons with anticlockwise vertices
+        """
+
+        x_coords, y_coords = self.coord_lists
 
-        return tuple(self.__coord_list)
+        return [OPolygon([(x_coords[i], y_coords[i]) for i in part]) for part in self.convex_parts]
 
     def __iter__(self):
-        return iter(self.__coord_list)
+        return (OPoint2D(x, y) for x, y in self.coord_tuples)
 
     def __setitem__(self, i, val):
-        if type(val) is list:
-            self.__coord_list[i][0] = val[0]
-            self.__coord_list[i][1] = val[1]
-            self.__num_of_points = len(self.__coord_list)
-            self.__centroid = self.__cal_centroid()
-        elif type(val) is OPoint2D:
-            self.__coord_list[i][0] = val[0]
-            self.__coord_list[i][1] = val[1]
-            self.__num_of_points = len(self.__coord_list)
-            self.__centroid = self.__cal_centroid()
+        if type(val) is list or type(val) is OPoint2D:
+            self.__materialise()
+            self.__point_array[i] = val
+            self.__bounds = None
+            self.__update()
         else:
             return self
 
@@ -116,7 +408,8 @@ class OPolygon:
         return self.__num_of_points
 
     def __repr__(self):
-        return str(self.__coord_list)
+        self.__materialise()
+        return repr(self.__point_array)
 
     def get_AABB(self):
         """
@@ -125,18 +418,7 @@ class OPolygon:
 
         if self.__num_of_points != 0:
 
-            x_coords = []
-            y_coords = []
-
-            for coord_x, coord_y in self.__coord_list:
-
-                x_coords.append(coord_x)
-                y_coords.append(coord_y)
-
-            xcoord_min = min(x_coords)
-            xcoord_max = max(x_coords)
-            ycoord_min = min(y_coords)
-            ycoord_max = max(y_coords)
+            xcoord_min, ycoord_min, xcoord_max, ycoord_max = self.aabb
 
             aabb = OPolygon([[xcoord_min, ycoord_min], [xcoord_max, ycoord_min], [xcoord_max, ycoord_max], [xcoord_min, ycoord_max]])
 
@@ -149,27 +431,64 @@ class OPolygon:
 
         if self.__num_of_points != 0:
 
-            cen_x = 0
-            cen_y = 0
-            for coord_x, coord_y in self.__coord_list:
-                cen_x = cen_x + coord_x
-                cen_y = cen_y + coord_y
+            cen_x, cen_y = self.__point_array.get_centroid()
 
-            return OPoint2D(cen_x/self.__num_of_points, cen_y/self.__num_of_points)
+            if self.__pending is not None:
+                return self.__pending.apply((cen_x, cen_y))
+
+            return OPoint2D(cen_x, cen_y)
 
         else:
             return None
 
+    def __apply(self, a, b, c, d, e, f):
+        # composes x' = ax + by + c, y' = dx + ey + f into the pending transformation, the centroid follows the same mapping
+        if self.__num_of_points != 0:
+            if self.__pending is None:
+                self.__pending = OAffine2D((a, b, c, d, e, f))
+            else:
+                self.__pending.transform((a, b, c, d, e, f))
+            self.__coord_tuples = None
+            self.__coord_lists = None
+            self.__part_lists = None
+            if b != 0 or d != 0 or a != 1 or e != 1:
+                self.__edge_normals = None
+            if self.__convex_parts is not None and (a * e) - (b * d) < 0:
+                # a reflection turns the parts clockwise
+                self.__convex_parts = tuple([part[::-1] for part in self.__convex_parts])
+            if self.__bounds is not None:
+                if b == 0 and d == 0:
+                    xcoord_1 = (a * self.__bounds[0]) + c
+                    xcoord_2 = (a * self.__bounds[2]) + c
+                    ycoord_1 = (e * self.__bounds[1]) + f
+                    ycoord_2 = (e * self.__bounds[3]) + f
+                    self.__bounds = (min(xcoord_1, xcoord_2), min(ycoord_1, ycoord_2), max(xcoord_1, xcoord_2), max(ycoord_1, ycoord_2))
+                else:
+                    self.__bounds = None
+            if self.__centroid is not None:
+                cen_x = self.__centroid[0]
+                cen_y = self.__centroid[1]
+                self.__centroid = OPoint2D((a * cen_x) + (b * cen_y) + c, (d * cen_x) + (e * cen_y) + f)
+
+    def __apply_about(self, a, b, d, e, origin):
+        # applies the linear part (a, b, d, e) about an origin point instead of about (0, 0)
+        self.__apply(a, b, origin[0] - (a * origin[0]) - (b * origin[1]), d, e, origin[1] - (d * origin[0]) - (e * origin[1]))
+
+    def apply_affine(self, affine):
+        """
+        Applies an OAffine2D transformation or the top two rows of a 3x3 matrix (a, b, c, d, e, f) to the polygon vertices,
+        the vertices are only recalculated when they are read
+        """
+
+        if type(affine) is OAffine2D or ((type(affine) is tuple or type(affine) is list) and len(affine) == 6):
+            self.__apply(affine[0], affine[1], affine[2], affine[3], affine[4], affine[5])
+
     def translate(self, x, y):
         """
         Moves the polygon in space along X and Y axes by amounts defined by x and y arguments
         """
 
-        for i in range(self.__num_of_points):
-            self.__coord_list[i][0] = self.__coord_list[i][0] + x
-            self.__coord_list[i][1] = self.__coord_list[i][1] + y
-
-        self.__centroid = self.__cal_centroid()
+        self.__apply(1, 0, x, 0, 1, y)
 
     def transform(self, matrix):
         """
@@ -178,38 +497,18 @@ class OPolygon:
 
         if type(matrix) is tuple or type(matrix) is list:
 
-            if len(matrix) == 4:
-
-                old_centroid = (self.__centroid[0], self.__centroid[1])
+            if len(matrix) == 4 and self.__num_of_points != 0:
 
-                self.translate(-old_centroid[0], -old_centroid[1])
-
-                for i in range(self.__num_of_points):
-                    old_point = (self.__coord_list[i][0], self.__coord_list[i][1])
-                    self.__coord_list[i][0] = (old_point[0] * matrix[0]) + (old_point[1] * matrix[1])
-                    self.__coord_list[i][1] = (old_point[0] * matrix[2]) + (old_point[1] * matrix[3])
-
-                self.translate(old_centroid[0], old_centroid[1])
-
-                self.__centroid = self.__cal_centroid()
+                self.__apply_about(matrix[0], matrix[1], matrix[2], matrix[3], self.centroid)
 
     def scale(self, x, y):
         """
         Scale the polygon vertices about its centroid
         """
 
-        old_centroid = (self.__centroid[0], self.__centroid[1])
-
-        self.translate(-old_centroid[0], -old_centroid[1])
-
-        for i in range(self.__num_of_points):
-            old_point = (self.__coord_list[i][0], self.__coord_list[i][1])
-            self.__coord_list[i][0] = old_point[0] * x
-            self.__coord_list[i][1] = old_point[1] * y
-
-        self.translate(old_centroid[0], old_centroid[1])
+        if self.__num_of_points != 0:
 
-        self.__centroid = self.__cal_centroid()
+            self.__apply_about(x, 0, 0, y, self.centroid)
 
     def scale_point(self, x, y, point):
         """
@@ -220,36 +519,16 @@ class OPolygon:
 
             if len(point) == 2:
 
-                old_centroid = (point[0], point[1])
-
-                self.translate(-old_centroid[0], -old_centroid[1])
-
-                for i in range(self.__num_of_points):
-                    old_point = (self.__coord_list[i][0], self.__coord_list[i][1])
-                    self.__coord_list[i][0] = old_point[0] * x
-                    self.__coord_list[i][1] = old_point[1] * y
-
-                self.translate(old_centroid[0], old_centroid[1])
-
-                self.__centroid = self.__cal_centroid()
+                self.__apply_about(x, 0, 0, y, point)
 
     def shear(self, x, y):
         """
         Shear the polygon vertices about its centroid
         """
 
-        old_centroid = (self.__centroid[0], self.__centroid[1])
-
-        self.translate(-old_centroid[0], -old_centroid[1])
-
-        for i in range(self.__num_of_points):
-            old_point = (self.__coord_list[i][0], self.__coord_list[i][1])
-            self.__coord_list[i][0] = old_point[0] + (old_point[1] * x)
-            self.__coord_list[i][1] = (old_point[0] * y) + old_point[1]
-
-        self.translate(old_centroid[0], old_centroid[1])
+        if self.__num_of_points != 0:
 
-        self.__centroid = self.__cal_centroid()
+            self.__apply_about(1, x, y, 1, self.centroid)
 
     def shear_point(self, x, y, point):
         """
@@ -260,18 +539,7 @@ class OPolygon:
 
             if len(point) == 2:
 
-                old_centroid = (point[0], point[1])
-
-                self.translate(-old_centroid[0], -old_centroid[1])
-
-                for i in range(self.__num_of_points):
-                    old_point = (self.__coord_list[i][0], self.__coord_list[i][1])
-                    self.__coord_list[i][0] = old_point[0] + (old_point[1] * x)
-                    self.__coord_list[i][1] = (old_point[0] * y) + old_point[1]
-
-                self.translate(old_centroid[0], old_centroid[1])
-
-                self.__centroid = self.__cal_centroid()
+                self.__apply_about(1, x, y, 1, point)
 
     def transform_point(self, matrix, point):
         """
@@ -282,35 +550,19 @@ class OPolygon:
 
             if len(matrix) == 4 and len(point) == 2:
 
-                old_centroid = (point[0], point[1])
-
-                self.translate(-old_centroid[0], -old_centroid[1])
-
-                for i in range(self.__num_of_points):
-                    old_point = (self.__coord_list[i][0], self.__coord_list[i][1])
-                    self.__coord_list[i][0] = (old_point[0] * matrix[0]) + (old_point[1] * matrix[1])
-                    self.__coord_list[i][1] = (old_point[0] * matrix[2]) + (old_point[1] * matrix[3])
-
-                self.translate(old_centroid[0], old_centroid[1])
-
-                self.__centroid = self.__cal_centroid()
+                self.__apply_about(matrix[0], matrix[1], matrix[2], matrix[3], point)
 
     def rotate_centroid(self, angle):
         """
         Rotates the polygon by degrees about its centroid
         """
 
-        old_centroid = (self.__centroid[0], self.__centroid[1])
-
-        self.translate(-old_centroid[0], -old_centroid[1])
+        if self.__num_of_points != 0:
 
-        for coord_i in range(self.__num_of_points):
-            old_coord_x = self.__coord_list[coord_i][0]
-            old_coord_y = self.__coord_list[coord_i][1]
-            self.__coord_list[coord_i][0] = (cos(radians(angle)) * old_coord_x) - (sin(radians(angle)) * old_coord_y)
-            self.__coord_list[coord_i][1] = (sin(radians(angle)) * old_coord_x) + (cos(radians(angle)) * old_coord_y)
+            cos_angle = cos(radians(angle))
+            sin_angle = sin(radians(angle))
 
-        self.translate(old_centroid[0], old_centroid[1])
+            self.__apply_about(cos_angle, -sin_angle, sin_angle, cos_angle, self.centroid)
 
     def rotate_point(self, angle, point):
         """
@@ -321,32 +573,29 @@ class OPolygon:
 
             if len(point) == 2:
 
-                origin = (point[0], point[1])
-                self.translate(-origin[0], -origin[1])
-
-                for coord_i in range(self.__num_of_points):
-                    old_coord_x = self.__coord_list[coord_i][0]
-                    old_coord_y = self.__coord_list[coord_i][1]
-                    self.__coord_list[coord_i][0] = (cos(radians(angle)) * old_coord_x) - (sin(radians(angle)) * old_coord_y)
-                    self.__coord_list[coord_i][1] = (sin(radians(angle)) * old_coord_x) + (cos(radians(angle)) * old_coord_y)
+                cos_angle = cos(radians(angle))
+                sin_angle = sin(radians(angle))
 
-                self.translate(origin[0], origin[1])
-                self.__centroid = self.__cal_centroid()
+                self.__apply_about(cos_angle, -sin_angle, sin_angle, cos_angle, point)
 
     def get_area(self):
         """
         Returns the area of the polygon as enclosed by its vertices
         """
 
+        self.__materialise()
+
         if self.__num_of_points > 2:
 
+            x_coords = self.__point_array.x.tolist()
+            y_coords = self.__point_array.y.tolist()
             last_index = self.__num_of_points - 1
             sum = 0
             for i in range(self.__num_of_points):
                 if (i == last_index):
-                    sum += (self.__coord_list[i][0] * self.__coord_list[0][1]) - (self.__coord_list[i][1]*self.__coord_list[0][0])
+                    sum += (x_coords[i] * y_coords[0]) - (y_coords[i] * x_coords[0])
                 else:
-                    sum += (self.__coord_list[i][0] * self.__coord_list[i+1][1]) - (self.__coord_list[i][1] * self.__coord_list[i+1][0])
+                    sum += (x_coords[i] * y_coords[i+1]) - (y_coords[i] * x_coords[i+1])
 
             return abs(sum/2)
 
@@ -358,29 +607,55 @@ class OPolygon:
         Returns the perimeter of the polygon as enclosed by its vertices. The last_segment argument is used to control whether the last side of the polygon is considered as part of perimeter
         """
 
-        sides = []
+        self.__materialise()
+
         p = 0
 
         if self.__num_of_points > 1:
 
-            if last_segment == False:
-
-                for i in range(self.__num_of_points-1):
-                    sides.append(OLine2D(self.__coord_list[i][0], self.__coord_list[i][1], self.__coord_list[i+1][0], self.__coord_list[i+1][1]))
-                    p += sides[i].length
-
-            else:
-
-                for i in range(self.__num_of_points):
+            x_coords = self.__point_array.x.tolist()
+            y_coords = self.__point_array.y.tolist()
 
-                    if i == (self.num_of_points - 1):
-                        sides.append(OLine2D(self.__coord_list[i][0], self.__coord_list[i][1], self.__coord_list[0][0], self.__coord_list[0][1]))
-                    else:
-                        sides.append(OLine2D(self.__coord_list[i][0], self.__coord_list[i][1], self.__coord_list[i+1][0], self.__coord_list[i+1][1]))
+            for i in range(self.__num_of_points-1):
+                p += (((x_coords[i+1]-x_coords[i])**2) + ((y_coords[i+1]-y_coords[i])**2))**0.5
 
-                    p += sides[i].length
+            if last_segment != False:
+                p += (((x_coords[0]-x_coords[-1])**2) + ((y_coords[0]-y_coords[-1])**2))**0.5
 
             return p
 
         else:
             return None
+
+    def contains(self, point):
+        """
+        Checks whether a point lies inside the polygon using the even-odd rule, a point on a left or bottom side counts as inside
+        and a point on a right or top side as outside so that polygons sharing sides never both contain a point
+        """
+
+        if type(point) is tuple or type(point) is list or type(point) is OPoint2D:
+
+            if len(point) == 2:
+
+                if self.__num_of_points < 3:
+                    return False
+
+                point_x = point[0]
+                point_y = point[1]
+                xcoord_min, ycoord_min, xcoord_max, ycoord_max = self.aabb
+
+                if point_y < ycoord_min or point_y >= ycoord_max or point_x < xcoord_min or point_x > xcoord_max:
+                    return False
+
+                x_coords, y_coords = self.coord_lists
+                inside = False
+                j = self.__num_of_points - 1
+                for i in range(self.__num_of_points):
+                    if (y_coords[i] > point_y) != (y_coords[j] > point_y):
+                        if x_coords[j] + ((point_y - y_coords[j]) * ((x_coords[i] - x_coords[j]) / (y_coords[i] - y_coords[j]))) <= point_x:
+                            inside = not inside
+                    j = i
+
+                return inside
+
+        return None
@@ -0,0 +1,180 @@
+# Copyright (c) 2018-2019, Md Imam Hossain (emamhd at gmail dot com)
+# see LICENSE.txt for details
+
+
+"""
+Prepared polygon object
+"""
+
+from bisect import bisect_right
+from .point2d import OPoint2D
+from .pointarray2d import OPointArray2D
+from .polygon import OPolygon
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class OPreparedPolygon:
+    """
+    A prepared polygon object which indexes the sides of a polygon once so that point containment queries take O(log n) each.
+    The polygon is cut into horizontal slabs between consecutive vertex Y coordinates and the sides crossing every slab are kept
+    sorted by X, so a point is located by a binary search over the slabs followed by a binary search over the sides of its slab.
+    Answers are the same as OPolygon.contains for simple polygons. The index is built from the polygon as it is when prepared,
+    so the polygon is prepared again after it changes. Rounding can leave the side crossings of a slab slightly out of order, so
+    sides crossing within a small window of a point are tested one by one with the predicate of OPolygon.contains.
+    """
+
+    def __init__(self, poly):
+        self.__slab_ys = []
+        self.__slab_starts = [0]
+        self.__side_xs = []
+        self.__side_ys = []
+        self.__side_slopes = []
+        self.__bounds = None
+        self.__window = 0.0
+        self.__arrays = None
+
+        if type(poly) is OPolygon and len(poly) > 2:
+            self.__prepare(poly)
+
+    @property
+    def num_of_slabs(self):
+        return len(self.__slab_starts) - 1
+
+    @property
+    def num_of_sides(self):
+        return len(self.__side_xs)
+
+    def __prepare(self, poly):
+        x_coords, y_coords = poly.coord_lists
+        slab_ys = sorted(set(y_coords))
+        slabs = [[] for i in range(len(slab_ys) - 1)]
+
+        # sides run from the previous vertex as in OPolygon.contains and horizontal sides cross no slab
+        j = len(x_coords) - 1
+        for i in range(len(x_coords)):
+            if y_coords[i] != y_coords[j]:
+                side = (x_coords[j], y_coords[j], (x_coords[i] - x_coords[j]) / (y_coords[i] - y_coords[j]))
+                first = bisect_right(slab_ys, min(y_coords[i], y_coords[j])) - 1
+                last = bisect_right(slab_ys, max(y_coords[i], y_coords[j])) - 1
+                for slab in range(first, last):
+                    slabs[slab].append(side)
+            j = i
+
+        for slab in range(len(slabs)):
+            middle = (slab_ys[slab] + slab_ys[slab + 1]) / 2
+            slabs[slab].sort(key=lambda side: side[0] + ((middle - side[1]) * side[2]))
+            for side in slabs[slab]:
+                self.__side_xs.append(side[0])
+                self.__side_ys.append(side[1])
+                self.__side_slopes.append(side[2])
+            self.__slab_starts.append(len(self.__side_xs))
+
+        self.__slab_ys = slab_ys
+        self.__bounds = poly.aabb
+        # crossings of a slab computed at one Y are in order up to a few rounding errors of the X coordinates
+        self.__window = (abs(self.__bounds[0]) + abs(self.__bounds[2])) * 1e-12
+
+    def contains(self, point):
+        """
+        Checks whether a point lies inside the polygon as OPolygon.contains does
+        """
+
+        if type(point) is tuple or type(point) is list or type(point) is OPoint2D:
+
+            if len(point) == 2:
+
+                if self.__bounds is None:
+                    return False
+
+                point_x = point[0]
+                point_y = point[1]
+                xcoord_min, ycoord_min, xcoord_max, ycoord_max = self.__bounds
+
+                if point_y < ycoord_min or point_y >= ycoord_max or point_x < xcoord_min or point_x > xcoord_max:
+                    return False
+
+                slab = bisect_right(self.__slab_ys, point_y) - 1
+                side_xs = self.__side_xs
+                side_ys = self.__side_ys
+                side_slopes = self.__side_slopes
+
+                # sides of the slab crossing well left of the point are counted by their position
+                start = lo = self.__slab_starts[slab]
+                end = hi = self.__slab_starts[slab + 1]
+                while lo < hi:
+                    middle = (lo + hi) // 2
+                    if side_xs[middle] + ((point_y - side_ys[middle]) * side_slopes[middle]) < point_x - self.__window:
+                        lo = middle + 1
+                    else:
+                        hi = middle
+
+                # sides crossing near the point are tested one by one until a side crosses well right of it
+                count = lo - start
+                while lo < end:
+                    crossing = side_xs[lo] + ((point_y - side_ys[lo]) * side_slopes[lo])
+                    if crossing > point_x + self.__window:
+                        break
+                    if crossing <= point_x:
+                        count += 1
+                    lo += 1
+
+                return count % 2 == 1
+
+        return None
+
+    def contains_many(self, points):
+        """
+        Checks many points given as an OPointArray2D or a list of points and returns a boolean mask, the binary searches of all
+        the points run together as NumPy array operations when NumPy is available
+        """
+
+        if numpy is None:
+            return [self.contains((point[0], point[1])) for point in points]
+
+        if type(points) is OPointArray2D:
+            point_xs = numpy.asarray(points.x, dtype=numpy.float64)
+            point_ys = numpy.asarray(points.y, dtype=numpy.float64)
+        else:
+            point_xs = numpy.array([point[0] for point in points], dtype=numpy.float64)
+            point_ys = numpy.array([point[1] for point in points], dtype=numpy.float64)
+
+        if self.__bounds is None or len(self.__slab_starts) < 2:
+            return numpy.zeros(len(point_xs), dtype=bool)
+
+        if self.__arrays is None:
+            self.__arrays = (numpy.array(self.__slab_ys, dtype=numpy.float64), numpy.array(self.__slab_starts, dtype=numpy.int64),
+                             numpy.array(self.__side_xs, dtype=numpy.float64), numpy.array(self.__side_ys, dtype=numpy.float64),
+                             numpy.array(self.__side_slopes, dtype=numpy.float64))
+
+        slab_ys, slab_starts, side_xs, side_ys, side_slopes = self.__arrays
+        xcoord_min, ycoord_min, xcoord_max, ycoord_max = self.__bounds
+        valid = (point_ys >= ycoord_min) & (point_ys < ycoord_max) & (point_xs >= xcoord_min) & (point_xs <= xcoord_max)
+        slabs = numpy.where(valid, numpy.searchsorted(slab_ys, point_ys, side='right') - 1, 0)
+        start = lo = slab_starts[slabs]
+        end = hi = numpy.where(valid, slab_starts[slabs + 1], start)
+
+        while True:
+            searching = lo < hi
+            if not searching.any():
+                break
+            middle = numpy.where(searching, (lo + hi) // 2, 0)
+            left = (side_xs[middle] + ((point_ys - side_ys[middle]) * side_slopes[middle])) < (point_xs - self.__window)
+            lo = numpy.where(searching & left, middle + 1, lo)
+            hi = numpy.where(searching & ~left, middle, hi)
+
+        count = lo - start
+        while True:
+            scanning = lo < end
+            if not scanning.any():
+                break
+            side = numpy.where(scanning, lo, 0)
+            crossing = side_xs[side] + ((point_ys - side_ys[side]) * side_slopes[side])
+            scanning = scanning & (crossing <= (point_xs + self.__window))
+            count = numpy.where(scanning & (crossing <= point_xs), count + 1, count)
+            lo = numpy.where(scanning, lo + 1, end)
+
+        return valid & ((count % 2) == 1)
@@ -0,0 +1,204 @@
+# Copyright (c) 2023, Md Imam Hossain (emamhd at gmail dot com)
+# see LICENSE.txt for details
+
+
+"""
+Quaternion object
+"""
+
+from math import sin, cos, radians, acos
+from .point3d import OPoint3D
+
+
+class OQuaternion:
+    """
+    A quaternion object (w, x, y, z) which can be used for storing, composing and interpolating 3D orientations.
+    Rotations by degrees about the X axis, then the Y axis and then the Z axis follow the same order as OSurface rotations.
+    Instance variables such as length, conjugate, inverse and matrix contain length of the quaternion, its conjugate, its
+    inverse and the row major 3x3 rotation matrix of the unit quaternion respectively.
+    """
+
+    def __init__(self, _w=1.0, _x=0.0, _y=0.0, _z=0.0):
+        self.__coord = (_w, _x, _y, _z)
+
+    @property
+    def length(self):
+        w, x, y, z = self.__coord
+        return ((w*w) + (x*x) + (y*y) + (z*z))**0.5
+
+    @property
+    def conjugate(self):
+        w, x, y, z = self.__coord
+        return OQuaternion(w, -x, -y, -z)
+
+    @property
+    def inverse(self):
+        """
+        Returns the inverse quaternion or None when the quaternion is zero
+        """
+
+        w, x, y, z = self.__coord
+        length_sq = (w*w) + (x*x) + (y*y) + (z*z)
+        if length_sq == 0:
+            return None
+        return OQuaternion(w / length_sq, -x / length_sq, -y / length_sq, -z / length_sq)
+
+    @property
+    def matrix(self):
+        """
+        Returns the row major 3x3 rotation matrix of the quaternion after normalising it
+        """
+
+        w, x, y, z = self.__coord
+        length_sq = (w*w) + (x*x) + (y*y) + (z*z)
+        if length_sq == 0:
+            return (1, 0, 0, 0, 1, 0, 0, 0, 1)
+        s = 2 / length_sq
+        return (1 - (s * ((y*y) + (z*z))), s * ((x*y) - (w*z)), s * ((x*z) + (w*y)),
+                s * ((x*y) + (w*z)), 1 - (s * ((x*x) + (z*z))), s * ((y*z) - (w*x)),
+                s * ((x*z) - (w*y)), s * ((y*z) + (w*x)), 1 - (s * ((x*x) + (y*y))))
+
+    def is_identity(self):
+        return self.__coord == (1, 0, 0, 0)
+
+    def define_axis_angle(self, axis, angle):
+        """
+        Alters the quaternion to a rotation by degrees (anticlockwise) about an axis given as a 3D vector
+        """
+
+        if len(axis) == 3:
+            length = ((axis[0]**2) + (axis[1]**2) + (axis[2]**2))**0.5
+            if length == 0:
+                return
+            half_sin = sin(radians(angle) / 2) / length
+            self.__coord = (cos(radians(angle) / 2), axis[0] * half_sin, axis[1] * half_sin, axis[2] * half_sin)
+
+    def define_euler(self, angle_x, angle_y, angle_z):
+        """
+        Alters the quaternion to rotations by degrees about the X axis, then the Y axis and then the Z axis
+        """
+
+        cos_x = cos(radians(angle_x) / 2)
+        sin_x = sin(radians(angle_x) / 2)
+        cos_y = cos(radians(angle_y) / 2)
+        sin_y = sin(radians(angle_y) / 2)
+        cos_z = cos(radians(angle_z) / 2)
+        sin_z = sin(radians(angle_z) / 2)
+        self.__coord = ((cos_z * cos_y * cos_x) + (sin_z * sin_y * sin_x),
+                        (cos_z * cos_y * sin_x) - (sin_z * sin_y * cos_x),
+                        (cos_z * sin_y * cos_x) + (sin_z * cos_y * sin_x),
+                        (sin_z * cos_y * cos_x) - (cos_z * sin_y * sin_x))
+
+    def define_matrix(self, matrix):
+        """
+        Alters the quaternion to the rotation of a row major 3x3 rotation matrix
+        """
+
+        if (type(matrix) is tuple or type(matrix) is list) and len(matrix) == 9:
+
+            m00, m01, m02, m10, m11, m12, m20, m21, m22 = matrix
+            trace = m00 + m11 + m22
+
+            if trace > 0:
+                s = 2 * ((trace + 1)**0.5)
+                self.__coord = (s / 4, (m21 - m12) / s, (m02 - m20) / s, (m10 - m01) / s)
+            elif m00 > m11 and m00 > m22:
+                s = 2 * ((1 + m00 - m11 - m22)**0.5)
+                self.__coord = ((m21 - m12) / s, s / 4, (m01 + m10) / s, (m02 + m20) / s)
+            elif m11 > m22:
+                s = 2 * ((1 + m11 - m00 - m22)**0.5)
+                self.__coord = ((m02 - m20) / s, (m01 + m10) / s, s / 4, (m12 + m21) / s)
+            else:
+                s = 2 * ((1 + m22 - m00 - m11)**0.5)
+                self.__coord = ((m10 - m01) / s, (m02 + m20) / s, (m12 + m21) / s, s / 4)
+
+    def copy(self):
+        """
+        Returns a copy of the quaternion object
+        """
+
+        return OQuaternion(*self.__coord)
+
+    def normalise(self):
+        """
+        Scales the quaternion to unit length
+        """
+
+        length = self.length
+        if length != 0:
+            self.__coord = tuple(coord / length for coord in self.__coord)
+
+    def dot(self, other):
+        return (self.__coord[0]*other[0]) + (self.__coord[1]*other[1]) + (self.__coord[2]*other[2]) + (self.__coord[3]*other[3])
+
+    def slerp(self, other, t):
+        """
+        Returns the unit quaternion lying a fraction t of the way along the shortest arc to another quaternion
+        """
+
+        if type(other) is not OQuaternion:
+            return None
+
+        start = self.copy()
+        end = other.copy()
+        start.normalise()
+        end.normalise()
+
+        cos_angle = start.dot(end)
+        if cos_angle < 0:
+            end = -end
+            cos_angle = -cos_angle
+
+        if cos_angle > 0.9995:
+            # nearly parallel quaternions are interpolated linearly to avoid dividing by a vanishing sine
+            start_fac = 1 - t
+            end_fac = t
+        else:
+            angle = acos(cos_angle)
+            sin_angle = sin(angle)
+            start_fac = sin((1 - t) * angle) / sin_angle
+            end_fac = sin(t * angle) / sin_angle
+
+        new_quaternion = OQuaternion(*[(s * start_fac) + (e * end_fac) for s, e in zip(start, end)])
+        new_quaternion.normalise()
+        return new_quaternion
+
+    def apply(self, point):
+        """
+        Returns a new point which is the rotated copy of a point
+        """
+
+        m = self.matrix
+        return OPoint3D((m[0] * point[0]) + (m[1] * point[1]) + (m[2] * point[2]),
+                        (m[3] * point[0]) + (m[4] * point[1]) + (m[5] * point[2]),
+                        (m[6] * point[0]) + (m[7] * point[1]) + (m[8] * point[2]))
+
+    def __iter__(self):
+        return iter(self.__coord)
+
+    def __getitem__(self, i):
+        return self.__coord[i]
+
+    def __len__(self):
+        return 4
+
+    def __repr__(self):
+        return str(list(self.__coord))
+
+    def __neg__(self):
+        return OQuaternion(-self.__coord[0], -self.__coord[1], -self.__coord[2], -self.__coord[3])
+
+    def __mul__(self, other):
+        if type(other) is OQuaternion:
+            w1, x1, y1, z1 = self.__coord
+            w2, x2, y2, z2 = other
+            return OQuaternion((w1*w2) - (x1*x2) - (y1*y2) - (z1*z2),
+                               (w1*x2) + (x1*w2) + (y1*z2) - (z1*y2),
+                               (w1*y2) - (x1*z2) + (y1*w2) + (z1*x2),
+                               (w1*z2) + (x1*y2) - (y1*x2) + (z1*w2))
+        elif type(other) is float or type(other) is int:
+            return OQuaternion(*[coord * other for coord in self.__coord])
+        elif type(other) is OPoint3D or ((type(other) is list or type(other) is tuple) and len(other) == 3):
+            return self.apply(other)
+        else:
+            return self
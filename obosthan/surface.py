@@ -6,41 +6,138 @@
 Surface object
 """
 
-from math import cos, sin, radians
+from array import array
 from .point3d import OPoint3D
+from .quaternion import OQuaternion
+from .matrix3d import OMatrix3D, OMatrix4D
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _fan(indices):
+    # splits a face given as a loop of vertex indices into triangles sharing its first vertex
+    return [(indices[0], indices[i], indices[i + 1]) for i in range(1, len(indices) - 1)]
 
 
 class OSurface:
     """
-    A surface object which can be used for storing a surface vertices.
+    A surface object which can be used for storing a surface vertices and an optional indexed triangle mesh over them.
+    The vertices are kept in a single shared vertex buffer and the triangles in a face index buffer holding three vertex
+    indices per face, so no OPoint3D object is kept per vertex. The buffers are NumPy arrays of shape (N, 3) of floats and
+    (M, 3) of int32 when NumPy is available and flat array('d') and array('i') objects otherwise.
     Instance variables such as num_of_points, centroid tell number of vertices and centroid coordinate respectively.
     """
 
-    def __init__(self, points):
-        self.__coord_list = []
-        self.__num_of_points = 0
+    def __init__(self, points, faces=None):
+        self.__vertices = self.__new_vertices(())
+        self.__faces = self.__new_faces(())
+        self.__cross = None
+        self.__centroid = None
         self.add_points(points)
-        self.__centroid = self.__cal_centroid()
+        if faces is not None:
+            self.add_faces(faces)
+
+    @staticmethod
+    def __new_vertices(values):
+        if numpy is not None:
+            return numpy.array(values, dtype=numpy.float64).reshape(-1, 3)
+        else:
+            return array('d', values)
+
+    @staticmethod
+    def __new_faces(values):
+        if numpy is not None:
+            return numpy.array(values, dtype=numpy.int32).reshape(-1, 3)
+        else:
+            return array('i', values)
 
     @property
     def num_of_points(self):
-        return self.__num_of_points
+        if numpy is not None:
+            return len(self.__vertices)
+        else:
+            return len(self.__vertices) // 3
+
+    @property
+    def num_of_faces(self):
+        if numpy is not None:
+            return len(self.__faces)
+        else:
+            return len(self.__faces) // 3
 
     @property
     def centroid(self):
         return self.__centroid
 
+    @property
+    def vertices(self):
+        """
+        Returns the vertex buffer without copying it
+        """
+
+        return self.__vertices
+
+    @property
+    def faces(self):
+        """
+        Returns the face index buffer without copying it
+        """
+
+        return self.__faces
+
+    @property
+    def area(self):
+        """
+        Returns the total area of the surface triangles
+        """
+
+        if numpy is not None:
+            return float(self.get_face_areas().sum())
+        else:
+            return sum(self.get_face_areas(), 0.0)
+
+    def __update(self):
+        self.__cross = None
+        self.__centroid = self.__cal_centroid()
+
+    def define_mesh(self, vertices, faces=None):
+        """
+        Replaces the vertices and the faces with a vertex buffer of coordinate triples and a face index buffer of index
+        triples, NumPy arrays of the right type are used without copying
+        """
+
+        if numpy is not None:
+            vertices = numpy.asarray(vertices, dtype=numpy.float64).reshape(-1, 3)
+            faces = self.__new_faces(()) if faces is None else numpy.asarray(faces, dtype=numpy.int32).reshape(-1, 3)
+            if len(faces) > 0 and (faces.min() < 0 or faces.max() >= len(vertices)):
+                return
+        else:
+            vertices = array('d', [coord for point in vertices for coord in point[0:3]])
+            faces = array('i') if faces is None else array('i', [i for face in faces for i in face[0:3]])
+            if len(faces) > 0 and (min(faces) < 0 or max(faces) >= len(vertices) // 3):
+                return
+
+        self.__vertices = vertices
+        self.__faces = faces
+        self.__update()
+
     def add_points(self, points):
         """
         Adds points into the surface
         """
 
-        if type(points) is list or type(points) is tuple:
+        if type(points) is list or type(points) is tuple or (numpy is not None and type(points) is numpy.ndarray):
             if len(points) > 0:
-                for point in points:
-                    self.__coord_list.append(OPoint3D(point[0], point[1], point[2]))
-                self.__num_of_points = len(self.__coord_list)
-                self.__centroid = self.__cal_centroid()
+                if numpy is not None:
+                    if type(points) is not numpy.ndarray:
+                        points = [(point[0], point[1], point[2]) for point in points]
+                    self.__vertices = numpy.concatenate((self.__vertices, numpy.asarray(points, dtype=numpy.float64).reshape(-1, 3)))
+                else:
+                    self.__vertices.extend([coord for point in points for coord in (point[0], point[1], point[2])])
+                self.__update()
 
     def add_point(self, _x, _y, _z):
         """
@@ -48,33 +145,108 @@ class OSurface:
         """
 
         if _x is not None and _y is not None:
-            self.__coord_list.append(OPoint3D(_x, _y, _z))
-            self.__num_of_points = len(self.__coord_list)
-            self.__centroid = self.__cal_centroid()
+            if numpy is not None:
+                self.__vertices = numpy.concatenate((self.__vertices, [[_x, _y, _z]]))
+            else:
+                self.__vertices.extend((_x, _y, _z))
+            self.__update()
+
+    def add_faces(self, faces):
+        """
+        Adds faces defined as loops of vertex indices into the surface mesh, faces with more than three vertices are
+        split into triangles sharing their first vertex
+        """
+
+        if type(faces) is list or type(faces) is tuple or (numpy is not None and type(faces) is numpy.ndarray):
+            if len(faces) > 0:
+                if numpy is not None and type(faces) is numpy.ndarray and faces.ndim == 2 and faces.shape[1] == 3:
+                    triangles = faces.astype(numpy.int32, copy=False)
+                else:
+                    triangles = [triangle for face in faces for triangle in _fan(face)]
+                    if len(triangles) == 0:
+                        return
+                num_of_points = self.num_of_points
+                if numpy is not None:
+                    triangles = numpy.asarray(triangles, dtype=numpy.int32).reshape(-1, 3)
+                    if triangles.min() < 0 or triangles.max() >= num_of_points:
+                        return
+                    self.__faces = numpy.concatenate((self.__faces, triangles))
+                else:
+                    indices = [i for triangle in triangles for i in triangle]
+                    if min(indices) < 0 or max(indices) >= num_of_points:
+                        return
+                    self.__faces.extend(indices)
+                self.__cross = None
+
+    def add_face(self, i, j, k):
+        """
+        Adds a single triangle defined by three vertex indices into the surface mesh
+        """
+
+        self.add_faces([(i, j, k)])
+
+    def get_face(self, i):
+        """
+        Returns vertex indices of an existing face defined by index
+        """
+
+        if numpy is not None:
+            return (int(self.__faces[i][0]), int(self.__faces[i][1]), int(self.__faces[i][2]))
+        else:
+            i = (i % self.num_of_faces) * 3
+            return (self.__faces[i], self.__faces[i + 1], self.__faces[i + 2])
 
     def remove_point(self, point):
         """
-        Removes an existing point from the polygon
+        Removes an existing point from the polygon along with the faces using it
         """
 
-        if type(point) is list or type(point) is tuple:
-            val = OPoint3D(point[0], point[1], point[2])
-            if val in self.__coord_list:
-                self.__coord_list.remove(val)
-                self.__num_of_points = len(self.__coord_list)
-                self.__centroid = self.__cal_centroid()
-        elif type(point) is OPoint3D:
-            if point in self.__coord_list:
-                self.__coord_list.remove(point)
-                self.__num_of_points = len(self.__coord_list)
-                self.__centroid = self.__cal_centroid()
+        if type(point) is list or type(point) is tuple or type(point) is OPoint3D:
+
+            if len(point) != 3:
+                return
+
+            vertices = self.get_points()
+            target = (point[0], point[1], point[2])
+            if target not in vertices:
+                return
+            index = vertices.index(target)
+
+            if numpy is not None:
+                self.__vertices = numpy.delete(self.__vertices, index, axis=0)
+                faces = self.__faces[(self.__faces != index).all(axis=1)]
+                self.__faces = faces - (faces > index).astype(numpy.int32)
+            else:
+                del self.__vertices[index * 3:(index * 3) + 3]
+                faces = array('i')
+                for f in range(0, len(self.__faces), 3):
+                    face = self.__faces[f:f + 3]
+                    if index not in face:
+                        faces.extend([i - 1 if i > index else i for i in face])
+                self.__faces = faces
+
+            self.__update()
 
     def get_point(self, i):
         """
         Returns an existing point from the polygon defined by index
         """
 
-        return (self.__coord_list[i][0], self.__coord_list[i][1], self.__coord_list[i][2])
+        if numpy is not None:
+            return (float(self.__vertices[i][0]), float(self.__vertices[i][1]), float(self.__vertices[i][2]))
+        else:
+            i = (i % self.num_of_points) * 3
+            return (self.__vertices[i], self.__vertices[i + 1], self.__vertices[i + 2])
+
+    def get_points(self):
+        """
+        Returns the surface vertices as a list of coordinate tuples
+        """
+
+        if numpy is not None:
+            return [tuple(point) for point in self.__vertices.tolist()]
+        else:
+            return list(zip(self.__vertices[0::3], self.__vertices[1::3], self.__vertices[2::3]))
 
     @property
     def coords(self):
@@ -82,51 +254,43 @@ class OSurface:
         Returns the polygon points
         """
 
-        return tuple(self.__coord_list)
+        return tuple(OPoint3D(x, y, z) for x, y, z in self.get_points())
 
     def __iter__(self):
-        return iter(self.__coord_list)
+        return iter(self.coords)
 
     def __setitem__(self, i, val):
-        if type(val) is list or type(val) is OPoint3D:
-            self.__coord_list[i][0] = val[0]
-            self.__coord_list[i][1] = val[1]
-            self.__coord_list[i][2] = val[2]
-            self.__num_of_points = len(self.__coord_list)
-            self.__centroid = self.__cal_centroid()
+        if type(val) is list or type(val) is tuple or type(val) is OPoint3D:
+            if numpy is not None:
+                self.__vertices[i] = (val[0], val[1], val[2])
+            else:
+                i = (i % self.num_of_points) * 3
+                self.__vertices[i:i + 3] = array('d', (val[0], val[1], val[2]))
+            self.__update()
         else:
             return self
 
     def __len__(self):
-        return self.__num_of_points
+        return self.num_of_points
 
     def __repr__(self):
-        return str(self.__coord_list)
+        return str([list(point) for point in self.get_points()])
 
     def get_range(self):
         """
         Returns range of surface vertices
         """
 
-        if self.__num_of_points != 0:
-
-            x_coords = []
-            y_coords = []
-            z_coords = []
-
-            for coord_x, coord_y, coord_z in self.__coord_list:
-                x_coords.append(coord_x)
-                y_coords.append(coord_y)
-                z_coords.append(coord_z)
+        if self.num_of_points != 0:
 
-            xcoord_min = min(x_coords)
-            xcoord_max = max(x_coords)
-            ycoord_min = min(y_coords)
-            ycoord_max = max(y_coords)
-            zcoord_min = min(z_coords)
-            zcoord_max = max(z_coords)
+            if numpy is not None:
+                coords_min = self.__vertices.min(axis=0).tolist()
+                coords_max = self.__vertices.max(axis=0).tolist()
+            else:
+                coords_min = [min(self.__vertices[axis::3]) for axis in range(3)]
+                coords_max = [max(self.__vertices[axis::3]) for axis in range(3)]
 
-            aabb = [[xcoord_min, xcoord_max], [ycoord_min, ycoord_max], [zcoord_min, zcoord_max]]
+            aabb = [[coords_min[0], coords_max[0]], [coords_min[1], coords_max[1]], [coords_min[2], coords_max[2]]]
 
             return aabb
 
@@ -135,97 +299,179 @@ class OSurface:
 
     def __cal_centroid(self):
 
-        if self.__num_of_points != 0:
+        num_of_points = self.num_of_points
 
-            cen_x = 0
-            cen_y = 0
-            cen_z = 0
-            for coord_x, coord_y, coord_z in self.__coord_list:
-                cen_x = cen_x + coord_x
-                cen_y = cen_y + coord_y
-                cen_z = cen_z + coord_z
+        if num_of_points != 0:
 
-            return OPoint3D(cen_x / self.__num_of_points, cen_y / self.__num_of_points, cen_z / self.__num_of_points)
+            if numpy is not None:
+                cen_x, cen_y, cen_z = self.__vertices.sum(axis=0).tolist()
+            else:
+                cen_x, cen_y, cen_z = [sum(self.__vertices[axis::3]) for axis in range(3)]
+
+            return OPoint3D(cen_x / num_of_points, cen_y / num_of_points, cen_z / num_of_points)
 
         else:
             return None
 
+    def __cal_cross(self):
+        # cross products of the two edges leaving the first vertex of every face, cached until the surface changes
+        if self.__cross is None:
+            if numpy is not None:
+                first = self.__vertices.take(self.__faces[:, 0], axis=0)
+                self.__cross = numpy.cross(self.__vertices.take(self.__faces[:, 1], axis=0) - first, self.__vertices.take(self.__faces[:, 2], axis=0) - first)
+            else:
+                vertices = self.__vertices
+                cross = array('d')
+                for f in range(0, len(self.__faces), 3):
+                    a = self.__faces[f] * 3
+                    b = self.__faces[f + 1] * 3
+                    c = self.__faces[f + 2] * 3
+                    e1_x = vertices[b] - vertices[a]
+                    e1_y = vertices[b + 1] - vertices[a + 1]
+                    e1_z = vertices[b + 2] - vertices[a + 2]
+                    e2_x = vertices[c] - vertices[a]
+                    e2_y = vertices[c + 1] - vertices[a + 1]
+                    e2_z = vertices[c + 2] - vertices[a + 2]
+                    cross.extend(((e1_y * e2_z) - (e1_z * e2_y), (e1_z * e2_x) - (e1_x * e2_z), (e1_x * e2_y) - (e1_y * e2_x)))
+                self.__cross = cross
+        return self.__cross
+
+    def get_face_normals(self):
+        """
+        Returns unit normals of the faces following the anticlockwise winding of their vertices, degenerate faces get zero normals
+        """
+
+        cross = self.__cal_cross()
+
+        if numpy is not None:
+            lengths = numpy.sqrt((cross * cross).sum(axis=1))[:, None]
+            return numpy.divide(cross, lengths, out=numpy.zeros_like(cross), where=lengths != 0)
+        else:
+            normals = array('d')
+            for f in range(0, len(cross), 3):
+                length = ((cross[f]**2) + (cross[f + 1]**2) + (cross[f + 2]**2))**0.5
+                if length == 0:
+                    normals.extend((0.0, 0.0, 0.0))
+                else:
+                    normals.extend((cross[f] / length, cross[f + 1] / length, cross[f + 2] / length))
+            return normals
+
+    def get_face_areas(self):
+        """
+        Returns areas of the faces
+        """
+
+        cross = self.__cal_cross()
+
+        if numpy is not None:
+            return numpy.sqrt((cross * cross).sum(axis=1)) * 0.5
+        else:
+            return array('d', [(((cross[f]**2) + (cross[f + 1]**2) + (cross[f + 2]**2))**0.5) * 0.5 for f in range(0, len(cross), 3)])
+
+    def __apply_matrix(self, matrix, origin):
+        # applies a row major 3x3 matrix to all the vertices about an origin in one pass
+        o_x, o_y, o_z = origin
+        a, b, c, d, e, f, g, h, i = matrix
+
+        if numpy is not None:
+            offset = numpy.array((o_x, o_y, o_z))
+            self.__vertices = ((self.__vertices - offset) @ numpy.array(((a, d, g), (b, e, h), (c, f, i)), dtype=numpy.float64)) + offset
+        else:
+            points = [(x - o_x, y - o_y, z - o_z) for x, y, z in zip(self.__vertices[0::3], self.__vertices[1::3], self.__vertices[2::3])]
+            self.__vertices = array('d', [coord for x, y, z in points for coord in ((x * a) + (y * b) + (z * c) + o_x,
+                                                                                  (x * d) + (y * e) + (z * f) + o_y,
+                                                                                  (x * g) + (y * h) + (z * i) + o_z)])
+
+        self.__update()
+
     def translate(self, x, y, z):
         """
         Moves the surface in space along X, Y and Z axes by amounts defined by x, y and z arguments
         """
 
-        for i in range(self.__num_of_points):
-            self.__coord_list[i][0] = self.__coord_list[i][0] + x
-            self.__coord_list[i][1] = self.__coord_list[i][1] + y
-            self.__coord_list[i][2] = self.__coord_list[i][2] + z
+        if numpy is not None:
+            self.__vertices = self.__vertices + (x, y, z)
+        else:
+            offset = (x, y, z)
+            vertices = self.__vertices
+            self.__vertices = array('d', [vertices[v] + offset[v % 3] for v in range(len(vertices))])
 
         self.__centroid = self.__cal_centroid()
 
     def transform(self, matrix):
         """
-        Applies a matrix transformation to the surface vertices about its centroid
+        Applies a matrix transformation given as a row major 3x3 matrix, an OMatrix3D or an OQuaternion to the surface
+        vertices about its centroid
         """
 
-        if type(matrix) is tuple or type(matrix) is list:
+        if type(matrix) is OQuaternion:
+            matrix = matrix.matrix
 
-            if len(matrix) == 9:
+        if type(matrix) is tuple or type(matrix) is list or type(matrix) is OMatrix3D:
 
-                old_centroid = (self.__centroid[0], self.__centroid[1], self.__centroid[2])
+            if len(matrix) == 9 and self.__centroid is not None:
 
-                self.translate(-old_centroid[0], -old_centroid[1], -old_centroid[2])
-
-                for i in range(self.__num_of_points):
-                    old_point = (self.__coord_list[i][0], self.__coord_list[i][1], self.__coord_list[i][2])
-                    self.__coord_list[i][0] = (old_point[0] * matrix[0]) + (old_point[1] * matrix[1]) + (old_point[2] * matrix[2])
-                    self.__coord_list[i][1] = (old_point[0] * matrix[3]) + (old_point[1] * matrix[4]) + (old_point[2] * matrix[5])
-                    self.__coord_list[i][2] = (old_point[0] * matrix[6]) + (old_point[1] * matrix[7]) + (old_point[1] * matrix[8])
-
-                self.translate(old_centroid[0], old_centroid[1], old_centroid[2])
-
-                self.__centroid = self.__cal_centroid()
+                self.__apply_matrix(matrix, self.__centroid)
 
     def transform_point(self, matrix, point):
         """
-        Applies a matrix transformation to the surface vertices about a defined point
+        Applies a matrix transformation given as a row major 3x3 matrix, an OMatrix3D or an OQuaternion to the surface
+        vertices about a defined point
         """
 
-        if (type(matrix) is list or type(matrix) is tuple) and (type(point) is tuple or type(point) is list or type(point) is OPoint3D):
+        if type(matrix) is OQuaternion:
+            matrix = matrix.matrix
 
-            if len(matrix) == 9 and len(point) == 3:
+        if (type(matrix) is list or type(matrix) is tuple or type(matrix) is OMatrix3D) and (type(point) is tuple or type(point) is list or type(point) is OPoint3D):
 
-                old_centroid = (point[0], point[1], point[2])
-
-                self.translate(-old_centroid[0], -old_centroid[1], -old_centroid[2])
+            if len(matrix) == 9 and len(point) == 3:
 
-                for i in range(self.__num_of_points):
-                    old_point = (self.__coord_list[i][0], self.__coord_list[i][1], self.__coord_list[i][2])
-                    self.__coord_list[i][0] = (old_point[0] * matrix[0]) + (old_point[1] * matrix[1]) + (old_point[2] * matrix[2])
-                    self.__coord_list[i][1] = (old_point[0] * matrix[3]) + (old_point[1] * matrix[4]) + (old_point[2] * matrix[5])
-                    self.__coord_list[i][2] = (old_point[0] * matrix[6]) + (old_point[1] * matrix[7]) + (old_point[1] * matrix[8])
+                self.__apply_matrix(matrix, point)
 
-                self.translate(old_centroid[0], old_centroid[1], old_centroid[2])
+    def transform_homogeneous(self, matrix):
+        """
+        Applies a homogeneous transformation given as an OMatrix4D or a row major 4x4 matrix (or its top three rows) to
+        the surface vertices in one pass, vertices are divided by the transformed w coordinate when the last row is not
+        (0, 0, 0, 1)
+        """
 
-                self.__centroid = self.__cal_centroid()
+        if (type(matrix) is tuple or type(matrix) is list or type(matrix) is OMatrix4D) and (len(matrix) == 12 or len(matrix) == 16):
+
+            m = OMatrix4D(matrix).matrix
+            projective = m[12:16] != (0, 0, 0, 1)
+
+            if numpy is not None:
+                m = numpy.array(m, dtype=numpy.float64).reshape(4, 4)
+                vertices = (self.__vertices @ m[0:3, 0:3].T) + m[0:3, 3]
+                if projective:
+                    w = (self.__vertices @ m[3, 0:3]) + m[3, 3]
+                    w[w == 0] = 1
+                    vertices = vertices / w[:, None]
+                self.__vertices = vertices
+            else:
+                new_vertices = array('d')
+                for x, y, z in zip(self.__vertices[0::3], self.__vertices[1::3], self.__vertices[2::3]):
+                    new_x = (m[0] * x) + (m[1] * y) + (m[2] * z) + m[3]
+                    new_y = (m[4] * x) + (m[5] * y) + (m[6] * z) + m[7]
+                    new_z = (m[8] * x) + (m[9] * y) + (m[10] * z) + m[11]
+                    if projective:
+                        w = (m[12] * x) + (m[13] * y) + (m[14] * z) + m[15]
+                        if w != 0:
+                            new_x = new_x / w
+                            new_y = new_y / w
+                            new_z = new_z / w
+                    new_vertices.extend((new_x, new_y, new_z))
+                self.__vertices = new_vertices
+
+            self.__update()
 
     def scale(self, x, y, z):
         """
         Scale the surface vertices about its centroid
         """
 
-        old_centroid = (self.__centroid[0], self.__centroid[1], self.__centroid[2])
-
-        self.translate(-old_centroid[0], -old_centroid[1], -old_centroid[2])
-
-        for i in range(self.__num_of_points):
-            old_point = (self.__coord_list[i][0], self.__coord_list[i][1], self.__coord_list[i][2])
-            self.__coord_list[i][0] = old_point[0] * x
-            self.__coord_list[i][1] = old_point[1] * y
-            self.__coord_list[i][2] = old_point[2] * z
-
-        self.translate(old_centroid[0], old_centroid[1], old_centroid[2])
-
-        self.__centroid = self.__cal_centroid()
+        if self.__centroid is not None:
+            self.__apply_matrix((x, 0, 0, 0, y, 0, 0, 0, z), self.__centroid)
 
     def scale_point(self, x, y, z, point):
         """
@@ -236,38 +482,15 @@ class OSurface:
 
             if len(point) == 3:
 
-                old_centroid = (point[0], point[1], point[2])
-
-                self.translate(-old_centroid[0], -old_centroid[1], -old_centroid[2])
-
-                for i in range(self.__num_of_points):
-                    old_point = (self.__coord_list[i][0], self.__coord_list[i][1], self.__coord_list[i][2])
-                    self.__coord_list[i][0] = old_point[0] * x
-                    self.__coord_list[i][1] = old_point[1] * y
-                    self.__coord_list[i][2] = old_point[2] * z
-
-                self.translate(old_centroid[0], old_centroid[1], old_centroid[2])
-
-                self.__centroid = self.__cal_centroid()
+                self.__apply_matrix((x, 0, 0, 0, y, 0, 0, 0, z), point)
 
     def shear(self, xy, yx, xz, zx, yz, zy):
         """
         Shear the surface vertices about its centroid
         """
 
-        old_centroid = (self.__centroid[0], self.__centroid[1], self.__centroid[2])
-
-        self.translate(-old_centroid[0], -old_centroid[1], -old_centroid[2])
-
-        for i in range(self.__num_of_points):
-            old_point = (self.__coord_list[i][0], self.__coord_list[i][1], self.__coord_list[i][2])
-            self.__coord_list[i][0] = old_point[0] + (old_point[1] * yx) + (old_point[2] * zx)
-            self.__coord_list[i][1] = (old_point[0] * xy) + old_point[1] + (old_point[2] * zy)
-            self.__coord_list[i][2] = (old_point[0] * xz) + (old_point[1] * yz) + old_point[2]
-
-        self.translate(old_centroid[0], old_centroid[1], old_centroid[2])
-
-        self.__centroid = self.__cal_centroid()
+        if self.__centroid is not None:
+            self.__apply_matrix((1, yx, zx, xy, 1, zy, xz, yz, 1), self.__centroid)
 
     def shear_point(self, xy, yx, xz, zx, yz, zy, point):
         """
@@ -278,60 +501,17 @@ class OSurface:
 
             if len(point) == 3:
 
-                old_centroid = (point[0], point[1], point[2])
-
-                self.translate(-old_centroid[0], -old_centroid[1], -old_centroid[2])
-
-                for i in range(self.__num_of_points):
-                    old_point = (self.__coord_list[i][0], self.__coord_list[i][1], self.__coord_list[i][2])
-                    self.__coord_list[i][0] = old_point[0] + (old_point[1] * yx) + (old_point[2] * zx)
-                    self.__coord_list[i][1] = (old_point[0] * xy) + old_point[1] + (old_point[2] * zy)
-                    self.__coord_list[i][2] = (old_point[0] * xz) + (old_point[1] * yz) + old_point[2]
-
-                self.translate(old_centroid[0], old_centroid[1], old_centroid[2])
-
-                self.__centroid = self.__cal_centroid()
+                self.__apply_matrix((1, yx, zx, xy, 1, zy, xz, yz, 1), point)
 
     def rotate_centroid(self, angle_x, angle_y, angle_z):
         """
         Rotates the surface by degrees about its centroid
         """
 
-        old_centroid = (self.__centroid[0], self.__centroid[1], self.__centroid[2])
-
-        self.translate(-old_centroid[0], -old_centroid[1], -old_centroid[2])
-
-        if angle_x != 0:
-
-            for coord_i in range(self.__num_of_points):
-                old_coord_x = self.__coord_list[coord_i][0]
-                old_coord_y = self.__coord_list[coord_i][1]
-                old_coord_z = self.__coord_list[coord_i][2]
-                self.__coord_list[coord_i][0] = old_coord_x
-                self.__coord_list[coord_i][1] = (cos(radians(angle_x)) * old_coord_y) - (sin(radians(angle_x)) * old_coord_z)
-                self.__coord_list[coord_i][2] = (sin(radians(angle_x)) * old_coord_y) + (cos(radians(angle_x)) * old_coord_z)
-
-        if angle_y != 0:
-
-            for coord_i in range(self.__num_of_points):
-                old_coord_x = self.__coord_list[coord_i][0]
-                old_coord_y = self.__coord_list[coord_i][1]
-                old_coord_z = self.__coord_list[coord_i][2]
-                self.__coord_list[coord_i][0] = (cos(radians(angle_y)) * old_coord_x) + (sin(radians(angle_y)) * old_coord_z)
-                self.__coord_list[coord_i][1] = old_coord_y
-                self.__coord_list[coord_i][2] = -(sin(radians(angle_y)) * old_coord_x) + (cos(radians(angle_y)) * old_coord_z)
-
-        if angle_z != 0:
-
-            for coord_i in range(self.__num_of_points):
-                old_coord_x = self.__coord_list[coord_i][0]
-                old_coord_y = self.__coord_list[coord_i][1]
-                old_coord_z = self.__coord_list[coord_i][2]
-                self.__coord_list[coord_i][0] = (cos(radians(angle_z)) * old_coord_x) - (sin(radians(angle_z)) * old_coord_y)
-                self.__coord_list[coord_i][1] = (sin(radians(angle_z)) * old_coord_x) + (cos(radians(angle_z)) * old_coord_y)
-                self.__coord_list[coord_i][2] = old_coord_z
-
-        self.translate(old_centroid[0], old_centroid[1], old_centroid[2])
+        if self.__centroid is not None:
+            rotation = OMatrix3D()
+            rotation.rotate(angle_x, angle_y, angle_z)
+            self.__apply_matrix(rotation.matrix, (self.__centroid[0], self.__centroid[1], self.__centroid[2]))
 
     def rotate_point(self, angle_x, angle_y, angle_z, point):
         """
@@ -342,44 +522,6 @@ class OSurface:
 
             if len(point) == 3:
 
-                origin = (point[0], point[1], point[2])
-                self.translate(-origin[0], -origin[1], -origin[2])
-
-                if angle_x != 0:
-
-                    for coord_i in range(self.__num_of_points):
-                        old_coord_x = self.__coord_list[coord_i][0]
-                        old_coord_y = self.__coord_list[coord_i][1]
-                        old_coord_z = self.__coord_list[coord_i][2]
-                        self.__coord_list[coord_i][0] = old_coord_x
-                        self.__coord_list[coord_i][1] = (cos(radians(angle_x)) * old_coord_y) - (
-                                    sin(radians(angle_x)) * old_coord_z)
-                        self.__coord_list[coord_i][2] = (sin(radians(angle_x)) * old_coord_y) + (
-                                    cos(radians(angle_x)) * old_coord_z)
-
-                if angle_y != 0:
-
-                    for coord_i in range(self.__num_of_points):
-                        old_coord_x = self.__coord_list[coord_i][0]
-                        old_coord_y = self.__coord_list[coord_i][1]
-                        old_coord_z = self.__coord_list[coord_i][2]
-                        self.__coord_list[coord_i][0] = (cos(radians(angle_y)) * old_coord_x) + (
-                                    sin(radians(angle_y)) * old_coord_z)
-                        self.__coord_list[coord_i][1] = old_coord_y
-                        self.__coord_list[coord_i][2] = -(sin(radians(angle_y)) * old_coord_x) + (
-                                    cos(radians(angle_y)) * old_coord_z)
-
-                if angle_z != 0:
-
-                    for coord_i in range(self.__num_of_points):
-                        old_coord_x = self.__coord_list[coord_i][0]
-                        old_coord_y = self.__coord_list[coord_i][1]
-                        old_coord_z = self.__coord_list[coord_i][2]
-                        self.__coord_list[coord_i][0] = (cos(radians(angle_z)) * old_coord_x) - (
-                                    sin(radians(angle_z)) * old_coord_y)
-                        self.__coord_list[coord_i][1] = (sin(radians(angle_z)) * old_coord_x) + (
-                                    cos(radians(angle_z)) * old_coord_y)
-                        self.__coord_list[coord_i][2] = old_coord_z
-
-                self.translate(origin[0], origin[1], origin[2])
-                self.__centroid = self.__cal_centroid()
+                rotation = OMatrix3D()
+                rotation.rotate(angle_x, angle_y, angle_z)
+                self.__apply_matrix(rotation.matrix, (point[0], point[1], point[2]))
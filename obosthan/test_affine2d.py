@@ -0,0 +1,82 @@
+from math import isclose
+from obosthan import OPoint2D, OAffine2D, OLine2D, OPolygon
+
+
+def values_close(values, expected):
+    values = list(values)
+    expected = list(expected)
+    return len(values) == len(expected) and all(isclose(a, b, abs_tol=1e-9) for a, b in zip(values, expected))
+
+
+def test_compose_in_call_order():
+    affine = OAffine2D()
+    affine.translate(1, 2)
+    affine.rotate(90)
+    affine.scale(2, 3)
+
+    # translate, then rotate (x, y) -> (-y, x), then scale
+    assert values_close(affine.apply((1, 1)), (-6, 6))
+    assert values_close(affine.matrix, (0, -2, -4, 3, 0, 3))
+    assert OAffine2D().is_identity() and not affine.is_identity()
+
+
+def test_about_point_and_operators():
+    affine = OAffine2D()
+    affine.rotate_point(90, (1, 1))
+    assert values_close(affine * OPoint2D(2, 1), (1, 2))
+
+    other = OAffine2D((2, 0, 0, 2))
+    assert values_close((other * affine).apply((2, 1)), (2, 4))
+    assert values_close((affine * other).apply((2, 1)), (0, 4))
+
+    affine.reset()
+    affine.scale_point(2, 2, (1, 1))
+    affine.shear_point(1, 0, (0, 3))
+    assert values_close(affine.apply((2, 2)), (3, 3))
+
+
+def test_inverse():
+    affine = OAffine2D((1, 2, 3, -1, 4, 5))
+    inverse = affine.inverse
+
+    assert isclose(affine.determinant, 6)
+    assert values_close((affine * inverse).matrix, (1, 0, 0, 0, 1, 0))
+    assert values_close(inverse.apply(affine.apply((7, -2))), (7, -2))
+    assert affine.inverse is not inverse and affine.inverse.matrix == inverse.matrix
+
+    # changing a returned inverse leaves the cached one as it was
+    inverse.translate(5, 5)
+    inverse.rotate(30)
+    assert values_close((affine * affine.inverse).matrix, (1, 0, 0, 0, 1, 0))
+    inverse.define_matrix((1, 0, 0, 1))
+    assert values_close(affine.inverse.apply(affine.apply((7, -2))), (7, -2))
+
+    affine.translate(1, 1)
+    assert values_close(affine.inverse.apply(affine.apply((7, -2))), (7, -2))
+    assert OAffine2D((1, 2, 2, 4)).inverse is None
+
+
+def test_deferred_line_transformations():
+    line = OLine2D(1, 2, 5, 7)
+    line.translate(1, 1)
+    line.rotate_point(90, (0, 0))
+    line.scale_point(2, 1, (0, 0))
+
+    assert values_close(line, (-6, 2, -16, 6))
+    assert isclose(line.length, (100 + 16)**0.5)
+
+    line.transform_point((0, 1, 1, 0), (0, 0))
+    line[0] = 0
+    assert values_close(line, (0, -6, 6, -16))
+
+
+def test_polygon_apply_affine(backend):
+    affine = OAffine2D()
+    affine.rotate(30)
+    affine.translate(2, -1)
+    polygon = OPolygon([(0, 0), (4, 0), (4, 2), (0, 3)])
+    polygon.apply_affine(affine)
+
+    expected = [affine.apply(point) for point in [(0, 0), (4, 0), (4, 2), (0, 3)]]
+    assert all(values_close(a, b) for a, b in zip(polygon.coords, expected))
+    assert isclose(polygon.get_area(), 10)
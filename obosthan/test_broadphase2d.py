@@ -0,0 +1,173 @@
+import random
+from math import log2
+from obosthan import OPoint2D, OLine2D, OPolygon, obody_bounds, osegment_box, OSpatialHash2D, OAABBTree2D, OSweepPrune2D
+
+
+def overlap(bounds1, bounds2):
+    return bounds1[2] >= bounds2[0] and bounds1[0] <= bounds2[2] and bounds1[3] >= bounds2[1] and bounds1[1] <= bounds2[3]
+
+
+def random_body(rng):
+    x = rng.uniform(0, 100)
+    y = rng.uniform(0, 100)
+    kind = rng.random()
+    if kind < 0.4:
+        size = rng.choice([0.5, 2, 10, 40])
+        return (OPolygon([(x, y), (x + (size * rng.random()) + 0.1, y), (x, y + (size * rng.random()) + 0.1)]), None)
+    elif kind < 0.7:
+        return (OLine2D(x, y, x + rng.uniform(-5, 5), y + rng.uniform(-5, 5)), None)
+    else:
+        return (OPoint2D(x, y), rng.uniform(0.1, 3))
+
+
+def all_pairs(bodies):
+    bounds = [obody_bounds(body, radius) for body, radius in bodies]
+    return {frozenset((id(bodies[i][0]), id(bodies[j][0]))) for i in range(len(bodies)) for j in range(i + 1, len(bodies)) if overlap(bounds[i], bounds[j])}
+
+
+def check_frames(structure, seed, frames=6):
+    """
+    Moves, removes and inserts random bodies for a few frames and compares candidate pairs and queries with all pairs testing
+    """
+
+    rng = random.Random(seed)
+    bodies = [random_body(rng) for _ in range(250)]
+    for body, radius in bodies:
+        structure.insert(body, radius)
+
+    for frame in range(frames):
+        for body, radius in bodies:
+            if rng.random() < 0.5:
+                if type(body) is OPoint2D:
+                    body[0] = body[0] + rng.uniform(-1, 1)
+                    body[1] = body[1] + rng.uniform(-1, 1)
+                else:
+                    body.translate(rng.uniform(-1, 1), rng.uniform(-1, 1))
+                structure.move(body)
+        for _ in range(10):
+            body, radius = bodies.pop(rng.randrange(len(bodies)))
+            structure.remove(body)
+        for _ in range(10):
+            bodies.append(random_body(rng))
+            structure.insert(*bodies[-1])
+
+        pairs = [frozenset((id(body1), id(body2))) for body1, body2 in structure.candidate_pairs()]
+        assert len(pairs) == len(set(pairs))
+        assert set(pairs) == all_pairs(bodies)
+
+        region = (20 + frame, 20, 50, 60 - frame)
+        expected = {id(body) for body, radius in bodies if overlap(obody_bounds(body, radius), region)}
+        assert {id(body) for body in structure.query(region)} == expected
+
+    assert len(structure) == len(bodies)
+    assert all(body in structure for body, radius in bodies)
+    return bodies
+
+
+def test_obody_bounds():
+    assert obody_bounds(OPolygon([(1, 5), (3, 2), (0, 4)])) == (0, 2, 3, 5)
+    assert obody_bounds(OLine2D(4, 1, 2, 3)) == (2, 1, 4, 3)
+    assert obody_bounds(OPoint2D(1, 1), 2) == (-1, -1, 3, 3)
+    assert obody_bounds((1, 2)) == (1, 2, 1, 2)
+
+
+def test_spatial_hash_matches_all_pairs():
+    grid = OSpatialHash2D(5)
+    bodies = check_frames(grid, 1)
+
+    circle = next(body for body, radius in bodies if radius is not None)
+    grid.move(circle, 50)
+    assert grid.get_radius(circle) == 50
+    assert set(map(frozenset, ((id(a), id(b)) for a, b in grid.candidate_pairs()))) == all_pairs([(body, 50 if body is circle else radius) for body, radius in bodies])
+
+    grid.clear()
+    assert len(grid) == 0 and list(grid.candidate_pairs()) == []
+
+
+def segment_entry(point1, point2, bounds):
+    # fraction where a segment enters a box by sampling both slabs, None when it misses
+    t_min = 0.0
+    t_max = 1.0
+    for axis in range(2):
+        start = point1[axis]
+        delta = point2[axis] - start
+        if delta == 0:
+            if start < bounds[axis] or start > bounds[axis + 2]:
+                return None
+        else:
+            t1 = (bounds[axis] - start) / delta
+            t2 = (bounds[axis + 2] - start) / delta
+            t_min = max(t_min, min(t1, t2))
+            t_max = min(t_max, max(t1, t2))
+    return t_min if t_min <= t_max else None
+
+
+def test_osegment_box_matches_sampled_entry():
+    rng = random.Random(7)
+    for _ in range(500):
+        bounds = (rng.randint(0, 5), rng.randint(0, 5), rng.randint(5, 10), rng.randint(5, 10))
+        point1 = (rng.randint(-3, 13), rng.randint(-3, 13))
+        point2 = point1 if rng.random() < 0.1 else (rng.randint(-3, 13), rng.randint(-3, 13))
+        assert osegment_box(point1, point2, bounds) == segment_entry(point1, point2, bounds)
+
+    assert osegment_box((-2, 1), (2, 1), (0, 0, 1, 1)) == 0.5 and osegment_box((0.5, 0.5), (9, 9), (0, 0, 1, 1)) == 0
+
+
+def test_aabb_tree_matches_all_pairs():
+    tree = OAABBTree2D(0.5)
+    bodies = check_frames(tree, 2)
+
+    assert tree.height <= 2 * log2(len(tree)) + 1
+
+    for point1, point2 in (((-5, 40), (105, 60)), ((50, -5), (50, 105)), ((10, 10), (10, 10)), ((90, 20), (5, 95))):
+        entries = [(segment_entry(point1, point2, obody_bounds(body, radius)), body) for body, radius in bodies]
+        hits = {id(body) for entry, body in entries if entry is not None}
+        cast = tree.ray_cast(point1, point2)
+        assert {id(body) for body in cast} == hits
+        fractions = [segment_entry(point1, point2, obody_bounds(body, tree.get_radius(body))) for body in cast]
+        assert fractions == sorted(fractions)
+
+        # a callback returning 0 stops the search at the first body
+        seen = []
+        tree.ray_cast(point1, point2, lambda body: seen.append(body) or 0)
+        assert len(seen) == (1 if hits else 0)
+
+    tree.clear()
+    assert len(tree) == 0 and tree.ray_cast((0, 0), (1, 1)) == []
+
+
+def test_sweep_prune_matches_all_pairs():
+    for axes in (1, 2):
+        sweep = OSweepPrune2D(axes)
+        bodies = check_frames(sweep, 3 + axes)
+
+        # bodies inserted and removed again before the next sort never reach the end point lists
+        rng = random.Random(axes)
+        pending = [random_body(rng) for _ in range(20)]
+        for body, radius in pending:
+            sweep.insert(body, radius)
+            sweep.insert(body, radius)
+        for body, radius in pending[::2]:
+            sweep.remove(body)
+        bodies.extend(pending[1::2])
+
+        for body, radius in bodies:
+            if type(body) is not OPoint2D:
+                body.translate(0.5, -0.5)
+        sweep.update()
+        assert set(map(frozenset, ((id(a), id(b)) for a, b in sweep.candidate_pairs()))) == all_pairs(bodies)
+        assert len(sweep) == len(bodies)
+
+
+def test_sweep_prune_touching_boxes_overlap():
+    sweep = OSweepPrune2D(2)
+    polygon1 = OPolygon([(0, 0), (1, 0), (1, 1)])
+    polygon2 = OPolygon([(1, 1), (2, 1), (2, 2)])
+    line = OLine2D(2, 2, 3, 5)
+    for body in (polygon1, polygon2, line):
+        sweep.insert(body)
+
+    pairs = {frozenset((id(a), id(b))) for a, b in sweep.candidate_pairs()}
+    assert pairs == {frozenset((id(polygon1), id(polygon2))), frozenset((id(polygon2), id(line)))}
+    sweep.clear()
+    assert len(sweep) == 0 and list(sweep.candidate_pairs()) == []
@@ -0,0 +1,572 @@
+import random
+from math import cos, sin, pi, isclose
+from obosthan import OPoint2D, OPointArray2D, OPolygon, opoly2, ogjk2, oepa2, oconvex_hull
+from obosthan import OLine2D, OAABBTree2D, oline2_sweep, oray_poly, oray_cast, otoi_circle2, otoi_line_circle, otoi_poly2
+from obosthan import ocircle2, oline2, oline_circle, opoly_line, ocircle2_many, oline2_many, oline_circle_many, opoly_line_many
+from obosthan import collision2d
+
+
+def orientation(point1, point2, point3):
+    return ((point2[0] - point1[0]) * (point3[1] - point1[1])) - ((point2[1] - point1[1]) * (point3[0] - point1[0]))
+
+
+def on_segment(point, point1, point2):
+    return min(point1[0], point2[0]) <= point[0] <= max(point1[0], point2[0]) and min(point1[1], point2[1]) <= point[1] <= max(point1[1], point2[1])
+
+
+def segments_intersect(point1, point2, point3, point4):
+    o1 = orientation(point1, point2, point3)
+    o2 = orientation(point1, point2, point4)
+    o3 = orientation(point3, point4, point1)
+    o4 = orientation(point3, point4, point2)
+    if ((o1 > 0 and o2 < 0) or (o1 < 0 and o2 > 0)) and ((o3 > 0 and o4 < 0) or (o3 < 0 and o4 > 0)):
+        return True
+    return (o1 == 0 and on_segment(point3, point1, point2)) or (o2 == 0 and on_segment(point4, point1, point2)) or \
+        (o3 == 0 and on_segment(point1, point3, point4)) or (o4 == 0 and on_segment(point2, point3, point4))
+
+
+def point_in_polygon(point, vertices):
+    inside = False
+    for i in range(len(vertices)):
+        x1, y1 = vertices[i - 1]
+        x2, y2 = vertices[i]
+        if (y1 > point[1]) != (y2 > point[1]) and point[0] < x1 + ((point[1] - y1) * (x2 - x1) / (y2 - y1)):
+            inside = not inside
+    return inside
+
+
+def sides(vertices):
+    return [(vertices[i - 1], vertices[i]) for i in range(len(vertices))]
+
+
+def polygons_overlap(vertices1, vertices2):
+    if any(segments_intersect(a, b, c, d) for a, b in sides(vertices1) for c, d in sides(vertices2)):
+        return True
+    return point_in_polygon(vertices1[0], vertices2) or point_in_polygon(vertices2[0], vertices1)
+
+
+def point_segment_distance(point, point1, point2):
+    dx = point2[0] - point1[0]
+    dy = point2[1] - point1[1]
+    length_sq = (dx**2) + (dy**2)
+    t = 0 if length_sq == 0 else max(0, min(1, (((point[0] - point1[0]) * dx) + ((point[1] - point1[1]) * dy)) / length_sq))
+    return ((point[0] - point1[0] - (t * dx))**2 + (point[1] - point1[1] - (t * dy))**2)**0.5
+
+
+def polygon_distance(vertices1, vertices2):
+    if polygons_overlap(vertices1, vertices2):
+        return 0.0
+    return min([point_segment_distance(p, a, b) for p in vertices1 for a, b in sides(vertices2)] +
+               [point_segment_distance(p, a, b) for p in vertices2 for a, b in sides(vertices1)])
+
+
+def random_convex(rng, count, x, y, radius):
+    angles = sorted(rng.uniform(0, 2 * pi) for _ in range(count))
+    vertices = [(x + (radius * cos(angle)), y + (radius * sin(angle))) for angle in angles]
+    if rng.random() < 0.3:
+        vertices.reverse()
+    return vertices
+
+
+def random_star(rng, count, x, y, radius):
+    # simple but usually concave polygon with vertices at random distances around a centre, less than half a turn apart
+    while True:
+        angles = sorted(rng.uniform(0, 2 * pi) for _ in range(count))
+        if all((angles[(i + 1) % count] - angles[i]) % (2 * pi) < 3 for i in range(count)):
+            break
+    radii = [radius * rng.uniform(0.2, 1) for _ in angles]
+    return [(x + (r * cos(angle)), y + (r * sin(angle))) for r, angle in zip(radii, angles)]
+
+
+def random_convex_pairs(seed, count=400):
+    rng = random.Random(seed)
+    for _ in range(count):
+        vertices1 = random_convex(rng, rng.choice([3, 4, 8, 16, 40]), 0, 0, rng.uniform(1, 5))
+        vertices2 = random_convex(rng, rng.choice([3, 4, 8, 16, 40]), rng.uniform(-8, 8), rng.uniform(-8, 8), rng.uniform(1, 5))
+        yield vertices1, vertices2
+
+
+def test_opoly2_matches_brute_force_for_convex_polygons(backend):
+    for vertices1, vertices2 in random_convex_pairs(10):
+        assert opoly2(OPolygon(vertices1), OPolygon(vertices2)) == int(polygons_overlap(vertices1, vertices2))
+
+
+def test_opoly2_matches_brute_force_for_concave_polygons(backend):
+    rng = random.Random(15)
+    for _ in range(300):
+        vertices1 = random_star(rng, rng.randint(3, 20), 0, 0, rng.uniform(2, 6))
+        if rng.random() < 0.5:
+            vertices2 = random_star(rng, rng.randint(3, 20), rng.uniform(-8, 8), rng.uniform(-8, 8), rng.uniform(1, 6))
+        else:
+            vertices2 = random_convex(rng, rng.choice([3, 4, 8]), rng.uniform(-8, 8), rng.uniform(-8, 8), rng.uniform(0.5, 3))
+        polygon1 = OPolygon(vertices1)
+        polygon2 = OPolygon(vertices2)
+        overlapping = polygons_overlap(vertices1, vertices2)
+
+        assert opoly2(polygon1, polygon2) == int(overlapping)
+        result = opoly2(polygon1, polygon2, manifold=True)
+        assert (result is not None) == overlapping
+        if result is not None:
+            assert result[1] >= 0 and isclose(result[0].length, result[1], abs_tol=1e-12)
+
+
+def test_opoly2_box_in_the_notch_of_an_l_shape(backend):
+    l_shape = OPolygon([(0, 0), (4, 0), (4, 1), (1, 1), (1, 4), (0, 4)])
+    box = OPolygon([(2, 2), (3, 2), (3, 3), (2, 3)])
+
+    assert opoly2(l_shape, box) == 0 and opoly2(box, l_shape) == 0
+    assert opoly2(l_shape, box, manifold=True) is None
+    box.translate(-1.5, -1.5)
+    mtv, depth, contacts = opoly2(l_shape, box, manifold=True)
+    assert isclose(depth, 0.5) and len(contacts) >= 1
+
+
+def test_opoly2_follows_transformations(backend):
+    polygon1 = OPolygon([(0, 0), (2, 0), (2, 2), (0, 2)])
+    polygon2 = OPolygon([(3, 0), (5, 0), (4, 2)])
+
+    assert opoly2(polygon1, polygon2) == 0
+    polygon2.translate(-1.5, 0)
+    assert opoly2(polygon1, polygon2) == 1
+    polygon2.rotate_centroid(180)
+    polygon2.translate(0, 3)
+    assert opoly2(polygon1, polygon2) == 0
+    assert opoly2(polygon1, OPolygon([])) == 0
+
+
+def moved(vertices, x, y):
+    return [(vertex[0] + x, vertex[1] + y) for vertex in vertices]
+
+
+def test_opoly2_manifold_separates_by_the_minimum_translation(backend):
+    for vertices1, vertices2 in random_convex_pairs(11):
+        result = opoly2(OPolygon(vertices1), OPolygon(vertices2), manifold=True)
+        if not polygons_overlap(vertices1, vertices2):
+            assert result is None
+            continue
+
+        mtv, depth, contacts = result
+        assert isclose(mtv.length, depth, abs_tol=1e-12)
+        assert not polygons_overlap(vertices1, moved(vertices2, mtv[0] * 1.0001, mtv[1] * 1.0001))
+        if depth > 1e-6:
+            assert polygons_overlap(vertices1, moved(vertices2, mtv[0] * 0.99, mtv[1] * 0.99))
+
+        assert 1 <= len(contacts) <= 2
+        for contact in contacts:
+            assert polygon_distance([(contact[0], contact[1])], vertices1) <= depth + 1e-9
+            assert polygon_distance([(contact[0], contact[1])], vertices2) <= depth + 1e-9
+
+
+def test_opoly2_manifold_of_stacked_boxes():
+    ground = OPolygon([(0, 0), (10, 0), (10, 2), (0, 2)])
+    box = OPolygon([(4, 1.5), (6, 1.5), (6, 3.5), (4, 3.5)])
+
+    mtv, depth, contacts = opoly2(ground, box, manifold=True)
+    assert isclose(depth, 0.5) and isclose(mtv[0], 0, abs_tol=1e-12) and isclose(mtv[1], 0.5)
+    assert sorted((round(point[0], 9), round(point[1], 9)) for point in contacts) == [(4, 1.5), (6, 1.5)]
+
+
+def test_ogjk2_matches_brute_force_distance(backend):
+    for vertices1, vertices2 in random_convex_pairs(12):
+        polygon1 = OPolygon(vertices1)
+        polygon2 = OPolygon(vertices2)
+        cache = []
+        assert isclose(ogjk2(polygon1, polygon2, cache), polygon_distance(vertices1, vertices2), abs_tol=1e-9)
+
+        # a warm started call after a small move gives the same distance as a cold one
+        polygon2.translate(0.2, -0.1)
+        polygon2.rotate_centroid(5)
+        assert isclose(ogjk2(polygon1, polygon2, cache), ogjk2(polygon1, polygon2), abs_tol=1e-9)
+
+    assert ogjk2(OPolygon([]), OPolygon([(0, 0), (1, 0), (0, 1)])) is None
+
+
+def test_oepa2_depth_matches_sat(backend):
+    for vertices1, vertices2 in random_convex_pairs(13):
+        polygon1 = OPolygon(vertices1)
+        polygon2 = OPolygon(vertices2)
+        result = oepa2(polygon1, polygon2)
+        manifold = opoly2(polygon1, polygon2, manifold=True)
+        if manifold is None:
+            assert result is None
+        else:
+            assert isclose(result[1], manifold[1], abs_tol=1e-6)
+            assert isclose(result[0].length, result[1], abs_tol=1e-9)
+
+
+def test_oepa2_on_a_grid_with_shared_vertices_and_sides(backend):
+    # small integer polygons often share vertices, sides and side directions, which leaves origin on the GJK simplex boundary
+    rng = random.Random(14)
+    for _ in range(1500):
+        polygon1 = oconvex_hull([(rng.randint(0, 4), rng.randint(0, 4)) for _ in range(6)])
+        polygon2 = oconvex_hull([(rng.randint(0, 4), rng.randint(0, 4)) for _ in range(6)])
+        if len(polygon1) < 3 or len(polygon2) < 3:
+            continue
+        manifold = opoly2(polygon1, polygon2, manifold=True)
+        result = oepa2(polygon1, polygon2)
+        assert (ogjk2(polygon1, polygon2) == 0) == (manifold is not None)
+        if manifold is None:
+            assert result is None
+        else:
+            assert isclose(result[1], manifold[1], abs_tol=1e-9)
+
+
+def with_collinear(rng, vertices):
+    # inserts exact halves and quarters of the sides of an integer polygon as extra vertices
+    points = []
+    for i in range(len(vertices)):
+        (x1, y1), (x2, y2) = vertices[i - 1], vertices[i]
+        points.append((x1, y1))
+        for t in rng.choice([(), (0.5,), (0.25, 0.5, 0.75)]):
+            points.append((x1 + (t * (x2 - x1)), y1 + (t * (y2 - y1))))
+    return points
+
+
+def random_collinear_pairs(seed, count):
+    rng = random.Random(seed)
+    while count > 0:
+        hull1 = oconvex_hull([(rng.randint(0, 6), rng.randint(0, 6)) for _ in range(6)])
+        offset = rng.randint(-6, 6)
+        hull2 = oconvex_hull([(rng.randint(0, 6) + offset, rng.randint(0, 6)) for _ in range(6)])
+        if len(hull1) >= 3 and len(hull2) >= 3:
+            count -= 1
+            yield rng, with_collinear(rng, hull1.coord_tuples), with_collinear(rng, hull2.coord_tuples)
+
+
+def test_support_walks_over_collinear_vertices():
+    assert collision2d._support([0, 1, 2, 2, 0], [0, 0, 0, 2, 2], 0, 1, 1) in (3, 4)
+
+    for rng, vertices, other in random_collinear_pairs(15, 100):
+        x_coords = [x for x, y in vertices]
+        y_coords = [y for x, y in vertices]
+        for angle in range(0, 360, 15):
+            direction = (cos(angle * pi / 180), sin(angle * pi / 180))
+            projections = [(x * direction[0]) + (y * direction[1]) for x, y in vertices]
+            for start in range(len(vertices)):
+                index = collision2d._support(x_coords, y_coords, direction[0], direction[1], start)
+                assert projections[index] >= max(projections) - 1e-9
+
+
+def test_collinear_vertices_with_stale_caches(backend):
+    for rng, vertices1, vertices2 in random_collinear_pairs(16, 300):
+        polygon1 = OPolygon(vertices1)
+        polygon2 = OPolygon(vertices2)
+        distance = polygon_distance(vertices1, vertices2)
+        expected = oepa2(polygon1, polygon2)
+        manifold = opoly2(polygon1, polygon2, manifold=True)
+        if manifold is not None:
+            assert isclose(expected[1], manifold[1], abs_tol=1e-9)
+        for _ in range(3):
+            cache = [(rng.randrange(len(vertices1)), rng.randrange(len(vertices2))) for _ in range(rng.randint(1, 3))]
+            assert isclose(ogjk2(polygon1, polygon2, cache), distance, abs_tol=1e-9)
+            cache = [(rng.randrange(len(vertices1)), rng.randrange(len(vertices2))) for _ in range(rng.randint(1, 3))]
+            result = oepa2(polygon1, polygon2, cache)
+            assert (result is None) == (expected is None)
+            if result is not None:
+                assert isclose(result[1], expected[1], abs_tol=1e-9)
+
+    # touching rectangles with vertices in the middle of their sides
+    rectangle1 = OPolygon([(0, 0), (1, 0), (2, 0), (2, 1), (2, 2), (1, 2), (0, 2), (0, 1)])
+    rectangle2 = OPolygon([(2, 0), (3, 0), (4, 0), (4, 1), (4, 2), (3, 2), (2, 2), (2, 1)])
+    for cache in ([(1, 5)], [(0, 6), (7, 2)], [(5, 1), (1, 5), (6, 3)]):
+        assert ogjk2(rectangle1, rectangle2, cache) == 0
+
+
+def test_warm_started_frames_of_polygons_with_collinear_vertices(backend):
+    # quarter turns leave the sides axis aligned up to rounding, so their collinear vertices project almost but not exactly equal
+    rng = random.Random(17)
+    for _ in range(40):
+        width = rng.uniform(1, 3)
+        height = rng.uniform(1, 3)
+        count = rng.randint(2, 4)
+        box = []
+        for x1, y1, x2, y2 in ((0, 0, width, 0), (width, 0, width, height), (width, height, 0, height), (0, height, 0, 0)):
+            box.extend((x1 + ((x2 - x1) * k / count), y1 + ((y2 - y1) * k / count)) for k in range(count))
+        polygon1 = OPolygon(box)
+        offset = (width + rng.uniform(-1, 2), rng.uniform(-1, 1))
+        polygon2 = OPolygon(moved(box, offset[0], offset[1]))
+        cache = []
+        for _ in range(25):
+            polygon2.rotate_centroid(rng.choice([90, -90, 180]))
+            polygon2.translate(rng.uniform(-0.5, 0.5), rng.uniform(-0.5, 0.5))
+            polygon1.rotate_centroid(rng.choice([0, 90]))
+            assert isclose(ogjk2(polygon1, polygon2, cache), polygon_distance(polygon1.coord_tuples, polygon2.coord_tuples), abs_tol=1e-9)
+
+
+def test_iteration_limits_never_report_unproven_contact(monkeypatch):
+    square = OPolygon([(0, 0), (2, 0), (2, 2), (0, 2)])
+    overlapping = OPolygon([(1, 1), (3, 1.5), (2.5, 3), (1.2, 2.8)])
+    apart = OPolygon([(5, 5), (7, 5), (6, 7)])
+
+    monkeypatch.setattr(collision2d, 'GJK_ITERATIONS', 1)
+    assert ogjk2(square, apart) is None
+    assert ogjk2(square, overlapping) is None
+    assert oepa2(square, overlapping) is None
+
+    monkeypatch.setattr(collision2d, 'GJK_ITERATIONS', 20)
+    monkeypatch.setattr(collision2d, 'EPA_ITERATIONS', 0)
+    assert ogjk2(square, overlapping) == 0
+    assert oepa2(square, overlapping) is None
+
+    monkeypatch.setattr(collision2d, 'EPA_ITERATIONS', 32)
+    assert oepa2(square, overlapping) is not None
+
+
+def random_lines(rng, count):
+    # integer end points give parallel, collinear and touching lines, float ones give general crossings
+    if rng.random() < 0.5:
+        return [tuple(rng.randint(0, 10) for _ in range(4)) for _ in range(count)]
+    return [tuple(rng.uniform(0, 10) for _ in range(4)) for _ in range(count)]
+
+
+def point_matches(hit, point, result):
+    if type(result) is OPoint2D:
+        return bool(hit) and isclose(point[0], result[0], abs_tol=1e-9) and isclose(point[1], result[1], abs_tol=1e-9)
+    return bool(hit) == bool(result) and point[0] != point[0] and point[1] != point[1]
+
+
+def test_ocircle2_many_matches_ocircle2(backend):
+    rng = random.Random(20)
+    for _ in range(50):
+        circle = (rng.uniform(0, 10), rng.uniform(0, 10))
+        radius = rng.uniform(0.1, 3)
+        coords = [(rng.uniform(0, 10), rng.uniform(0, 10)) for _ in range(40)]
+        radii = [rng.uniform(0.1, 2) for _ in coords]
+
+        assert [bool(hit) for hit in ocircle2_many(circle, radius, coords, 1.0)] == [ocircle2(circle, radius, point, 1.0) for point in coords]
+        assert [bool(hit) for hit in ocircle2_many(circle, radius, OPointArray2D(coords), radii)] == \
+            [ocircle2(circle, radius, point, r) for point, r in zip(coords, radii)]
+
+
+def test_oline2_many_matches_oline2(backend):
+    rng = random.Random(21)
+    for _ in range(60):
+        lines = random_lines(rng, 40)
+        line = lines[0] if rng.random() < 0.3 else tuple(rng.uniform(0, 10) for _ in range(4))
+        mask, points = oline2_many(line, lines)
+
+        assert len(mask) == len(points) == len(lines)
+        assert all(point_matches(mask[i], points[i], oline2(line, target)) for i, target in enumerate(lines))
+
+
+def test_oline_circle_many_matches_oline_circle(backend):
+    rng = random.Random(22)
+    for _ in range(60):
+        lines = random_lines(rng, 40)
+        circle = (rng.uniform(0, 10), rng.uniform(0, 10))
+        radius = rng.uniform(0.1, 3)
+        penetrations = oline_circle_many(lines, circle, radius)
+
+        for penetration, line in zip(penetrations, lines):
+            expected = oline_circle(line, circle, radius)
+            if expected is None:
+                assert penetration != penetration
+            else:
+                assert isclose(penetration, expected, abs_tol=1e-9)
+
+
+def test_opoly_line_many_matches_opoly_line(backend):
+    rng = random.Random(23)
+    for _ in range(60):
+        lines = random_lines(rng, 40)
+        polygon = OPolygon([(rng.randint(0, 10), rng.randint(0, 10)) for _ in range(rng.randint(1, 7))])
+        mask, points = opoly_line_many(polygon, lines)
+
+        assert len(mask) == len(points) == len(lines)
+        assert all(point_matches(mask[i], points[i], opoly_line(polygon, target)) for i, target in enumerate(lines))
+
+
+def segment_fraction(point1, point2, point3, point4):
+    # fraction along point1 to point2 where it crosses the segment point3 to point4, None when it misses or runs parallel
+    dx = point2[0] - point1[0]
+    dy = point2[1] - point1[1]
+    side_x = point4[0] - point3[0]
+    side_y = point4[1] - point3[1]
+    denominator = (dx * side_y) - (dy * side_x)
+    if denominator == 0:
+        return None
+    t = (((point3[0] - point1[0]) * side_y) - ((point3[1] - point1[1]) * side_x)) / denominator
+    u = (((point3[0] - point1[0]) * dy) - ((point3[1] - point1[1]) * dx)) / denominator
+    return t if 0 <= t <= 1 and 0 <= u <= 1 else None
+
+
+def body_sides(body):
+    if type(body) is OLine2D:
+        return [((body[0], body[1]), (body[2], body[3]))]
+    coords = body.coords
+    return [(coords[i], coords[(i + 1) % len(coords)]) for i in range(len(coords))]
+
+
+def nearest_crossing(bodies, point1, point2):
+    crossings = [(t, i, body) for body in bodies for i, (a, b) in enumerate(body_sides(body)) for t in [segment_fraction(point1, point2, a, b)] if t is not None]
+    return min(crossings, key=lambda crossing: crossing[0]) if crossings else None
+
+
+def test_oray_poly_finds_the_nearest_side(backend):
+    square = OPolygon([(0, 0), (2, 0), (2, 2), (0, 2)])
+    point, side, distance = oray_poly(square, (-1, 1), (3, 1))
+    assert (point[0], point[1], side, distance) == (0, 1, 3, 1)
+    assert oray_poly(square, (3, 3), (5, 1)) is None
+    assert oray_poly(square, (1, 1), (1, 5))[1] == 2
+
+    rng = random.Random(24)
+    for _ in range(300):
+        polygon = OPolygon(random_star(rng, rng.randint(3, 12), 0, 0, 5))
+        point1 = (rng.uniform(-8, 8), rng.uniform(-8, 8))
+        point2 = (rng.uniform(-8, 8), rng.uniform(-8, 8))
+        expected = nearest_crossing([polygon], point1, point2)
+        result = oray_poly(polygon, point1, point2)
+        if expected is None:
+            assert result is None
+        else:
+            assert isclose(result[2], expected[0] * ((point2[0] - point1[0])**2 + (point2[1] - point1[1])**2)**0.5, abs_tol=1e-9)
+            assert point_segment_distance(result[0], *body_sides(polygon)[result[1]]) < 1e-9
+
+
+def test_oray_cast_matches_brute_force(backend):
+    rng = random.Random(25)
+    bodies = []
+    for i in range(200):
+        x = rng.uniform(0, 100)
+        y = rng.uniform(0, 100)
+        if i % 5 == 0:
+            bodies.append(OLine2D(x, y, x + rng.uniform(-5, 5), y + rng.uniform(-5, 5)))
+        else:
+            bodies.append(OPolygon(random_convex(rng, rng.randint(3, 8), x, y, rng.uniform(0.5, 4))))
+    tree = OAABBTree2D(0.5)
+    for body in bodies:
+        tree.insert(body)
+
+    for _ in range(200):
+        point1 = (rng.uniform(0, 100), rng.uniform(0, 100))
+        point2 = (rng.uniform(0, 100), rng.uniform(0, 100))
+        length = ((point2[0] - point1[0])**2 + (point2[1] - point1[1])**2)**0.5
+        expected = nearest_crossing(bodies, point1, point2)
+        for source in (bodies, tree):
+            result = oray_cast(source, point1, point2)
+            if expected is None:
+                assert result is None
+            else:
+                assert isclose(result[3], expected[0] * length, abs_tol=1e-9)
+                assert point_segment_distance(result[0], *body_sides(result[1])[result[2]]) < 1e-9
+
+    assert oray_cast('x', (0, 0), (1, 1)) is None
+
+
+def test_otoi_circle2_matches_the_analytic_time():
+    # centres close from 10 apart at a relative speed of 8, contact at a distance of 3
+    assert isclose(otoi_circle2((0, 0), 1, (4, 0), (10, 0), 2, (-4, 0)), 7 / 8)
+    assert otoi_circle2((0, 0), 1, (1, 0), (10, 0), 2, (-1, 0)) is None
+    assert otoi_circle2((0, 0), 1, (0, 0), (2, 0), 2, (0, 0)) == 0
+    assert otoi_circle2((0, 0), 1, (-4, 0), (10, 0), 2, (4, 0)) is None
+
+    rng = random.Random(26)
+    for _ in range(300):
+        circle1 = (rng.uniform(-5, 5), rng.uniform(-5, 5))
+        circle2 = (rng.uniform(-5, 5), rng.uniform(-5, 5))
+        velocity1 = (rng.uniform(-8, 8), rng.uniform(-8, 8))
+        velocity2 = (rng.uniform(-8, 8), rng.uniform(-8, 8))
+        radius1 = rng.uniform(0.1, 2)
+        radius2 = rng.uniform(0.1, 2)
+        t = otoi_circle2(circle1, radius1, velocity1, circle2, radius2, velocity2)
+
+        def apart(time):
+            return ((circle2[0] + (velocity2[0] * time) - circle1[0] - (velocity1[0] * time))**2 + (circle2[1] + (velocity2[1] * time) - circle1[1] - (velocity1[1] * time))**2)**0.5 - radius1 - radius2
+
+        samples = [i / 200 for i in range(201)]
+        if t is None:
+            assert all(apart(time) > 0 for time in samples)
+        else:
+            assert 0 <= t <= 1 and apart(t) < 1e-9
+            assert all(apart(time) > 0 for time in samples if time < t - 1e-9)
+
+
+def test_otoi_line_circle_matches_sampled_distances():
+    assert isclose(otoi_line_circle((0, 0, 4, 0), (2, 5), 1, (0, -8)), 0.5)
+    assert isclose(otoi_line_circle((0, 0, 4, 0), (7, 0), 1, (-4, 0)), 0.5)
+    assert otoi_line_circle((0, 0, 4, 0), (7, 5), 1, (0, -8)) is None
+
+    rng = random.Random(27)
+    for _ in range(300):
+        line = tuple(rng.uniform(-5, 5) for _ in range(4))
+        circle = (rng.uniform(-8, 8), rng.uniform(-8, 8))
+        velocity = (rng.uniform(-10, 10), rng.uniform(-10, 10))
+        radius = rng.uniform(0.1, 2)
+        t = otoi_line_circle(line, circle, radius, velocity)
+
+        def apart(time):
+            return point_segment_distance((circle[0] + (velocity[0] * time), circle[1] + (velocity[1] * time)), line[:2], line[2:]) - radius
+
+        samples = [i / 200 for i in range(201)]
+        if t is None:
+            assert all(apart(time) > 0 for time in samples)
+        else:
+            assert 0 <= t <= 1 and apart(t) < 1e-9
+            assert all(apart(time) > 0 for time in samples if time < t - 1e-9)
+
+
+def test_otoi_poly2_never_passes_the_first_contact(backend):
+    tolerance = 1e-4
+    rng = random.Random(28)
+    for vertices1, vertices2 in random_convex_pairs(29, 80):
+        velocity1 = (rng.uniform(-8, 8), rng.uniform(-8, 8))
+        velocity2 = (rng.uniform(-8, 8), rng.uniform(-8, 8))
+        t = otoi_poly2(OPolygon(vertices1), velocity1, OPolygon(vertices2), velocity2, tolerance)
+
+        def apart(time):
+            return polygon_distance(moved(vertices1, velocity1[0] * time, velocity1[1] * time), moved(vertices2, velocity2[0] * time, velocity2[1] * time))
+
+        samples = [i / 25 for i in range(26)]
+        if t is None:
+            assert all(apart(time) > 0 for time in samples)
+        else:
+            assert 0 <= t <= 1 and apart(t) <= tolerance + 1e-9
+            assert all(apart(time) > 0 for time in samples if time < t)
+
+
+def test_otoi_poly2_gives_none_when_the_iterations_run_out():
+    square = OPolygon([(0, 0), (1, 0), (1, 1), (0, 1)])
+    # a side sliding towards a vertex at a shallow angle closes the distance slowly
+    triangle = OPolygon([(3, 1.5), (5, 1.2), (5, 3)])
+
+    t = otoi_poly2(square, (0, 0), triangle, (-4, -1))
+    assert t is not None and 0 < t < 1
+    assert otoi_poly2(square, (0, 0), triangle, (-4, -1), iterations=1) is None
+    assert otoi_poly2(square, (0, 0), OPolygon([(0.5, 0.5), (2, 0.5), (2, 2)]), (1, 1), iterations=1) == 0
+
+
+def sweep_pairs(lines):
+    hits = list(oline2_sweep(lines))
+    pairs = [(min(i, j), max(i, j)) for point, i, j in hits]
+    assert len(pairs) == len(set(pairs))
+    return set(pairs), hits
+
+
+def test_oline2_sweep_matches_all_pairs(backend):
+    rng = random.Random(30)
+    for case in range(120):
+        count = rng.randint(2, 50)
+        if case % 4 == 0:
+            lines = [tuple(rng.uniform(0, 10) for _ in range(4)) for _ in range(count)]
+        elif case % 4 == 1:
+            # shared end points, vertical, collinear and zero length lines
+            lines = [tuple(rng.randint(0, 5) for _ in range(4)) for _ in range(count)]
+        elif case % 4 == 2:
+            lines = []
+            for _ in range(count):
+                x = rng.randint(0, 8)
+                y = rng.randint(0, 8)
+                lines.append((x, y, x + rng.randint(0, 4), y) if rng.random() < 0.5 else (x, y, x, y + rng.randint(0, 4)))
+        else:
+            # many lines through one point
+            lines = [(5, 5, 5 + rng.uniform(-5, 5), 5 + rng.uniform(-5, 5)) for _ in range(count)]
+
+        pairs, hits = sweep_pairs(lines if case % 3 else [OLine2D(*line) for line in lines])
+        assert pairs == {(i, j) for i in range(count) for j in range(i + 1, count) if oline2(lines[i], lines[j]) not in (None, False)}
+        for point, i, j in hits:
+            assert point_segment_distance(point, lines[i][:2], lines[i][2:]) < 1e-9
+            assert point_segment_distance(point, lines[j][:2], lines[j][2:]) < 1e-9
+        if backend == 'numpy':
+            assert sweep_pairs(collision2d.numpy.array(lines, dtype=float))[0] == pairs
+
+    assert list(oline2_sweep([])) == [] and list(oline2_sweep([(0, 0, 1, 1)])) == []
@@ -0,0 +1,142 @@
+import random
+import warnings
+from math import isclose, isnan
+from obosthan import OSurface, osphere3, obox3, obox_sphere3, oray_surface, OBVH3D
+
+
+def triangle_soup(rng, count, offset=(0, 0, 0)):
+    points = []
+    faces = []
+    for i in range(count):
+        centre = [rng.uniform(-10, 10) + o for o in offset]
+        points.extend(tuple(c + rng.uniform(-1, 1) for c in centre) for _ in range(3))
+        faces.append((3 * i, (3 * i) + 1, (3 * i) + 2))
+    return OSurface(points, faces)
+
+
+def random_rays(rng, count):
+    rays = [(tuple(rng.uniform(-15, 15) for _ in range(3)), tuple(rng.uniform(-1, 1) for _ in range(3))) for _ in range(count)]
+    # straight through the quad from both sides, along an axis, and a zero direction
+    return rays + [((0.7, 0.4, 5), (0, 0, -1)), ((0.25, 0.6, -3), (0, 0, 1)), ((0.3, 0.6, -20), (0, 0, 2)), ((0, 0, 0), (0, 0, 0))]
+
+
+def nearest_hit(surfaces, origin, direction, max_distance=float('inf')):
+    # distance and surface index of the nearest hit over every face of every surface
+    best = None
+    for i, surface in enumerate(surfaces):
+        hit = oray_surface(surface, origin, direction, max_distance)
+        if hit is not None and (best is None or hit[2] < best[0]):
+            best = (hit[2], i)
+    return best
+
+
+def check_rays(bvh, surfaces, rays, max_distance=float('inf')):
+    for origin, direction in rays:
+        expected = nearest_hit(surfaces, origin, direction, max_distance)
+        hit = bvh.ray_cast(origin, direction, max_distance)
+        if expected is None:
+            assert hit is None
+        else:
+            assert isclose(hit[3], expected[0], abs_tol=1e-9)
+            assert hit[1] is surfaces[expected[1]]
+            assert isclose(oray_surface(hit[1], origin, direction, max_distance)[2], hit[3], abs_tol=1e-9)
+            assert all(isclose(h, o + (hit[3] * d / sum(c * c for c in direction)**0.5), abs_tol=1e-9) for h, o, d in zip(hit[0], origin, direction))
+
+    distances, surface_indices, face_indices = bvh.ray_cast_many([origin for origin, direction in rays], [direction for origin, direction in rays], max_distance)
+    for k, (origin, direction) in enumerate(rays):
+        expected = nearest_hit(surfaces, origin, direction, max_distance)
+        if expected is None:
+            assert isnan(distances[k]) and surface_indices[k] == -1 and face_indices[k] == -1
+        else:
+            assert isclose(distances[k], expected[0], abs_tol=1e-9) and surface_indices[k] == expected[1]
+            assert oray_surface(surfaces[surface_indices[k]], origin, direction, max_distance)[1] == face_indices[k]
+
+
+def test_sphere_and_box_tests(backend):
+    assert osphere3((0, 0, 0), 1, (1, 1, 1), 0.8) and not osphere3((0, 0, 0), 1, (1, 1, 1), 0.7)
+    assert osphere3((0, 0, 0), 1, (2, 0, 0), 1)
+
+    box1 = OSurface([(0, 0, 0), (1, 0, 0), (0, 1, 1)], [(0, 1, 2)])
+    box2 = OSurface([(1, 1, 1), (2, 1, 1), (1, 2, 2)], [(0, 1, 2)])
+    box3 = OSurface([(1.5, 0, 0), (2, 0, 0), (2, 1, 1)], [(0, 1, 2)])
+    assert obox3(box1, box2) and not obox3(box1, box3) and obox3(box2, box3)
+    assert obox3(box1, OSurface([])) is None
+
+    assert obox_sphere3(box1, (2, 2, 2), 1.75) and not obox_sphere3(box1, (2, 2, 2), 1.7)
+    assert obox_sphere3(box1, (0.5, 0.5, 0.5), 0.01)
+    assert obox_sphere3(OSurface([]), (0, 0, 0), 1) is None
+
+
+def test_oray_surface(backend):
+    quad = OSurface([(0, 0, 0), (1, 0, 0), (0, 1, 0), (1, 1, 0)], [(0, 1, 3, 2)])
+
+    point, face, distance = oray_surface(quad, (0.75, 0.5, 4), (0, 0, -2))
+    assert isclose(distance, 4) and tuple(point) == (0.75, 0.5, 0) and face in (0, 1)
+    assert oray_surface(quad, (0.75, 0.5, 4), (0, 0, -1), 3.9) is None
+    assert oray_surface(quad, (0.75, 0.5, 4), (0, 0, 1)) is None
+    assert oray_surface(quad, (2, 0.5, 4), (0, 0, -1)) is None
+    assert oray_surface(quad, (0.5, 0.5, 4), (0, 0, 0)) is None
+
+
+def test_bvh_matches_every_face(backend):
+    rng = random.Random(5)
+    quad = OSurface([(0, 0, 0), (1, 0, 0), (0, 1, 0), (1, 1, 0)], [(0, 1, 3, 2)])
+    surfaces = [triangle_soup(rng, 150), triangle_soup(rng, 100, (5, 0, 0)), quad]
+    rays = random_rays(rng, 200)
+
+    for leaf_size in (1, 4, 9):
+        bvh = OBVH3D(surfaces, leaf_size)
+        assert len(bvh) == bvh.num_of_triangles == 252 and bvh.leaf_size == leaf_size
+        assert bvh.surfaces == tuple(surfaces)
+        check_rays(bvh, surfaces, rays)
+    check_rays(bvh, surfaces, rays, 12)
+
+    # one shared origin or direction for all the rays
+    distances, surface_indices, face_indices = bvh.ray_cast_many((0.5, 0.5, 5), [(0, 0, -1), (0, 0, 1)])
+    assert isclose(distances[0], 5) and surface_indices[0] == 2 and face_indices[0] in (0, 1) and isnan(distances[1])
+    distances, surface_indices, face_indices = bvh.ray_cast_many([(0.5, 0.5, 5), (0.5, 0.5, -5)], (0, 0, -1))
+    assert isclose(distances[0], 5) and surface_indices[0] == 2 and isnan(distances[1])
+
+
+def test_bvh_refit_follows_the_surfaces(backend):
+    rng = random.Random(6)
+    surfaces = [triangle_soup(rng, 120), triangle_soup(rng, 80, (0, 5, 0))]
+    rays = random_rays(rng, 150)
+    bvh = OBVH3D(surfaces)
+    nodes = bvh.num_of_nodes
+
+    surfaces[0].translate(1, 2, 3)
+    surfaces[1].rotate_centroid(30, 0, 15)
+    bvh.refit()
+    assert bvh.num_of_nodes == nodes
+    check_rays(bvh, surfaces, rays)
+
+    # a change in the number of faces rebuilds the hierarchy
+    surfaces[1].add_face(0, 1, 4)
+    bvh.refit()
+    assert bvh.num_of_triangles == 201
+    check_rays(bvh, surfaces, rays)
+
+
+def test_empty_bvh(backend):
+    bvh = OBVH3D([])
+    assert len(bvh) == 0 and bvh.num_of_nodes == 0
+    assert bvh.ray_cast((0, 0, 0), (1, 0, 0)) is None
+    distances, surface_indices, face_indices = bvh.ray_cast_many([(0, 0, 0)], (1, 0, 0))
+    assert isnan(distances[0]) and surface_indices[0] == -1 and face_indices[0] == -1
+
+
+def test_parallel_rays_do_not_warn(backend):
+    # rays parallel to the quad have a zero determinant against both its triangles, the upright triangle keeps them
+    # inside the bounding boxes so that the leaves are tested too
+    rng = random.Random(24)
+    surface = OSurface([(0, 0, 0), (1, 0, 0), (0, 1, 0), (1, 1, 0), (0, 0, 2)], [(0, 1, 3, 2), (0, 1, 4)])
+    bvh = OBVH3D([surface])
+    rays = [((rng.uniform(-2, 2), rng.uniform(-2, 2), rng.uniform(0.1, 1.9)), (rng.uniform(-1, 1), rng.uniform(-1, 1), 0)) for _ in range(100)]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        distances, surface_indices, face_indices = bvh.ray_cast_many([origin for origin, direction in rays], [direction for origin, direction in rays])
+        for k, (origin, direction) in enumerate(rays):
+            hit = oray_surface(surface, origin, direction)
+            assert (hit is None) == isnan(distances[k]) and (hit is None or (hit[1] == 2 and isclose(hit[2], distances[k], abs_tol=1e-9)))
@@ -0,0 +1,104 @@
+import random
+from obosthan import OPoint2D, OPointArray2D, OPolygon, oconvex_hull, OConvexHull2D
+from obosthan import hull2d
+
+
+def orientation(point1, point2, point3):
+    return ((point2[0] - point1[0]) * (point3[1] - point1[1])) - ((point2[1] - point1[1]) * (point3[0] - point1[0]))
+
+
+def extreme_points(points):
+    # points which lie neither on a segment between two other points nor in a triangle of three other points
+    points = sorted(set(points))
+    extreme = []
+    for p in points:
+        others = [q for q in points if q != p]
+        hidden = False
+        for i in range(len(others)):
+            for j in range(i + 1, len(others)):
+                a = others[i]
+                b = others[j]
+                if orientation(a, b, p) == 0 and min(a[0], b[0]) <= p[0] <= max(a[0], b[0]) and min(a[1], b[1]) <= p[1] <= max(a[1], b[1]):
+                    hidden = True
+                for c in others[j + 1:] if not hidden else []:
+                    signs = (orientation(a, b, p), orientation(b, c, p), orientation(c, a, p))
+                    if orientation(a, b, c) != 0 and (min(signs) >= 0 or max(signs) <= 0):
+                        hidden = True
+                        break
+                if hidden:
+                    break
+            if hidden:
+                break
+        if not hidden:
+            extreme.append(p)
+    return extreme
+
+
+def random_points(rng, count):
+    if rng.random() < 0.5:
+        return [(float(rng.randint(0, 6)), float(rng.randint(0, 6))) for _ in range(count)]
+    return [(rng.uniform(0, 10), rng.uniform(0, 10)) for _ in range(count)]
+
+
+def signed_area(points):
+    return sum((points[i - 1][0] * points[i][1]) - (points[i][0] * points[i - 1][1]) for i in range(len(points))) / 2
+
+
+def test_oconvex_hull_keeps_the_extreme_points_anticlockwise(backend):
+    rng = random.Random(50)
+    for _ in range(150):
+        points = random_points(rng, rng.randint(1, 20))
+        hull = oconvex_hull(points)
+        vertices = list(hull.coord_tuples)
+
+        assert sorted(vertices) == extreme_points(points)
+        if len(vertices) > 2:
+            assert signed_area(vertices) > 0
+            assert all(orientation(vertices[i - 2], vertices[i - 1], vertices[i]) > 0 for i in range(len(vertices)))
+
+        assert list(oconvex_hull(OPointArray2D(points)).coord_tuples) == vertices
+        assert list(oconvex_hull(OPolygon(points)).coord_tuples) == vertices
+        if backend == 'numpy':
+            assert list(oconvex_hull(hull2d.numpy.array(points)).coord_tuples) == vertices
+
+    assert len(oconvex_hull([])) == 0 and len(oconvex_hull('x')) == 0
+    assert list(oconvex_hull([(0, 0), (1, 1), (2, 2), (1, 1)]).coord_tuples) == [(0, 0), (2, 2)]
+
+
+def test_incremental_hull_matches_oconvex_hull(backend):
+    rng = random.Random(51)
+    for _ in range(60):
+        points = random_points(rng, 40)
+        hull = OConvexHull2D(points[:3])
+        for i in range(3, len(points)):
+            before = hull.get_points()
+            changed = hull.add_point(*points[i])
+            expected = list(oconvex_hull(points[:i + 1]).coord_tuples)
+
+            assert hull.get_points() == expected
+            assert changed == (before != expected)
+            assert list(hull.polygon.coord_tuples) == expected and len(hull) == hull.num_of_points == len(expected)
+
+        extra = random_points(rng, 10) + [(-1.0, 5.0)]
+        hull.add_points(extra[:-1] + [OPoint2D(-1, 5)])
+        assert hull.get_points() == list(oconvex_hull(points + extra).coord_tuples)
+
+
+def test_contains_matches_the_hull_sides():
+    rng = random.Random(52)
+    for _ in range(60):
+        points = random_points(rng, 15)
+        hull = OConvexHull2D(points)
+        vertices = hull.get_points()
+        if len(vertices) < 3:
+            continue
+        for query in random_points(rng, 50) + vertices + points:
+            inside = all(orientation(vertices[i - 1], vertices[i], query) >= 0 for i in range(len(vertices)))
+            assert hull.contains(query) == inside
+
+    hull = OConvexHull2D()
+    assert hull.contains((0, 0)) is False and hull.contains('x') is None and hull.get_points() == []
+    hull.add_point(1, 2)
+    assert hull.contains((1, 2)) and not hull.contains((1, 3)) and len(hull) == 1
+    hull.clear()
+    assert len(hull) == 0
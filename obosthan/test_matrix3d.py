@@ -0,0 +1,173 @@
+import random
+from math import isclose, cos, sin, radians
+from obosthan import OPoint3D, OQuaternion, OMatrix3D, OMatrix4D
+
+
+def values_close(values, expected, tolerance=1e-9):
+    values = list(values)
+    expected = list(expected)
+    return len(values) == len(expected) and all(isclose(a, b, abs_tol=tolerance) for a, b in zip(values, expected))
+
+
+def multiply(a, b, size):
+    return [sum(a[(row * size) + k] * b[(k * size) + column] for k in range(size)) for row in range(size) for column in range(size)]
+
+
+def axis_rotations(angle_x, angle_y, angle_z):
+    # rotation about the X axis, then the Y axis and then the Z axis as a product of the three axis matrices
+    cx, sx = cos(radians(angle_x)), sin(radians(angle_x))
+    cy, sy = cos(radians(angle_y)), sin(radians(angle_y))
+    cz, sz = cos(radians(angle_z)), sin(radians(angle_z))
+    rotation_x = (1, 0, 0, 0, cx, -sx, 0, sx, cx)
+    rotation_y = (cy, 0, sy, 0, 1, 0, -sy, 0, cy)
+    rotation_z = (cz, -sz, 0, sz, cz, 0, 0, 0, 1)
+    return multiply(rotation_z, multiply(rotation_y, rotation_x, 3), 3)
+
+
+def random_angles(rng):
+    return (rng.uniform(-180, 180), rng.uniform(-180, 180), rng.uniform(-180, 180))
+
+
+def test_euler_rotations_agree():
+    rng = random.Random(80)
+    for _ in range(100):
+        angles = random_angles(rng)
+        expected = axis_rotations(*angles)
+
+        quaternion = OQuaternion()
+        quaternion.define_euler(*angles)
+        matrix = OMatrix3D()
+        matrix.rotate(*angles)
+        matrix4 = OMatrix4D()
+        matrix4.rotate(*angles)
+
+        assert values_close(quaternion.matrix, expected)
+        assert values_close(matrix.matrix, expected)
+        assert values_close(matrix4.matrix, list(expected[0:3]) + [0] + list(expected[3:6]) + [0] + list(expected[6:9]) + [0, 0, 0, 0, 1])
+        assert isclose(quaternion.length, 1)
+
+
+def test_quaternion_operations():
+    quaternion = OQuaternion()
+    quaternion.define_axis_angle((0, 0, 2), 90)
+    assert values_close(quaternion.apply((1, 0, 0)), (0, 1, 0))
+    assert values_close(quaternion * OPoint3D(0, 1, 5), (-1, 0, 5))
+
+    rng = random.Random(81)
+    for _ in range(100):
+        first = OQuaternion()
+        first.define_euler(*random_angles(rng))
+        second = OQuaternion()
+        second.define_axis_angle((rng.uniform(-1, 1), rng.uniform(-1, 1), rng.uniform(-1, 1)), rng.uniform(-180, 180))
+        point = (rng.uniform(-5, 5), rng.uniform(-5, 5), rng.uniform(-5, 5))
+
+        # the product rotates by the right quaternion first
+        assert values_close((second * first).apply(point), second.apply(first.apply(point)))
+        assert values_close((first * first.inverse), (1, 0, 0, 0))
+        assert values_close(first.conjugate, first.inverse)
+
+        # a matrix gives back the quaternion or its negation, which is the same rotation
+        recovered = OQuaternion()
+        recovered.define_matrix(first.matrix)
+        assert values_close(recovered, first) or values_close(recovered, -first)
+
+    # half turns take the branches of define_matrix where the trace is not positive
+    for axis in ((1, 0, 0), (0, 1, 0), (0, 0, 1), (1, 1, 0)):
+        half_turn = OQuaternion()
+        half_turn.define_axis_angle(axis, 180)
+        recovered = OQuaternion()
+        recovered.define_matrix(half_turn.matrix)
+        assert values_close(recovered.matrix, half_turn.matrix)
+
+    scaled = OQuaternion(2, 0, 0, 0) * 1.5
+    assert values_close(scaled, (3, 0, 0, 0)) and OQuaternion(0, 0, 0, 0).inverse is None
+    scaled.normalise()
+    assert scaled.is_identity()
+
+
+def test_slerp():
+    start = OQuaternion()
+    end = OQuaternion()
+    end.define_axis_angle((0, 0, 1), 120)
+    middle = OQuaternion()
+    middle.define_axis_angle((0, 0, 1), 30)
+
+    assert values_close(start.slerp(end, 0), start)
+    assert values_close(start.slerp(end, 1), end)
+    assert values_close(start.slerp(end, 0.25), middle)
+    # the negated end point is the same rotation and slerp takes the shorter arc to it
+    assert values_close(start.slerp(-end, 0.25).matrix, middle.matrix)
+
+    close = OQuaternion()
+    close.define_axis_angle((0, 0, 1), 1)
+    assert values_close(start.slerp(close, 0.5).matrix, OQuaternion(cos(radians(0.25)), 0, 0, sin(radians(0.25))).matrix, 1e-7)
+    assert start.slerp((1, 0, 0, 0), 0.5) is None
+
+
+def test_matrix3d():
+    matrix = OMatrix3D((2, 0, 1, 1, 3, 0, 0, 1, 4))
+    inverse = matrix.inverse
+
+    assert isclose(matrix.determinant, 25)
+    assert values_close((matrix * inverse).matrix, (1, 0, 0, 0, 1, 0, 0, 0, 1))
+    assert matrix.inverse is not inverse and matrix.inverse.matrix == inverse.matrix
+    # the returned inverse is a new object, changing it leaves the cached inverse alone
+    inverse.scale(3, 3, 3)
+    inverse.define_matrix((1, 2, 3, 4, 5, 6, 7, 8, 10))
+    assert values_close((matrix * matrix.inverse).matrix, (1, 0, 0, 0, 1, 0, 0, 0, 1))
+    inverse = matrix.inverse
+    assert matrix.transpose.matrix == (2, 1, 0, 0, 3, 1, 1, 0, 4)
+    assert OMatrix3D((1, 2, 3, 2, 4, 6, 0, 0, 1)).inverse is None
+
+    # transformations compose after the current one
+    matrix.scale(1, 2, 1)
+    assert values_close(matrix.apply((1, 1, 1)), (3, 8, 5))
+    assert matrix.inverse is not inverse
+    other = OMatrix3D()
+    other.shear(1, 0, 0, 0, 0, 0)
+    assert values_close((other * matrix).apply((1, 1, 1)), other.apply(matrix.apply((1, 1, 1))))
+
+    rotation = OMatrix3D()
+    rotation.rotate_axis((1, 1, 1), 120)
+    assert values_close(rotation * (1, 0, 0), (0, 1, 0))
+    assert values_close(rotation.quaternion.matrix, rotation.matrix)
+    assert values_close(rotation.inverse.matrix, rotation.transpose.matrix)
+
+    rotation.reset()
+    assert rotation.is_identity()
+    rotation.define_matrix('x')
+    assert rotation.is_identity()
+
+
+def test_matrix4d():
+    matrix = OMatrix4D()
+    matrix.translate(1, 2, 3)
+    matrix.rotate_point(0, 0, 90, (1, 0, 0))
+    matrix.scale(2, 2, 2)
+
+    # (0, 0, 0) -> (1, 2, 3) -> rotated about (1, 0, 0) to (-1, 0, 3) -> (-2, 0, 6)
+    assert values_close(matrix.apply((0, 0, 0)), (-2, 0, 6))
+    assert matrix.is_affine() and not matrix.is_identity()
+    assert values_close((matrix * matrix.inverse).matrix, OMatrix4D().matrix)
+    assert values_close(matrix.inverse.apply(matrix.apply((4, -1, 2))), (4, -1, 2))
+    inverse = matrix.inverse
+    inverse.translate(5, 5, 5)
+    inverse.reset()
+    assert matrix.inverse is not inverse and values_close((matrix * matrix.inverse).matrix, OMatrix4D().matrix)
+    assert isclose(matrix.determinant, 8)
+
+    # a perspective projection divides by w
+    projection = OMatrix4D((1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0))
+    assert not projection.is_affine()
+    assert values_close(projection.apply((2, 4, 2)), (1, 2, 1))
+
+    rotation = OMatrix3D()
+    rotation.rotate(10, 20, 30)
+    quaternion = rotation.quaternion
+    expected = list(rotation.matrix[0:3]) + [0] + list(rotation.matrix[3:6]) + [0] + list(rotation.matrix[6:9]) + [0, 0, 0, 0, 1]
+    assert values_close(OMatrix4D(rotation).matrix, expected)
+    assert values_close(OMatrix4D(quaternion).matrix, expected)
+    assert values_close(OMatrix4D(list(rotation.matrix)).matrix, expected)
+    assert OMatrix4D((1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12)).matrix[12:16] == (0, 0, 0, 1)
+    assert values_close(OMatrix4D(expected).transpose.transpose, expected)
+    assert OMatrix4D((1, 2, 3)).is_identity()
@@ -0,0 +1,41 @@
+import random
+from math import hypot, isclose
+from obosthan import OPoint2D, OPoint3D, OLine2D, ocircle2, oline_circle
+
+
+def test_distance_and_squared_distance():
+    point = OPoint2D(1, 2)
+
+    # distance_to of the 2D points has always given the squared distance, unlike OPoint3D
+    assert point.distance_to(OPoint2D(4, 6)) == 25 == point.distance_sq_to((4, 6))
+    assert point.distance_to([1, 2]) == 0
+    assert point.distance_to('x') is None and point.distance_sq_to('x') is None
+    assert OPoint3D(1, 2, 3).distance_to(OPoint3D(3, 5, 9)) == 7 and OPoint3D(1, 2, 3).distance_sq_to((3, 5, 9)) == 49
+
+
+def test_within_radius_matches_distance_to():
+    rng = random.Random(30)
+    for _ in range(500):
+        point = OPoint2D(rng.uniform(-5, 5), rng.uniform(-5, 5))
+        other = (rng.uniform(-5, 5), rng.uniform(-5, 5))
+        line = OLine2D(rng.uniform(-5, 5), rng.uniform(-5, 5), rng.uniform(-5, 5), rng.uniform(-5, 5))
+        radius = rng.uniform(0, 6)
+
+        assert isclose(point.distance_to(list(other)), hypot(other[0] - point[0], other[1] - point[1])**2)
+        assert point.within_radius(other, radius) == (point.distance_to(list(other)) <= radius * radius)
+        assert line.within_radius(other, radius) == (line.distance_sq_to(other) <= radius * radius)
+
+    # a touching point is within the radius
+    assert OPoint2D(0, 0).within_radius((3, 4), 5) and not OPoint2D(0, 0).within_radius((3, 4), 4.999)
+    assert OLine2D(0, 0, 4, 0).distance_sq_to((6, 3)) == 13 and OLine2D(0, 0, 4, 0).distance_sq_to((2, 3)) == 9
+
+
+def test_circle_routines_use_the_sum_of_radii_and_the_nearest_point():
+    assert ocircle2((0, 0), 2, (5, 0), 3) and not ocircle2((0, 0), 2, (5.01, 0), 3)
+    assert ocircle2((0, 0), 1, (0.5, 0), 0.1)
+
+    # the nearest point of the line is its end, not the foot of the perpendicular on the infinite line
+    assert oline_circle((0, 0, 4, 0), (6, 0), 1) is None
+    assert isclose(oline_circle((0, 0, 4, 0), (5, 0), 2), 1)
+    assert isclose(oline_circle((0, 0, 4, 0), (2, 1), 3), 2)
+    assert oline_circle((0, 0, 4, 0), (2, 3), 3) is None
@@ -0,0 +1,83 @@
+import random
+from math import isclose, atan, degrees
+from obosthan import OPoint3D, OVector3D
+
+
+def plane_angle(a, b):
+    # angle of (a, b) between 0 and 360 degrees by the quadrant rules of the 2D objects, the axes included
+    if a == 0:
+        return 0.0 if b == 0 else (90.0 if b > 0 else 270.0)
+    elif a < 0:
+        return 180 + degrees(atan(b / a))
+    elif b < 0:
+        return 360 + degrees(atan(b / a))
+    return degrees(atan(b / a))
+
+
+def angles_close(angles, coord):
+    x, y, z = coord
+    return all(isclose(a, b, abs_tol=1e-9) for a, b in zip(angles, (plane_angle(x, y), plane_angle(y, z), plane_angle(x, z))))
+
+
+def sample_coords():
+    values = [0.0, -0.0, 1, -1, 2.5, -3.25]
+    rng = random.Random(25)
+    return [(x, y, z) for x in values for y in values for z in values] + [tuple(rng.uniform(-9, 9) for _ in range(3)) for _ in range(300)]
+
+
+def test_point_properties():
+    for coord in sample_coords():
+        point = OPoint3D(*coord)
+        assert isclose(point.distance, sum(c * c for c in coord)**0.5)
+        assert angles_close(point.heading, coord)
+        assert all(0 <= angle < 360 for angle in point.heading)
+
+
+def test_point_properties_follow_changes():
+    point = OPoint3D(1, 0, 0)
+    assert point.distance == 1 and angles_close(point.heading, (1, 0, 0))
+
+    point[1] = 1.0
+    assert isclose(point.heading[0], 45) and isclose(point.distance, 2**0.5)
+    point[2] = -1
+    assert angles_close(point.heading, (1, 1, -1)) and isclose(point.distance, 3**0.5)
+    point[0] = [0, -2, 0]
+    assert point.heading == [270.0, 180.0, 0.0] and point.distance == 2
+
+    copy = point.copy()
+    point[0] = 5
+    assert copy.distance == 2 and isclose(point.distance, 29**0.5)
+    assert isclose((point + 1).distance, (36 + 1 + 1)**0.5) and isclose((point / 2).distance, 29**0.5 / 2)
+
+
+def test_vector_properties():
+    for coord in sample_coords():
+        vector = OVector3D(*coord)
+        length = sum(c * c for c in coord)**2
+        assert isclose(vector.length, length)
+        assert vector.unit == ([0, 0] if length == 0 else [c / length for c in coord])
+        assert angles_close(vector.angle, coord)
+
+
+def test_vector_properties_follow_changes():
+    vector = OVector3D(1, 0, 0)
+    assert vector.angle == [0.0, 0.0, 0.0] and vector.length == 1
+
+    vector.define_line(0, 0, 0, 0, 1, 1)
+    assert vector[2] == 1 and isclose(vector.angle[1], 45) and vector.length == 4
+    vector.scale(2)
+    assert vector.length == 64 and vector.unit == [0, 2 / 64, 2 / 64]
+    vector.negate()
+    assert vector.unit[1] < 0 and angles_close(vector.angle, (0, -2, -2))
+    vector[0] = 3
+    assert angles_close(vector.angle, (3, -2, -2)) and vector.length == 17**2
+    vector[0] = [0, 0, -0.0]
+    assert vector.unit == [0, 0] and vector.angle == [0.0, 0.0, 0.0]
+    vector.define_polar(2, 90, 0)
+    assert isclose(vector[0], 2) and isclose(vector.length, 16) and angles_close(vector.angle, list(vector))
+
+    copy = vector.copy()
+    vector.scale(0.5)
+    assert isclose(copy.length, 16) and isclose(vector.length, 1)
+    assert isclose((-vector).angle[0], 180) and isclose((vector * 3).length, 81)
+    assert isclose(vector.angle_to(OVector3D(0, 1, 0)), 90)
@@ -0,0 +1,87 @@
+from math import isclose
+from obosthan import OPoint2D, OPointArray2D
+
+
+def as_pairs(points):
+    return [(float(x), float(y)) for x, y in zip(points.x, points.y)]
+
+
+def pairs_close(pairs, expected):
+    return len(pairs) == len(expected) and all(isclose(a[0], b[0], abs_tol=1e-9) and isclose(a[1], b[1], abs_tol=1e-9) for a, b in zip(pairs, expected))
+
+
+def test_points_match_opoint2d(backend):
+    coords = [(1, 0), (0, 2), (-3, -4), (2.5, -1.5), (0, 0)]
+    points = OPointArray2D(coords + [OPoint2D(7, 1)])
+    single = [OPoint2D(x, y) for x, y in coords + [(7, 1)]]
+
+    assert len(points) == points.num_of_points == 6
+    assert all(isclose(a, b.distance) for a, b in zip(points.distance, single))
+    assert all(isclose(a, b.heading, abs_tol=1e-9) for a, b in zip(points.heading, single))
+    assert all(isclose(a, b.distance_to(OPoint2D(1, 1))) for a, b in zip(points.distance_to((1, 1)), single))
+    assert points.get_range() == [[-3.0, 7.0], [-4.0, 2.0]]
+    assert OPointArray2D().get_range() is None and OPointArray2D().get_centroid() is None
+
+
+def test_transformations(backend):
+    points = OPointArray2D([(1, 0), (0, 2), (-3, -4)])
+
+    points.rotate_point(90, (1, 1))
+    assert pairs_close(as_pairs(points), [(2, 1), (0, 0), (6, -3)])
+    points.translate(1, 2)
+    points.scale(2, 3)
+    assert pairs_close(as_pairs(points), [(6, 9), (2, 6), (14, -3)])
+    points.rotate(180)
+    assert pairs_close(as_pairs(points), [(-6, -9), (-2, -6), (-14, 3)])
+    points.transform((0, 1, 1, 0))
+    assert pairs_close(as_pairs(points), [(-9, -6), (-6, -2), (3, -14)])
+
+
+def test_operators(backend):
+    points = OPointArray2D([(1, 2), (3, 4)])
+    other = OPointArray2D([(2, 2), (4, 8)])
+
+    assert as_pairs(points + 1) == [(2, 3), (4, 5)]
+    assert as_pairs(points - (1, 2)) == [(0, 0), (2, 2)]
+    assert as_pairs(points * other) == [(2, 4), (12, 32)]
+    assert as_pairs(points / other) == [(0.5, 1), (0.75, 0.5)]
+    assert as_pairs(-points) == [(-1, -2), (-3, -4)]
+    assert (points + 'x') is points
+
+
+def test_division_by_zero_is_the_same_on_both_backends(backend):
+    points = OPointArray2D([(1, 2), (3, 4)])
+
+    assert (points / 0) is points
+    assert (points / (2, 0)) is points
+    assert (points / OPointArray2D([(1, 1), (0, 1)])) is points
+    assert as_pairs(points) == [(1, 2), (3, 4)]
+
+
+def test_growing_one_point_at_a_time(backend):
+    points = OPointArray2D()
+    for i in range(100):
+        points.add_point(i, -i)
+    points.add_points([(100, -100), OPoint2D(101, -101)])
+    points.add_points(OPointArray2D([(102, -102)]))
+
+    assert as_pairs(points) == [(i, -i) for i in range(103)]
+
+    points.remove_point(0)
+    points[0] = (9, 9)
+    points.add_point(200, 200)
+    assert len(points) == 103
+    assert points.get_point(0) == (9.0, 9.0) and points.get_point(-1) == (200.0, 200.0)
+    assert isclose(points.get_centroid()[0], (9 + sum(range(2, 103)) + 200) / 103)
+
+
+def test_define_xy_and_copy(backend):
+    points = OPointArray2D()
+    points.define_xy([1, 2], [3, 4])
+    duplicate = points.copy()
+    duplicate.add_point(5, 6)
+    duplicate[0] = (0, 0)
+
+    assert as_pairs(points) == [(1, 3), (2, 4)]
+    assert as_pairs(duplicate) == [(0, 0), (2, 4), (5, 6)]
+    assert [tuple(point) for point in points] == [(1, 3), (2, 4)]
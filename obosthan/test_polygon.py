@@ -0,0 +1,198 @@
+import random
+from math import isclose, cos, sin, pi
+import pytest
+from obosthan import OPoint2D, OPolygon
+
+
+def coords_close(coords, expected):
+    return len(coords) == len(expected) and all(isclose(a[0], b[0], abs_tol=1e-9) and isclose(a[1], b[1], abs_tol=1e-9) for a, b in zip(coords, expected))
+
+
+def test_coords_are_points_and_tuples(backend):
+    polygon = OPolygon([(0, 0), (4, 0), OPoint2D(4, 2), (0, 3)])
+
+    assert polygon.coord_tuples == ((0, 0), (4, 0), (4, 2), (0, 3))
+    assert all(type(point) is OPoint2D for point in polygon.coords) and all(type(point) is OPoint2D for point in polygon)
+    assert [tuple(point) for point in polygon] == [tuple(point) for point in polygon.coords] == list(polygon.coord_tuples)
+    assert isclose(polygon.coords[2].distance, 20**0.5) and polygon.coords[1].distance_sq_to((4, 3)) == 9
+    with pytest.raises(TypeError):
+        polygon.coord_tuples[1][0] = 9
+
+    # the points are built from the vertices on every call, changing one leaves the polygon as it was
+    polygon.coords[1][0] = 9
+    next(iter(polygon))[1] = 9
+    assert polygon.coord_tuples == ((0, 0), (4, 0), (4, 2), (0, 3))
+
+    polygon[1] = [5, 1]
+    polygon.add_point(-1, 1)
+    assert polygon.coord_tuples == ((0, 0), (5, 1), (4, 2), (0, 3), (-1, 1))
+    assert polygon.get_point(1) == (5, 1) and tuple(polygon.coords[1]) == (5, 1)
+
+    polygon.remove_point((0, 0))
+    assert polygon.coord_tuples == ((5, 1), (4, 2), (0, 3), (-1, 1))
+    assert len(polygon) == polygon.num_of_points == 4
+
+
+def test_point_array_is_a_copy(backend):
+    polygon = OPolygon([(0, 0), (4, 0), (4, 2), (0, 3)])
+    polygon.translate(1, 1)
+    points = polygon.point_array
+    assert [tuple(point) for point in points] == [(1, 1), (5, 1), (5, 3), (1, 4)]
+
+    points[0] = (-9, -9)
+    points.translate(10, 0)
+    assert polygon.coord_tuples == ((1, 1), (5, 1), (5, 3), (1, 4))
+    assert polygon.aabb == (1, 1, 5, 4) and coords_close([polygon.centroid], [(3, 2.25)])
+
+
+def test_measurements(backend):
+    polygon = OPolygon([(0, 0), (4, 0), (4, 2), (0, 3)])
+
+    assert isclose(polygon.get_area(), 10)
+    assert isclose(polygon.get_perimeter(), 4 + 2 + 17**0.5 + 3)
+    assert isclose(polygon.get_perimeter(False), 4 + 2 + 17**0.5)
+    assert coords_close([polygon.centroid], [(2, 1.25)])
+
+
+def apply_about(points, a, b, d, e, origin):
+    return [((a * (x - origin[0])) + (b * (y - origin[1])) + origin[0], (d * (x - origin[0])) + (e * (y - origin[1])) + origin[1]) for x, y in points]
+
+
+def mean(points):
+    return (sum(x for x, y in points) / len(points), sum(y for x, y in points) / len(points))
+
+
+def test_transformations_move_every_vertex_and_the_centroid(backend):
+    points = [(0, 0), (4, 0), (4, 2), (0, 3)]
+    polygon = OPolygon(points)
+
+    polygon.translate(1, 2)
+    polygon.scale(2, 1)
+    polygon.rotate_point(90, (2, 2))
+    polygon.rotate_centroid(180)
+    polygon.shear(0.5, 0)
+    polygon.shear_point(1, 0, (0, 2))
+    polygon.scale_point(1, 3, (1, 1))
+    polygon.transform((0, 1, -1, 0))
+    polygon.transform_point((2, 0, 0, 2), (0, 0))
+
+    points = [(x + 1, y + 2) for x, y in points]
+    points = apply_about(points, 2, 0, 0, 1, mean(points))
+    points = apply_about(points, 0, -1, 1, 0, (2, 2))
+    points = apply_about(points, -1, 0, 0, -1, mean(points))
+    points = apply_about(points, 1, 0.5, 0, 1, mean(points))
+    points = apply_about(points, 1, 1, 0, 1, (0, 2))
+    points = apply_about(points, 1, 0, 0, 3, (1, 1))
+    points = apply_about(points, 0, 1, -1, 0, mean(points))
+    points = apply_about(points, 2, 0, 0, 2, (0, 0))
+
+    assert coords_close(polygon.coords, points)
+    assert coords_close([polygon.centroid], [mean(points)])
+
+
+def test_growing_one_point_at_a_time(backend):
+    polygon = OPolygon([])
+    for i in range(50):
+        polygon.add_point(i, i % 7)
+
+    assert polygon.num_of_points == 50
+    assert coords_close([polygon.centroid], [(24.5, sum(i % 7 for i in range(50)) / 50)])
+    assert polygon.coord_tuples[-1] == (49, 0)
+
+
+def random_points(rng, count):
+    return [(rng.uniform(-5, 5), rng.uniform(-5, 5)) for _ in range(count)]
+
+
+def test_aabb_follows_every_change(backend):
+    rng = random.Random(6)
+    polygon = OPolygon(random_points(rng, 8))
+    changes = [lambda: polygon.add_point(rng.uniform(-9, 9), rng.uniform(-9, 9)),
+               lambda: polygon.add_points([(rng.uniform(-9, 9), rng.uniform(-9, 9)), (1, 2)]),
+               lambda: polygon.add_side((rng.uniform(-9, 9), 0, 0, rng.uniform(-9, 9))),
+               lambda: polygon.remove_point(polygon.coords[rng.randrange(len(polygon))]),
+               lambda: polygon.__setitem__(rng.randrange(len(polygon)), [rng.uniform(-9, 9), rng.uniform(-9, 9)]),
+               lambda: polygon.translate(rng.uniform(-3, 3), rng.uniform(-3, 3)),
+               lambda: polygon.scale(rng.choice([-2, 0.5, 3]), rng.choice([-1, 0.25, 2])),
+               lambda: polygon.scale_point(-1, 2, (rng.uniform(-3, 3), 1)),
+               lambda: polygon.rotate_centroid(rng.uniform(0, 360)),
+               lambda: polygon.shear(0.5, 0),
+               lambda: polygon.transform((0, 1, -1, 0))]
+
+    for _ in range(300):
+        rng.choice(changes)()
+        if len(polygon) < 3:
+            polygon.add_points(random_points(rng, 5))
+        xs = [x for x, y in polygon.coords]
+        ys = [y for x, y in polygon.coords]
+        assert all(isclose(a, b, abs_tol=1e-9) for a, b in zip(polygon.aabb, (min(xs), min(ys), max(xs), max(ys))))
+        assert coords_close(polygon.get_AABB().coords, [(min(xs), min(ys)), (max(xs), min(ys)), (max(xs), max(ys)), (min(xs), max(ys))])
+
+    assert OPolygon([]).aabb is None and OPolygon([]).get_AABB() is None
+
+
+
+def random_star(rng, count):
+    # simple polygon around origin, consecutive vertices less than half a turn apart, usually concave
+    while True:
+        angles = sorted(rng.uniform(0, 2 * pi) for _ in range(count))
+        if all((angles[(i + 1) % count] - angles[i]) % (2 * pi) < 3 for i in range(count)):
+            break
+    radii = [rng.uniform(1, 5) for _ in angles]
+    points = [(radius * cos(angle), radius * sin(angle)) for radius, angle in zip(radii, angles)]
+    return points[::-1] if rng.random() < 0.5 else points
+
+
+def signed_area(points):
+    return sum((points[i - 1][0] * points[i][1]) - (points[i][0] * points[i - 1][1]) for i in range(len(points))) / 2
+
+
+def turns(points):
+    return [((points[i - 1][0] - points[i - 2][0]) * (points[i][1] - points[i - 2][1])) - ((points[i - 1][1] - points[i - 2][1]) * (points[i][0] - points[i - 2][0])) for i in range(len(points))]
+
+
+def in_part(point, part):
+    return all(((part[i][0] - part[i - 1][0]) * (point[1] - part[i - 1][1])) - ((part[i][1] - part[i - 1][1]) * (point[0] - part[i - 1][0])) >= 0 for i in range(len(part)))
+
+
+def test_is_convex():
+    assert OPolygon([(0, 0), (2, 0), (2, 1), (2, 2), (0, 2)]).is_convex()
+    assert OPolygon([(0, 2), (2, 2), (2, 0), (0, 0)]).is_convex()
+    assert not OPolygon([(0, 0), (4, 0), (4, 1), (1, 1), (1, 4), (0, 4)]).is_convex()
+    # a pentagram turns the same way at every vertex but winds twice
+    assert not OPolygon([(cos(pi / 2 + (i * 4 * pi / 5)), sin(pi / 2 + (i * 4 * pi / 5))) for i in range(5)]).is_convex()
+
+
+def check_parts(polygon):
+    coords = polygon.coord_tuples
+    parts = [[coords[i] for i in part] for part in polygon.convex_parts]
+    assert set(i for part in polygon.convex_parts for i in part) == set(range(len(coords)))
+    assert all(min(turns(part)) >= -1e-9 and signed_area(part) > 0 for part in parts)
+    assert isclose(sum(signed_area(part) for part in parts), polygon.get_area())
+    assert [list(part.coord_tuples) for part in polygon.get_convex_parts()] == parts
+    return parts
+
+
+def test_convex_parts_cover_the_polygon(backend):
+    rng = random.Random(60)
+    for _ in range(150):
+        polygon = OPolygon(random_star(rng, rng.randint(3, 30)))
+        parts = check_parts(polygon)
+        assert len(parts) == 1 or not polygon.is_convex()
+
+        for _ in range(50):
+            point = (rng.uniform(-5, 5), rng.uniform(-5, 5))
+            assert polygon.contains(point) == any(in_part(point, part) for part in parts)
+
+        # parts are kept through transformations, a reflection keeps them anticlockwise
+        indices = set(map(frozenset, polygon.convex_parts))
+        polygon.rotate_centroid(rng.uniform(0, 360))
+        polygon.scale(-1, 2)
+        polygon.translate(3, -1)
+        assert set(map(frozenset, polygon.convex_parts)) == indices
+        check_parts(polygon)
+
+    polygon = OPolygon([(0, 0), (4, 0), (4, 1), (1, 1), (1, 4), (0, 4)])
+    assert len(polygon.convex_parts) == 2
+    polygon.add_point(-1, 2)
+    assert len(check_parts(polygon)) >= 2
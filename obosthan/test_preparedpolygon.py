@@ -0,0 +1,71 @@
+import random
+from math import cos, sin, pi, nextafter
+from obosthan import OPolygon, OPreparedPolygon, OPointArray2D
+
+
+def random_simple(rng, count, x, y, width, height):
+    # star shaped polygon around (x, y), consecutive vertices less than half a turn apart keep it simple
+    while True:
+        angles = sorted(rng.uniform(0, 2 * pi) for _ in range(count))
+        if all((angles[(i + 1) % count] - angles[i]) % (2 * pi) < 3 for i in range(count)):
+            break
+    radii = [rng.uniform(0.2, 1) for _ in angles]
+    return [(x + (radius * width * cos(angle)), y + (radius * height * sin(angle))) for radius, angle in zip(radii, angles)]
+
+
+def query_points(rng, vertices):
+    # vertices, points on the sides and points at vertex heights on and next to the side crossings
+    points = []
+    for i in range(len(vertices)):
+        x1, y1 = vertices[i - 1]
+        x2, y2 = vertices[i]
+        points.append((x2, y2))
+        for _ in range(3):
+            t = rng.random()
+            points.append((x1 + (t * (x2 - x1)), y1 + (t * (y2 - y1))))
+        for j in range(len(vertices)):
+            x3, y3 = vertices[j - 1]
+            x4, y4 = vertices[j]
+            if (y3 > y2) != (y4 > y2):
+                crossing = x3 + ((y2 - y3) * ((x4 - x3) / (y4 - y3)))
+                points.extend([(crossing, y2), (nextafter(crossing, -1e300), y2), (nextafter(crossing, 1e300), y2)])
+    return points
+
+
+def test_contains_matches_polygon_for_float_vertices(backend):
+    rng = random.Random(40)
+    for case in range(150):
+        x = 0.3 if case % 2 else -3e5
+        vertices = random_simple(rng, rng.randint(3, 40), x, 0.1, 7.3, 3.1)
+        polygon = OPolygon(vertices)
+        prepared = OPreparedPolygon(polygon)
+        points = query_points(rng, vertices) + [(x + rng.uniform(-8, 8), rng.uniform(-4, 4)) for _ in range(100)]
+
+        expected = [polygon.contains(point) for point in points]
+        assert [prepared.contains(point) for point in points] == expected
+        assert [bool(inside) for inside in prepared.contains_many(OPointArray2D(points))] == expected
+
+
+def test_contains_on_integer_grid(backend):
+    rng = random.Random(41)
+    for _ in range(50):
+        vertices = [(round(x), round(y)) for x, y in random_simple(rng, rng.randint(3, 30), 50, 50, 45, 45)]
+        vertices = [vertex for i, vertex in enumerate(vertices) if vertex != vertices[i - 1]]
+        polygon = OPolygon(vertices)
+        prepared = OPreparedPolygon(polygon)
+        points = [(rng.randint(0, 100), rng.randint(0, 100)) for _ in range(500)] + vertices
+
+        expected = [polygon.contains(point) for point in points]
+        assert [prepared.contains(point) for point in points] == expected
+        assert [bool(inside) for inside in prepared.contains_many(points)] == expected
+
+
+def test_sides_shared_by_a_tiling_belong_to_one_polygon(backend):
+    squares = [OPreparedPolygon(OPolygon([(i, j), (i + 1, j), (i + 1, j + 1), (i, j + 1)])) for i in range(3) for j in range(3)]
+    points = [(x / 2, y / 2) for x in range(6) for y in range(6)]
+
+    assert all(sum(square.contains(point) for square in squares) == 1 for point in points)
+    assert OPreparedPolygon(OPolygon([(0, 0), (1, 1)])).contains((0, 0)) is False
+    assert list(OPreparedPolygon(OPolygon([(0, 0), (1, 0), (2, 0)])).contains_many([(1, 0)])) == [False]
+    assert list(OPreparedPolygon(OPolygon([])).contains_many([(0, 0)])) == [False]
+    assert OPreparedPolygon(OPolygon([(0, 0), (1, 0), (0, 1)])).contains('x') is None
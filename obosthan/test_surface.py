@@ -0,0 +1,162 @@
+import random
+from math import isclose, cos, sin, radians
+from obosthan import OPoint3D, OSurface, OMatrix3D, OMatrix4D, OQuaternion
+
+
+def points_close(points, expected):
+    points = list(points)
+    expected = list(expected)
+    return len(points) == len(expected) and all(isclose(a, b, abs_tol=1e-9) for point1, point2 in zip(points, expected) for a, b in zip(point1, point2))
+
+
+def cube():
+    # unit cube with anticlockwise quads seen from outside
+    vertices = [(x, y, z) for x in (0, 1) for y in (0, 1) for z in (0, 1)]
+    quads = [(0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1), (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3)]
+    return OSurface(vertices, quads)
+
+
+def test_indexed_mesh(backend):
+    surface = cube()
+
+    assert surface.num_of_points == len(surface) == 8 and surface.num_of_faces == 12
+    assert surface.get_face(0) == (0, 1, 3) and surface.get_face(1) == (0, 3, 2)
+    assert isclose(surface.area, 6)
+    assert list(surface.get_face_areas()) == [0.5] * 12
+    assert points_close(surface.coords, [OPoint3D(x, y, z) for x, y, z in surface.get_points()])
+
+    # every normal points away from the centre of the cube
+    normals = list(surface.get_face_normals())
+    normals = [normals[i:i + 3] for i in range(0, 36, 3)] if len(normals) == 36 else [list(normal) for normal in normals]
+    for f, normal in enumerate(normals):
+        face_centre = [sum(surface.get_point(i)[axis] for i in surface.get_face(f)) / 3 for axis in range(3)]
+        assert isclose(sum(n * n for n in normal), 1)
+        assert sum(n * (c - 0.5) for n, c in zip(normal, face_centre)) > 0
+
+    surface.add_faces([(0, 1, 8)])
+    surface.add_face(-1, 0, 1)
+    assert surface.num_of_faces == 12
+    surface.add_point(0.5, 0.5, 2)
+    surface.add_face(1, 5, 8)
+    assert surface.num_of_faces == 13 and surface.get_face(-1) == (1, 5, 8)
+    assert isclose(surface.area, 6 + (0.5 * 1.25**0.5))
+
+
+def test_remove_point_drops_and_renumbers_faces(backend):
+    surface = cube()
+    surface.remove_point((0, 0, 0))
+
+    assert surface.num_of_points == 7
+    faces = [surface.get_face(f) for f in range(surface.num_of_faces)]
+    assert len(faces) == 12 - 6
+    assert all(0 <= i < 7 for face in faces for i in face)
+    # vertex 7 (1, 1, 1) is now vertex 6 and still used by the three faces around it
+    assert surface.get_point(6) == (1, 1, 1) and sum(6 in face for face in faces) == 6
+    assert isclose(surface.area, 3)
+    surface.remove_point((5, 5, 5))
+    assert surface.num_of_points == 7
+
+
+def test_define_mesh_and_edits(backend):
+    surface = OSurface([])
+    surface.define_mesh([(0, 0, 0), (2, 0, 0), (0, 2, 0)], [(0, 1, 2)])
+    assert surface.num_of_faces == 1 and isclose(surface.area, 2)
+    assert points_close([surface.centroid], [(2 / 3, 2 / 3, 0)])
+
+    surface.define_mesh([(0, 0, 0)], [(0, 1, 2)])
+    assert surface.num_of_points == 3
+
+    surface[1] = (4, 0, 0)
+    assert isclose(surface.area, 4) and surface.get_point(1) == (4, 0, 0)
+    assert surface.get_range() == [[0, 4], [0, 2], [0, 0]]
+    assert OSurface([]).get_range() is None and OSurface([]).centroid is None
+
+
+def random_surface(rng):
+    points = [(rng.uniform(-5, 5), rng.uniform(-5, 5), rng.uniform(-5, 5)) for _ in range(20)]
+    return points, OSurface(points, [(i, i + 1, i + 2) for i in range(18)])
+
+
+def multiply(matrix, point, origin=(0, 0, 0)):
+    x, y, z = point[0] - origin[0], point[1] - origin[1], point[2] - origin[2]
+    return tuple((matrix[row * 3] * x) + (matrix[(row * 3) + 1] * y) + (matrix[(row * 3) + 2] * z) + origin[row] for row in range(3))
+
+
+def mean(points):
+    return tuple(sum(point[axis] for point in points) / len(points) for axis in range(3))
+
+
+def test_transformations_match_a_reference(backend):
+    rng = random.Random(70)
+    points, surface = random_surface(rng)
+    matrix = tuple(rng.uniform(-2, 2) for _ in range(9))
+
+    surface.translate(1, -2, 3)
+    points = [(x + 1, y - 2, z + 3) for x, y, z in points]
+    surface.scale(2, 3, 0.5)
+    points = [multiply((2, 0, 0, 0, 3, 0, 0, 0, 0.5), point, mean(points)) for point in points]
+    surface.scale_point(-1, 1, 2, (1, 1, 1))
+    points = [multiply((-1, 0, 0, 0, 1, 0, 0, 0, 2), point, (1, 1, 1)) for point in points]
+    surface.shear_point(0.5, 0.2, 0.1, 0.3, 0.4, 0.6, (0, 1, 0))
+    points = [multiply((1, 0.2, 0.3, 0.5, 1, 0.6, 0.1, 0.4, 1), point, (0, 1, 0)) for point in points]
+    surface.transform(OMatrix3D(matrix))
+    points = [multiply(matrix, point, mean(points)) for point in points]
+    surface.transform_point(list(matrix), OPoint3D(2, 0, -1))
+    points = [multiply(matrix, point, (2, 0, -1)) for point in points]
+
+    assert points_close(surface.get_points(), points)
+    assert points_close([surface.centroid], [mean(points)])
+
+    quaternion = OQuaternion()
+    quaternion.define_axis_angle((1, 2, 3), 40)
+    surface.transform_point(quaternion, (0, 0, 0))
+    points = [multiply(quaternion.matrix, point) for point in points]
+    assert points_close(surface.get_points(), points)
+
+
+def test_transform_homogeneous(backend):
+    rng = random.Random(71)
+    points, surface = random_surface(rng)
+
+    affine = (1, 0, 0, 4, 0, 2, 0, -1, 0, 0, 1, 0.5)
+    surface.transform_homogeneous(affine)
+    points = [(x + 4, (2 * y) - 1, z + 0.5) for x, y, z in points]
+    assert points_close(surface.get_points(), points)
+
+    # a perspective divide by z + 10
+    projection = OMatrix4D((1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 1, 10))
+    surface.transform_homogeneous(projection)
+    points = [(x / (z + 10), y / (z + 10), z / (z + 10)) for x, y, z in points]
+    assert points_close(surface.get_points(), points)
+
+
+def rotate_per_axis(points, angle_x, angle_y, angle_z, origin):
+    # rotates about the X axis, then the Y axis and then the Z axis in separate passes
+    for axis, angle in ((0, angle_x), (1, angle_y), (2, angle_z)):
+        c = cos(radians(angle))
+        s = sin(radians(angle))
+        matrix = ((1, 0, 0, 0, c, -s, 0, s, c), (c, 0, s, 0, 1, 0, -s, 0, c), (c, -s, 0, s, c, 0, 0, 0, 1))[axis]
+        points = [multiply(matrix, point, origin) for point in points]
+    return points
+
+
+def test_rotations_match_per_axis_passes(backend):
+    rng = random.Random(72)
+    points, surface = random_surface(rng)
+    area = surface.area
+
+    for _ in range(5):
+        angles = (rng.uniform(-180, 180), rng.uniform(-180, 180), rng.uniform(-180, 180))
+        origin = (rng.uniform(-3, 3), rng.uniform(-3, 3), rng.uniform(-3, 3))
+        surface.rotate_point(*angles, origin)
+        points = rotate_per_axis(points, *angles, origin)
+        assert points_close(surface.get_points(), points)
+
+        centroid = mean(points)
+        surface.rotate_centroid(*angles)
+        points = rotate_per_axis(points, *angles, centroid)
+        assert points_close(surface.get_points(), points)
+
+    assert isclose(surface.area, area)
+    surface.rotate_point(90, 0, 0, 'x')
+    assert points_close(surface.get_points(), points)
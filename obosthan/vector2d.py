@@ -12,72 +12,83 @@ class OVector2D:
     """
     A vector object which can be used for vector calculations as well as to find general vector properties.
     Instance variables such as length, unit, and angle contain length of the vector, unit vector, and
-    absolute angle of the vector between 0 and 360 degrees respectively.
+    absolute angle of the vector between 0 and 360 degrees respectively. They are calculated on first access
+    and recalculated only after the vector changes.
+    The components are kept as two plain numbers in slots without a per-instance dictionary, which keeps
+    an instance at 72 bytes (CPython, 64-bit) not counting the component values themselves.
     """
 
+    __slots__ = ('__x', '__y', '__length', '__unit', '__angle')
+
     def __init__(self, _x, _y):
-        self.__coord = [_x, _y]
-        self.__length = self.__cal_length()
-        self.__x_axis = self.__cal_x_axis()
-        self.__unit = self.__cal_unit()
-        self.__angle = self.__cal_angle()
+        self.__x = _x
+        self.__y = _y
+        self.__length = None
+        self.__unit = None
+        self.__angle = None
+
+    def __invalidate(self):
+        self.__length = None
+        self.__unit = None
+        self.__angle = None
 
     @property
     def angle(self):
+        if self.__angle is None:
+            self.__angle = self.__cal_angle()
         return self.__angle
 
     @property
     def unit(self):
+        if self.__unit is None:
+            self.__unit = self.__cal_unit()
         return self.__unit
 
     @property
     def length(self):
+        if self.__length is None:
+            self.__length = self.__cal_length()
         return self.__length
 
-    def __cal_x_axis(self):
-        return [self.__length, 0]
-
     def __cal_length(self):
-        return ((self.__coord[0]**2) + (self.__coord[1]**2))**0.5
+        return ((self.__x**2) + (self.__y**2))**0.5
 
     def __cal_unit(self):
-        if self.__length == 0:
+        length = self.length
+        if length == 0:
             return [0, 0]
         else:
-            return [self.__coord[0] / self.__length, self.__coord[1] / self.__length]
+            return [self.__x / length, self.__y / length]
 
     def __cal_angle(self):
-        if (self.__coord[1] == 0 and self.__coord[0] == 0.0):
+        if (self.__y == 0 and self.__x == 0.0):
             return 0.0
-        elif (self.__coord[1] > 0 and self.__coord[0] == 0.0):
+        elif (self.__y > 0 and self.__x == 0.0):
             return 90.0
-        elif (self.__coord[1] < 0 and self.__coord[0] == 0.0):
+        elif (self.__y < 0 and self.__x == 0.0):
             return 270.0
-        elif (self.__coord[0] < 0):
-            return 180 + degrees(atan(self.__coord[1] / self.__coord[0]))
-        elif (self.__coord[0] > 0 and self.__coord[1] < 0):
-            return 360 + degrees(atan(self.__coord[1]/self.__coord[0]))
+        elif (self.__x < 0):
+            return 180 + degrees(atan(self.__y / self.__x))
+        elif (self.__x > 0 and self.__y < 0):
+            return 360 + degrees(atan(self.__y/self.__x))
         else:
-            return degrees(atan(self.__coord[1] / self.__coord[0]))
+            return degrees(atan(self.__y / self.__x))
 
     def copy(self):
         """
         Returns a copy of the vector object
         """
 
-        return OVector2D(self.__coord[0], self.__coord[1])
+        return OVector2D(self.__x, self.__y)
 
     def define_line(self, x1, y1, x2, y2):
         """
         Alters the vector to follow a line as defined by two end points (x1, y1) and (x2, y22)
         """
 
-        self.__coord[0] = x2 - x1
-        self.__coord[1] = y2 - y1
-        self.__length = self.__cal_length()
-        self.__x_axis = self.__cal_x_axis()
-        self.__unit = self.__cal_unit()
-        self.__angle = self.__cal_angle()
+        self.__x = x2 - x1
+        self.__y = y2 - y1
+        self.__invalidate()
 
     def define_line1(self, x1, y1, x2, y2):
         """
@@ -85,50 +96,46 @@ class OVector2D:
         """
 
         if x2 > x1:
-            self.__coord[0] = x2 - x1
+            self.__x = x2 - x1
         else:
-            self.__coord[0] = x1 - x2
+            self.__x = x1 - x2
 
         if y2 > y1:
-            self.__coord[1] = y2 - y1
+            self.__y = y2 - y1
         else:
-            self.__coord[1] = y1 - y2
+            self.__y = y1 - y2
 
-        self.__length = self.__cal_length()
-        self.__x_axis = self.__cal_x_axis()
-        self.__unit = self.__cal_unit()
-        self.__angle = self.__cal_angle()
+        self.__invalidate()
 
     def define_polar(self, length, angle):
         """
         Alters the vector to a specified length and angle (degrees)
         """
 
-        self.__coord[0] = length * cos(radians(angle))
-        self.__coord[1] = length * sin(radians(angle))
-        self.__length = self.__cal_length()
-        self.__x_axis = self.__cal_x_axis()
-        self.__unit = self.__cal_unit()
-        self.__angle = self.__cal_angle()
+        self.__x = length * cos(radians(angle))
+        self.__y = length * sin(radians(angle))
+        self.__invalidate()
 
     def project(self, other):
         """
         Projects another vector and return projected vector
         """
 
-        if self.__length != 0:
-            vector_length = self.dot(other)/self.__length
-        return OVector2D(self.__unit[0]*vector_length, self.__unit[1]*vector_length)
+        length = self.length
+        if length != 0:
+            vector_length = self.dot(other)/length
+        unit = self.unit
+        return OVector2D(unit[0]*vector_length, unit[1]*vector_length)
 
     def dot(self, other):
-        return (self.__coord[0]*other[0]) + (self.__coord[1]*other[1])
+        return (self.__x*other[0]) + (self.__y*other[1])
 
     def angle_to(self, other):
         """
         Finds angle to another vector in degrees
         """
 
-        denominator = self.__length*other.length
+        denominator = self.length*other.length
         if denominator != 0.0:
             try:
                 ratio = self.dot(other)/denominator
@@ -143,31 +150,33 @@ class OVector2D:
         Rotates the vector to a specified angle in degrees (anticlockwise)
         """
 
-        self.__coord[0] = (cos(radians(angle)) * self.__x_axis[0]) - (sin(radians(angle)) * self.__x_axis[1])
-        self.__coord[1] = (sin(radians(angle)) * self.__x_axis[0]) + (cos(radians(angle)) * self.__x_axis[1])
-        self.__unit = self.__cal_unit()
-        self.__angle = self.__cal_angle()
+        length = self.length
+        self.__x = cos(radians(angle)) * length
+        self.__y = sin(radians(angle)) * length
+        self.__unit = None
+        self.__angle = None
 
     def rotate_to(self, angle):
         """
         Rotates the vector by specified angle in degrees (anticlockwise)
         """
 
-        xcoord = self.__coord[0]
-        ycoord = self.__coord[1]
-        self.__coord[0] = (cos(radians(angle)) * xcoord) - (sin(radians(angle)) * ycoord)
-        self.__coord[1] = (sin(radians(angle)) * xcoord) + (cos(radians(angle)) * ycoord)
-        self.__unit = self.__cal_unit()
-        self.__angle = self.__cal_angle()
+        xcoord = self.__x
+        ycoord = self.__y
+        self.__x = (cos(radians(angle)) * xcoord) - (sin(radians(angle)) * ycoord)
+        self.__y = (sin(radians(angle)) * xcoord) + (cos(radians(angle)) * ycoord)
+        self.__unit = None
+        self.__angle = None
 
     def negate(self):
         """
         Negates the vector
         """
 
-        self.__coord[0] = -self.__coord[0]
-        self.__coord[1] = -self.__coord[1]
-        self.__unit = self.__cal_unit()
+        self.__x = -self.__x
+        self.__y = -self.__y
+        self.__unit = None
+        self.__angle = None
 
     def scale(self, magnitude):
         """
@@ -175,82 +184,88 @@ class OVector2D:
         """
 
         if type(magnitude) is float or type(magnitude) is int:
-            self.__coord[0] = self.__coord[0] * magnitude
-            self.__coord[1] = self.__coord[1] * magnitude
-            self.__length = ((self.__coord[0]**2) + (self.__coord[1]**2))**0.5
-            self.__x_axis = [self.__length, 0]
+            self.__x = self.__x * magnitude
+            self.__y = self.__y * magnitude
+            self.__invalidate()
 
     def ortho_left(self):
         """
         Returns a perpendicular vector
         """
 
-        return OVector2D(self.__coord[1], -self.__coord[0])
+        return OVector2D(self.__y, -self.__x)
 
     def ortho_right(self):
         """
         Returns a perpendicular vector
         """
 
-        return OVector2D(-self.__coord[1], self.__coord[0])
+        return OVector2D(-self.__y, self.__x)
 
     def __iter__(self):
-        return iter(self.__coord)
+        return iter((self.__x, self.__y))
 
     def __setitem__(self, i, val):
         if type(val) is float or type(val) is int:
-            self.__coord[i] = val
+            if i == 0 or i == -2:
+                self.__x = val
+            elif i == 1 or i == -1:
+                self.__y = val
+            else:
+                raise IndexError("vector index out of range")
         elif type(val) is OVector2D or (type(val) is list and len(val) == 2):
-            self.__coord[0] = val[0]
-            self.__coord[1] = val[1]
+            self.__x = val[0]
+            self.__y = val[1]
         else:
             return self
 
-        self.__length = ((self.__coord[0]**2)+(self.__coord[1]**2))**0.5
-        self.__x_axis = [self.__length, 0]
-        self.__unit = self.__cal_unit()
-        self.__angle = self.__cal_angle()
+        self.__invalidate()
 
     def __getitem__(self, i):
-        return self.__coord[i]
+        if i == 0:
+            return self.__x
+        elif i == 1:
+            return self.__y
+        else:
+            return (self.__x, self.__y)[i]
 
     def __len__(self):
-        return len(self.__coord)
+        return 2
 
     def __repr__(self):
-        return str(self.__coord)
+        return str([self.__x, self.__y])
 
     def __add__(self, other):
         if type(other) is float or type(other) is int:
-            return OVector2D(self.__coord[0] + other, self.__coord[1] + other)
+            return OVector2D(self.__x + other, self.__y + other)
         elif type(other) is OVector2D or (type(other) is list and len(other) == 2):
-            return OVector2D(self.__coord[0]+other[0], self.__coord[1]+other[1])
+            return OVector2D(self.__x+other[0], self.__y+other[1])
         else:
             return self
 
     def __sub__(self, other):
         if type(other) is float or type(other) is int:
-            return OVector2D(self.__coord[0] - other, self.__coord[1] - other)
+            return OVector2D(self.__x - other, self.__y - other)
         elif type(other) is OVector2D or (type(other) is list and len(other) == 2):
-            return OVector2D(self.__coord[0]-other[0], self.__coord[1]-other[1])
+            return OVector2D(self.__x-other[0], self.__y-other[1])
         else:
             return self
 
     def __neg__(self):
-        return OVector2D(-self.__coord[0], -self.__coord[1])
+        return OVector2D(-self.__x, -self.__y)
 
     def __mul__(self, other):
         if type(other) is float or type(other) is int:
-            return OVector2D(self.__coord[0]*other, self.__coord[1]*other)
+            return OVector2D(self.__x*other, self.__y*other)
         elif type(other) is OVector2D or (type(other) is list and len(other) == 2):
-            return (self.__coord[0]*other[1]) - (self.__coord[1]*other[0])
+            return (self.__x*other[1]) - (self.__y*other[0])
         else:
             return self
 
     def __truediv__(self, fac):
         if type(fac) is float or type(fac) is int:
             if fac != 0:
-                return OVector2D(self.__coord[0]/fac, self.__coord[1]/fac)
+                return OVector2D(self.__x/fac, self.__y/fac)
             else:
                 return self
         else:
@@ -6,7 +6,7 @@
 3D vector object
 """
 
-from math import sin, cos, radians, acos, degrees, atan
+from math import sin, cos, radians, acos, degrees, atan2
 
 class OVector3D:
     """
@@ -17,81 +17,47 @@ class OVector3D:
 
     def __init__(self, _x, _y, _z):
         self.__coord = [_x, _y, _z]
-        self.__length = self.__cal_length()
-        self.__x_axis = self.__cal_x_axis()
-        self.__unit = self.__cal_unit()
-        self.__angle = self.__cal_angle()
+        self.__length = None
+        self.__unit = None
+        self.__angle = None
 
     @property
     def angle(self):
+        if self.__angle is None:
+            self.__angle = self.__cal_angle()
         return self.__angle
 
     @property
     def unit(self):
+        if self.__unit is None:
+            self.__unit = self.__cal_unit()
         return self.__unit
 
     @property
     def length(self):
+        if self.__length is None:
+            self.__length = self.__cal_length()
         return self.__length
 
-    def __cal_x_axis(self):
-        return [self.__length, 0]
+    def __invalidate(self):
+        self.__length = None
+        self.__unit = None
+        self.__angle = None
 
     def __cal_length(self):
         return ((self.__coord[0]**2)+(self.__coord[1]**2)+(self.__coord[2]**2))**2
 
     def __cal_unit(self):
-        if self.__length == 0:
+        length = self.length
+        if length == 0:
             return [0, 0]
         else:
-            return [self.__coord[0] / self.__length, self.__coord[1] / self.__length, self.__coord[2] / self.__length]
+            return [self.__coord[0] / length, self.__coord[1] / length, self.__coord[2] / length]
 
     def __cal_angle(self):
-
-        xy_plane = 0.0
-        yz_plane = 0.0
-        xz_plane = 0.0
-
-        if (self.__coord[1] == 0 and self.__coord[0] == 0.0):
-            xy_plane = 0.0
-        elif (self.__coord[1] > 0 and self.__coord[0] == 0.0):
-            xy_plane = 90.0
-        elif (self.__coord[1] < 0 and self.__coord[0] == 0.0):
-            xy_plane = 270.0
-        elif (self.__coord[0] < 0):
-            xy_plane = 180 + degrees(atan(self.__coord[1] / self.__coord[0]))
-        elif (self.__coord[0] > 0 and self.__coord[1] < 0):
-            xy_plane = 360 + degrees(atan(self.__coord[1]/self.__coord[0]))
-        else:
-            xy_plane = degrees(atan(self.__coord[1] / self.__coord[0]))
-
-        if (self.__coord[2] == 0 and self.__coord[1] == 0.0):
-            yz_plane = 0.0
-        elif (self.__coord[2] > 0 and self.__coord[1] == 0.0):
-            yz_plane = 90.0
-        elif (self.__coord[2] < 0 and self.__coord[1] == 0.0):
-            yz_plane = 270.0
-        elif (self.__coord[1] < 0):
-            yz_plane = 180 + degrees(atan(self.__coord[2] / self.__coord[1]))
-        elif (self.__coord[1] > 0 and self.__coord[2] < 0):
-            yz_plane = 360 + degrees(atan(self.__coord[2]/self.__coord[1]))
-        else:
-            yz_plane = degrees(atan(self.__coord[2] / self.__coord[1]))
-
-        if (self.__coord[2] == 0 and self.__coord[0] == 0.0):
-            xz_plane = 0.0
-        elif (self.__coord[2] > 0 and self.__coord[0] == 0.0):
-            xz_plane = 90.0
-        elif (self.__coord[2] < 0 and self.__coord[0] == 0.0):
-            xz_plane = 270.0
-        elif (self.__coord[0] < 0):
-            xz_plane = 180 + degrees(atan(self.__coord[2] / self.__coord[0]))
-        elif (self.__coord[0] > 0 and self.__coord[2] < 0):
-            xz_plane = 360 + degrees(atan(self.__coord[2]/self.__coord[0]))
-        else:
-            xz_plane = degrees(atan(self.__coord[2] / self.__coord[0]))
-
-        return [xy_plane, yz_plane, xz_plane]
+        # adding 0.0 turns -0.0 into 0.0 so atan2 agrees with the quadrant rules of the 2D objects on the axes
+        x, y, z = self.__coord[0] + 0.0, self.__coord[1] + 0.0, self.__coord[2] + 0.0
+        return [degrees(atan2(y, x)) % 360.0, degrees(atan2(z, y)) % 360.0, degrees(atan2(z, x)) % 360.0]
 
     def copy(self):
         """
@@ -107,11 +73,8 @@ class OVector3D:
 
         self.__coord[0] = x2 - x1
         self.__coord[1] = y2 - y1
-        self.__coord[3] = z2 - z1
-        self.__length = self.__cal_length()
-        self.__x_axis = self.__cal_x_axis()
-        self.__unit = self.__cal_unit()
-        self.__angle = self.__cal_angle()
+        self.__coord[2] = z2 - z1
+        self.__invalidate()
 
     def define_polar(self, length, angle1, angle2):
         """
@@ -121,10 +84,7 @@ class OVector3D:
         self.__coord[0] = length * cos(radians(angle2)) * sin(radians(angle1))
         self.__coord[1] = length * cos(radians(angle2)) * cos(radians(angle1))
         self.__coord[2] = length * sin(radians(angle2))
-        self.__length = self.__cal_length()
-        self.__x_axis = self.__cal_x_axis()
-        self.__unit = self.__cal_unit()
-        self.__angle = self.__cal_angle()
+        self.__invalidate()
 
     def dot(self, other):
         return (self.__coord[0]*other[0]) + (self.__coord[1]*other[1]) + (self.__coord[2]*other[2])
@@ -134,7 +94,7 @@ class OVector3D:
         Finds angle to another vector in degrees
         """
 
-        denominator = self.__length*other.length
+        denominator = self.length*other.length
         if denominator != 0.0:
             ratio = round(self.dot(other)/denominator, 12)
             return degrees(acos(ratio))
@@ -149,7 +109,7 @@ class OVector3D:
         self.__coord[0] = -self.__coord[0]
         self.__coord[1] = -self.__coord[1]
         self.__coord[2] = -self.__coord[2]
-        self.__unit = self.__cal_unit()
+        self.__invalidate()
 
     def scale(self, magnitude):
         """
@@ -160,8 +120,7 @@ class OVector3D:
             self.__coord[0] = self.__coord[0] * magnitude
             self.__coord[1] = self.__coord[1] * magnitude
             self.__coord[2] = self.__coord[2] * magnitude
-            self.__length = ((self.__coord[0]**2)+(self.__coord[1]**2)+(self.__coord[2]**2))**2
-            self.__x_axis = [self.__length, 0]
+            self.__invalidate()
 
     def __iter__(self):
         return iter(self.__coord)
@@ -176,10 +135,7 @@ class OVector3D:
         else:
             return self
 
-        self.__length = ((self.__coord[0]**2)+(self.__coord[1]**2)+(self.__coord[2]**2))**2
-        self.__x_axis = [self.__length, 0]
-        self.__unit = self.__cal_unit()
-        self.__angle = self.__cal_angle()
+        self.__invalidate()
 
     def __getitem__(self, i):
         return self.__coord[i]